@@ -0,0 +1,226 @@
+#!/bin/python3
+
+"""
+Requires python3 to be installed
+
+Run with ./benchmark.py (see ./benchmark.py --help for options).
+
+This times makemaze.py with fixed seeds, so that runs from
+different revisions can be compared. For every maze size and
+every generation algorithm it times building the geometry,
+generating the mazes, and writing them out in every layer
+format, as gzipped text, as binary, and (with numpy
+installed) as text rendered by the numpy backend. Each size
+and algorithm runs in a fresh process, so its peak RSS is
+its own. The results are printed (or saved) as JSON, and a
+saved run can be passed back in with --compare to see how
+the times changed.
+
+Generating reports chambers per second, and for the
+algorithms that walk at random, walk steps per second from
+the maze's stats. Writing reports blocks per second. Both
+can be compared across sizes.
+
+Mazes over --max-chambers are only run with Eller's algorithm
+streaming straight to text, since everything else has to
+hold a Geometry of the whole maze.
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+
+import makemaze
+
+# [layers, rows, columns] of chambers, from the stock size up.
+SIZES = [
+    [4, 7, 7],
+    [10, 20, 20],
+    [20, 50, 50],
+    [50, 200, 200],
+]
+SEEDS = [1, 2, 3]
+# 'text' is the grid format, and 'numpy' the grid format
+# rendered with the numpy backend.
+OUTPUTS = ['text', 'runs', 'rectangles', 'deltas', 'text-gz', 'binary', 'numpy']
+STREAM_ALGORITHM = 'eller-stream'
+
+def get_num_blocks(dimensions):
+    [layers, rows, columns] = dimensions
+    return ((layers + 1) * 3 + 1) * (rows + 1) * 3 * (columns + 1) * 3
+
+def get_timing(seconds, **counts):
+    # The time, plus each count and how many of it there were
+    # per second.
+    timing = {'seconds': seconds}
+    for name, count in counts.items():
+        timing[name] = count
+        timing[name + '_per_second'] = count / seconds if seconds and count else None
+    return timing
+
+def write_output(result, output, path):
+    if output == 'binary':
+        with open(path, 'wb') as file:
+            makemaze.write_binary(result, file)
+    elif output == 'numpy':
+        with open(path, 'w') as file:
+            volume = makemaze.render_volume(result)
+            makemaze.write_results(volume, file, makemaze.count_maze_blocks(result), seed=result.seed, algorithm=result.algorithm)
+    elif output in makemaze.LAYER_FORMATS:
+        with open(path, 'w') as file:
+            makemaze.write_maze(result, file, output)
+    else:
+        with makemaze.open_output(path, output == 'text-gz') as file:
+            makemaze.write_maze(result, file)
+
+def get_outputs():
+    if importlib.util.find_spec('numpy') is None:
+        return [output for output in OUTPUTS if output != 'numpy']
+    return OUTPUTS
+
+def run_case(case):
+    # Runs in a process of its own. Returns the report of one
+    # size and algorithm.
+    [dimensions, algorithm, seeds] = case
+    num_chambers = dimensions[0] * dimensions[1] * dimensions[2]
+    num_blocks = get_num_blocks(dimensions)
+    report = {
+        'dimensions': dimensions,
+        'algorithm': algorithm,
+        'chambers': num_chambers,
+        'seeds': seeds,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'maze')
+        if algorithm == STREAM_ALGORITHM:
+            # Generating and writing are one and the same here.
+            start = time.perf_counter()
+            for seed in seeds:
+                with open(path, 'w') as file:
+                    makemaze.write_eller_maze(file, seed, dimensions)
+            report['text'] = get_timing(time.perf_counter() - start, blocks=num_blocks * len(seeds))
+            report['text']['bytes'] = os.path.getsize(path)
+        else:
+            start = time.perf_counter()
+            makemaze.get_geometry(dimensions)
+            report['geometry'] = {'seconds': time.perf_counter() - start}
+
+            maze = makemaze.Maze(dimensions, stats=True)
+            results = []
+            start = time.perf_counter()
+            for seed in seeds:
+                results.append(maze.generate(seed, algorithm))
+            report['generate'] = get_timing(
+                time.perf_counter() - start,
+                chambers=num_chambers * len(seeds),
+                walk_steps=sum(result.stats['walk_steps'] for result in results),
+            )
+
+            # Without stats, so writing doesn't count block writes.
+            results = [result._replace(stats=None) for result in results]
+            outputs = get_outputs()
+            if 'numpy' in outputs:
+                # So the time of importing it isn't counted.
+                makemaze.import_numpy()
+            for output in outputs:
+                start = time.perf_counter()
+                for result in results:
+                    write_output(result, output, path)
+                report[output] = get_timing(time.perf_counter() - start, blocks=num_blocks * len(seeds))
+                report[output]['bytes'] = os.path.getsize(path)
+    # ru_maxrss is in kilobytes on Linux, but bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if platform.system() == 'Darwin':
+        peak_rss //= 1024
+    report['peak_rss_kb'] = peak_rss
+    return report
+
+def get_cases(sizes, algorithms, seeds, max_chambers):
+    cases = []
+    for dimensions in sizes:
+        num_chambers = dimensions[0] * dimensions[1] * dimensions[2]
+        for algorithm in algorithms:
+            if algorithm != STREAM_ALGORITHM and num_chambers > max_chambers:
+                continue
+            # The biggest sizes only get one seed each.
+            case_seeds = seeds if num_chambers <= max_chambers else seeds[:1]
+            cases.append([dimensions, algorithm, case_seeds])
+    return cases
+
+def get_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(cases):
+    reports = []
+    for case in cases:
+        # A new process for every case, so peak RSS isn't carried over.
+        with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+            reports.append(pool.apply(run_case, [case]))
+    return {
+        'revision': get_revision(),
+        'python': platform.python_version(),
+        'numpy': importlib.util.find_spec('numpy') is not None,
+        'cases': reports,
+    }
+
+def compare_benchmarks(old, new):
+    # Lines of how much each time changed, as new / old.
+    old_cases = {(tuple(case['dimensions']), case['algorithm']): case for case in old['cases']}
+    lines = []
+    for case in new['cases']:
+        old_case = old_cases.get((tuple(case['dimensions']), case['algorithm']))
+        if old_case is None:
+            continue
+        ratios = []
+        for name in ['geometry', 'generate'] + OUTPUTS:
+            if name in case and name in old_case and old_case[name]['seconds']:
+                ratios.append('{} {:.2f}x'.format(name, case[name]['seconds'] / old_case[name]['seconds']))
+        lines.append('{} {}: {}'.format('x'.join(map(str, case['dimensions'])), case['algorithm'], ', '.join(ratios)))
+    return lines
+
+def parse_size(text):
+    return [int(n) for n in text.split('x')]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Time makemaze.py across maze sizes, algorithms and outputs.')
+    parser.add_argument('--sizes', type=parse_size, nargs='+', default=SIZES, metavar='LxRxC',
+                        help='maze sizes in chambers, as layers x rows x columns')
+    parser.add_argument('--algorithms', nargs='+', default=list(makemaze.ALGORITHMS) + [STREAM_ALGORITHM],
+                        choices=list(makemaze.ALGORITHMS) + [STREAM_ALGORITHM])
+    parser.add_argument('--seeds', type=int, nargs='+', default=SEEDS)
+    parser.add_argument('--max-chambers', type=int, default=100000,
+                        help='only stream mazes bigger than this (default: %(default)s)')
+    parser.add_argument('--output', help='save the results as JSON here instead of printing them')
+    parser.add_argument('--compare', metavar='PATH', help='a saved run to compare the times against')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run_benchmarks(get_cases(args.sizes, args.algorithms, args.seeds, args.max_chambers))
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        with open(args.compare) as file:
+            old = json.load(file)
+        for line in compare_benchmarks(old, results):
+            print(line)
+
+if __name__ == '__main__':
+    main()
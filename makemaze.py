@@ -3,7 +3,8 @@
 """
 Requires python3 to be installed
 
-Run with ./makemaze.py
+Run with ./makemaze.py (see ./makemaze.py --help for options),
+or import it and call generate().
 
 This tool creates a 3d maze and provides instructions
 to build it in Dragon Quest Builders. The maze is enclosed
@@ -143,1082 +144,178 @@ O B B B B B B B B B B B B B B B B B B B B B B O
 O O O O O O O O O O O O O O O O O O O O O O O O
 ```
 and so on.
+
+Other ways of carving the maze can be picked with --algorithm.
+With eller (and the list backend, a random finish and no --stats)
+the maze is written out as it is made, a floor at a time, so even
+a very tall maze needs only about one floor of memory. The counts
+at the top of the output need the whole maze, though, so it is
+carved twice from the same seed: once to count the blocks and
+once to write them. Carving takes twice as long for it, but the
+layers are still only rendered once.
 """
 
+import argparse
+import ast
+import gzip
+import hashlib
+import json
+import mmap
+import os
 import random
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import namedtuple
+from enum import IntEnum
+
 
-# Referencing a block looks like this:
-# blocks[height][row][column]
+# Referencing a node (aka chamber) by its coordinates
+# looks like this:
+# [height, row, column]
 # where row starts at 0 and goes from west to
 # east, column starts at 0 and goes from north
 # to south, and height starts at 0 and goes
 # from bottom to top.
-num_block_rows = 24
-num_block_columns = 24
-num_block_layers = 16
-blocks = [
-    # Layer 0
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 1, Floor 0
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 2, Floor 0
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 3, Floor 0
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 4, Floor 1
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 5, Floor 1
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 6, Floor 1
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 7, Floor 2
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 8, Floor 2
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 9, Floor 2
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 10, Floor 3
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 11, Floor 3
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O', 'O', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 12, Floor 3
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O', 'L', 'B', 'O'],
-        ['O', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O', 'S', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 13, Roof
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 14, Roof
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-
-    # Layer 15, Roof
-    [
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-        ['O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
-    ],
-]
-
-# We will use a dictionary with unique string ids to
-# represent the edges. An id of '012022' means the edge
-# connects nodes [0, 1, 2] and [0, 2, 2].
-# Each edge will be a dictionary with attributes for
-# the node and the other node connecting to it, the
-# blocks they would affect, whether blocks are replaced
-# with ladders, and whether the edge is open or closed.
-# They all start as open=False.
-edges = {
-    # Floor 0 west-to-east edges
-    '000001': {'node': [0, 0, 0], 'other_node': [0, 0, 1], 'open': False, 'blocks': [[2, 3, 4], [3, 3, 4]], 'ladder': False},
-    '001002': {'node': [0, 0, 1], 'other_node': [0, 0, 2], 'open': False, 'blocks': [[2, 3, 7], [3, 3, 7]], 'ladder': False},
-    '002003': {'node': [0, 0, 2], 'other_node': [0, 0, 3], 'open': False, 'blocks': [[2, 3, 10], [3, 3, 10]], 'ladder': False},
-    '003004': {'node': [0, 0, 3], 'other_node': [0, 0, 4], 'open': False, 'blocks': [[2, 3, 13], [3, 3, 13]], 'ladder': False},
-    '004005': {'node': [0, 0, 4], 'other_node': [0, 0, 5], 'open': False, 'blocks': [[2, 3, 16], [3, 3, 16]], 'ladder': False},
-    '005006': {'node': [0, 0, 5], 'other_node': [0, 0, 6], 'open': False, 'blocks': [[2, 3, 19], [3, 3, 19]], 'ladder': False},
-    '010011': {'node': [0, 1, 0], 'other_node': [0, 1, 1], 'open': False, 'blocks': [[2, 6, 4], [3, 6, 4]], 'ladder': False},
-    '011012': {'node': [0, 1, 1], 'other_node': [0, 1, 2], 'open': False, 'blocks': [[2, 6, 7], [3, 6, 7]], 'ladder': False},
-    '012013': {'node': [0, 1, 2], 'other_node': [0, 1, 3], 'open': False, 'blocks': [[2, 6, 10], [3, 6, 10]], 'ladder': False},
-    '013014': {'node': [0, 1, 3], 'other_node': [0, 1, 4], 'open': False, 'blocks': [[2, 6, 13], [3, 6, 13]], 'ladder': False},
-    '014015': {'node': [0, 1, 4], 'other_node': [0, 1, 5], 'open': False, 'blocks': [[2, 6, 16], [3, 6, 16]], 'ladder': False},
-    '015016': {'node': [0, 1, 5], 'other_node': [0, 1, 6], 'open': False, 'blocks': [[2, 6, 19], [3, 6, 19]], 'ladder': False},
-    '020021': {'node': [0, 2, 0], 'other_node': [0, 2, 1], 'open': False, 'blocks': [[2, 9, 4], [3, 9, 4]], 'ladder': False},
-    '021022': {'node': [0, 2, 1], 'other_node': [0, 2, 2], 'open': False, 'blocks': [[2, 9, 7], [3, 9, 7]], 'ladder': False},
-    '022023': {'node': [0, 2, 2], 'other_node': [0, 2, 3], 'open': False, 'blocks': [[2, 9, 10], [3, 9, 10]], 'ladder': False},
-    '023024': {'node': [0, 2, 3], 'other_node': [0, 2, 4], 'open': False, 'blocks': [[2, 9, 13], [3, 9, 13]], 'ladder': False},
-    '024025': {'node': [0, 2, 4], 'other_node': [0, 2, 5], 'open': False, 'blocks': [[2, 9, 16], [3, 9, 16]], 'ladder': False},
-    '025026': {'node': [0, 2, 5], 'other_node': [0, 2, 6], 'open': False, 'blocks': [[2, 9, 19], [3, 9, 19]], 'ladder': False},
-    '030031': {'node': [0, 3, 0], 'other_node': [0, 3, 1], 'open': False, 'blocks': [[2, 12, 4], [3, 12, 4]], 'ladder': False},
-    '031032': {'node': [0, 3, 1], 'other_node': [0, 3, 2], 'open': False, 'blocks': [[2, 12, 7], [3, 12, 7]], 'ladder': False},
-    '032033': {'node': [0, 3, 2], 'other_node': [0, 3, 3], 'open': False, 'blocks': [[2, 12, 10], [3, 12, 10]], 'ladder': False},
-    '033034': {'node': [0, 3, 3], 'other_node': [0, 3, 4], 'open': False, 'blocks': [[2, 12, 13], [3, 12, 13]], 'ladder': False},
-    '034035': {'node': [0, 3, 4], 'other_node': [0, 3, 5], 'open': False, 'blocks': [[2, 12, 16], [3, 12, 16]], 'ladder': False},
-    '035036': {'node': [0, 3, 5], 'other_node': [0, 3, 6], 'open': False, 'blocks': [[2, 12, 19], [3, 12, 19]], 'ladder': False},
-    '040041': {'node': [0, 4, 0], 'other_node': [0, 4, 1], 'open': False, 'blocks': [[2, 15, 4], [3, 15, 4]], 'ladder': False},
-    '041042': {'node': [0, 4, 1], 'other_node': [0, 4, 2], 'open': False, 'blocks': [[2, 15, 7], [3, 15, 7]], 'ladder': False},
-    '042043': {'node': [0, 4, 2], 'other_node': [0, 4, 3], 'open': False, 'blocks': [[2, 15, 10], [3, 15, 10]], 'ladder': False},
-    '043044': {'node': [0, 4, 3], 'other_node': [0, 4, 4], 'open': False, 'blocks': [[2, 15, 13], [3, 15, 13]], 'ladder': False},
-    '044045': {'node': [0, 4, 4], 'other_node': [0, 4, 5], 'open': False, 'blocks': [[2, 15, 16], [3, 15, 16]], 'ladder': False},
-    '045046': {'node': [0, 4, 5], 'other_node': [0, 4, 6], 'open': False, 'blocks': [[2, 15, 19], [3, 15, 19]], 'ladder': False},
-    '050051': {'node': [0, 5, 0], 'other_node': [0, 5, 1], 'open': False, 'blocks': [[2, 18, 4], [3, 18, 4]], 'ladder': False},
-    '051052': {'node': [0, 5, 1], 'other_node': [0, 5, 2], 'open': False, 'blocks': [[2, 18, 7], [3, 18, 7]], 'ladder': False},
-    '052053': {'node': [0, 5, 2], 'other_node': [0, 5, 3], 'open': False, 'blocks': [[2, 18, 10], [3, 18, 10]], 'ladder': False},
-    '053054': {'node': [0, 5, 3], 'other_node': [0, 5, 4], 'open': False, 'blocks': [[2, 18, 13], [3, 18, 13]], 'ladder': False},
-    '054055': {'node': [0, 5, 4], 'other_node': [0, 5, 5], 'open': False, 'blocks': [[2, 18, 16], [3, 18, 16]], 'ladder': False},
-    '055056': {'node': [0, 5, 5], 'other_node': [0, 5, 6], 'open': False, 'blocks': [[2, 18, 19], [3, 18, 19]], 'ladder': False},
-    '060061': {'node': [0, 6, 0], 'other_node': [0, 6, 1], 'open': False, 'blocks': [[2, 21, 4], [3, 21, 4]], 'ladder': False},
-    '061062': {'node': [0, 6, 1], 'other_node': [0, 6, 2], 'open': False, 'blocks': [[2, 21, 7], [3, 21, 7]], 'ladder': False},
-    '062063': {'node': [0, 6, 2], 'other_node': [0, 6, 3], 'open': False, 'blocks': [[2, 21, 10], [3, 21, 10]], 'ladder': False},
-    '063064': {'node': [0, 6, 3], 'other_node': [0, 6, 4], 'open': False, 'blocks': [[2, 21, 13], [3, 21, 13]], 'ladder': False},
-    '064065': {'node': [0, 6, 4], 'other_node': [0, 6, 5], 'open': False, 'blocks': [[2, 21, 16], [3, 21, 16]], 'ladder': False},
-    '065066': {'node': [0, 6, 5], 'other_node': [0, 6, 6], 'open': False, 'blocks': [[2, 21, 19], [3, 21, 19]], 'ladder': False},
-
-    # Floor 0 north-to-south edges
-    '000010': {'node': [0, 0, 0], 'other_node': [0, 1, 0], 'open': False, 'blocks': [[2, 4, 2], [3, 4, 2]], 'ladder': False},
-    '010020': {'node': [0, 1, 0], 'other_node': [0, 2, 0], 'open': False, 'blocks': [[2, 7, 2], [3, 7, 2]], 'ladder': False},
-    '020030': {'node': [0, 2, 0], 'other_node': [0, 3, 0], 'open': False, 'blocks': [[2, 10, 2], [3, 10, 2]], 'ladder': False},
-    '030040': {'node': [0, 3, 0], 'other_node': [0, 4, 0], 'open': False, 'blocks': [[2, 13, 2], [3, 13, 2]], 'ladder': False},
-    '040050': {'node': [0, 4, 0], 'other_node': [0, 5, 0], 'open': False, 'blocks': [[2, 16, 2], [3, 16, 2]], 'ladder': False},
-    '050060': {'node': [0, 5, 0], 'other_node': [0, 6, 0], 'open': False, 'blocks': [[2, 19, 2], [3, 19, 2]], 'ladder': False},
-    '001011': {'node': [0, 0, 1], 'other_node': [0, 1, 1], 'open': False, 'blocks': [[2, 4, 5], [3, 4, 5]], 'ladder': False},
-    '011021': {'node': [0, 1, 1], 'other_node': [0, 2, 1], 'open': False, 'blocks': [[2, 7, 5], [3, 7, 5]], 'ladder': False},
-    '021031': {'node': [0, 2, 1], 'other_node': [0, 3, 1], 'open': False, 'blocks': [[2, 10, 5], [3, 10, 5]], 'ladder': False},
-    '031041': {'node': [0, 3, 1], 'other_node': [0, 4, 1], 'open': False, 'blocks': [[2, 13, 5], [3, 13, 5]], 'ladder': False},
-    '041051': {'node': [0, 4, 1], 'other_node': [0, 5, 1], 'open': False, 'blocks': [[2, 16, 5], [3, 16, 5]], 'ladder': False},
-    '051061': {'node': [0, 5, 1], 'other_node': [0, 6, 1], 'open': False, 'blocks': [[2, 19, 5], [3, 19, 5]], 'ladder': False},
-    '002012': {'node': [0, 0, 2], 'other_node': [0, 1, 2], 'open': False, 'blocks': [[2, 4, 8], [3, 4, 8]], 'ladder': False},
-    '012022': {'node': [0, 1, 2], 'other_node': [0, 2, 2], 'open': False, 'blocks': [[2, 7, 8], [3, 7, 8]], 'ladder': False},
-    '022032': {'node': [0, 2, 2], 'other_node': [0, 3, 2], 'open': False, 'blocks': [[2, 10, 8], [3, 10, 8]], 'ladder': False},
-    '032042': {'node': [0, 3, 2], 'other_node': [0, 4, 2], 'open': False, 'blocks': [[2, 13, 8], [3, 13, 8]], 'ladder': False},
-    '042052': {'node': [0, 4, 2], 'other_node': [0, 5, 2], 'open': False, 'blocks': [[2, 16, 8], [3, 16, 8]], 'ladder': False},
-    '052062': {'node': [0, 5, 2], 'other_node': [0, 6, 2], 'open': False, 'blocks': [[2, 19, 8], [3, 19, 8]], 'ladder': False},
-    '003013': {'node': [0, 0, 3], 'other_node': [0, 1, 3], 'open': False, 'blocks': [[2, 4, 11], [3, 4, 11]], 'ladder': False},
-    '013023': {'node': [0, 1, 3], 'other_node': [0, 2, 3], 'open': False, 'blocks': [[2, 7, 11], [3, 7, 11]], 'ladder': False},
-    '023033': {'node': [0, 2, 3], 'other_node': [0, 3, 3], 'open': False, 'blocks': [[2, 10, 11], [3, 10, 11]], 'ladder': False},
-    '033043': {'node': [0, 3, 3], 'other_node': [0, 4, 3], 'open': False, 'blocks': [[2, 13, 11], [3, 13, 11]], 'ladder': False},
-    '043053': {'node': [0, 4, 3], 'other_node': [0, 5, 3], 'open': False, 'blocks': [[2, 16, 11], [3, 16, 11]], 'ladder': False},
-    '053063': {'node': [0, 5, 3], 'other_node': [0, 6, 3], 'open': False, 'blocks': [[2, 19, 11], [3, 19, 11]], 'ladder': False},
-    '004014': {'node': [0, 0, 4], 'other_node': [0, 1, 4], 'open': False, 'blocks': [[2, 4, 14], [3, 4, 14]], 'ladder': False},
-    '014024': {'node': [0, 1, 4], 'other_node': [0, 2, 4], 'open': False, 'blocks': [[2, 7, 14], [3, 7, 14]], 'ladder': False},
-    '024034': {'node': [0, 2, 4], 'other_node': [0, 3, 4], 'open': False, 'blocks': [[2, 10, 14], [3, 10, 14]], 'ladder': False},
-    '034044': {'node': [0, 3, 4], 'other_node': [0, 4, 4], 'open': False, 'blocks': [[2, 13, 14], [3, 13, 14]], 'ladder': False},
-    '044054': {'node': [0, 4, 4], 'other_node': [0, 5, 4], 'open': False, 'blocks': [[2, 16, 14], [3, 16, 14]], 'ladder': False},
-    '054064': {'node': [0, 5, 4], 'other_node': [0, 6, 4], 'open': False, 'blocks': [[2, 19, 14], [3, 19, 14]], 'ladder': False},
-    '005015': {'node': [0, 0, 5], 'other_node': [0, 1, 5], 'open': False, 'blocks': [[2, 4, 17], [3, 4, 17]], 'ladder': False},
-    '015025': {'node': [0, 1, 5], 'other_node': [0, 2, 5], 'open': False, 'blocks': [[2, 7, 17], [3, 7, 17]], 'ladder': False},
-    '025035': {'node': [0, 2, 5], 'other_node': [0, 3, 5], 'open': False, 'blocks': [[2, 10, 17], [3, 10, 17]], 'ladder': False},
-    '035045': {'node': [0, 3, 5], 'other_node': [0, 4, 5], 'open': False, 'blocks': [[2, 13, 17], [3, 13, 17]], 'ladder': False},
-    '045055': {'node': [0, 4, 5], 'other_node': [0, 5, 5], 'open': False, 'blocks': [[2, 16, 17], [3, 16, 17]], 'ladder': False},
-    '055065': {'node': [0, 5, 5], 'other_node': [0, 6, 5], 'open': False, 'blocks': [[2, 19, 17], [3, 19, 17]], 'ladder': False},
-    '006016': {'node': [0, 0, 6], 'other_node': [0, 1, 6], 'open': False, 'blocks': [[2, 4, 20], [3, 4, 20]], 'ladder': False},
-    '016026': {'node': [0, 1, 6], 'other_node': [0, 2, 6], 'open': False, 'blocks': [[2, 7, 20], [3, 7, 20]], 'ladder': False},
-    '026036': {'node': [0, 2, 6], 'other_node': [0, 3, 6], 'open': False, 'blocks': [[2, 10, 20], [3, 10, 20]], 'ladder': False},
-    '036046': {'node': [0, 3, 6], 'other_node': [0, 4, 6], 'open': False, 'blocks': [[2, 13, 20], [3, 13, 20]], 'ladder': False},
-    '046056': {'node': [0, 4, 6], 'other_node': [0, 5, 6], 'open': False, 'blocks': [[2, 16, 20], [3, 16, 20]], 'ladder': False},
-    '056066': {'node': [0, 5, 6], 'other_node': [0, 6, 6], 'open': False, 'blocks': [[2, 19, 20], [3, 19, 20]], 'ladder': False},
-
-    # Floor 1 bottom-to-top edges
-    '000100': {'node': [0, 0, 0], 'other_node': [1, 0, 0], 'open': False, 'blocks': [[4, 2, 3]], 'ladder': True},
-    '001101': {'node': [0, 0, 1], 'other_node': [1, 0, 1], 'open': False, 'blocks': [[4, 2, 6]], 'ladder': True},
-    '002102': {'node': [0, 0, 2], 'other_node': [1, 0, 2], 'open': False, 'blocks': [[4, 2, 9]], 'ladder': True},
-    '003103': {'node': [0, 0, 3], 'other_node': [1, 0, 3], 'open': False, 'blocks': [[4, 2, 12]], 'ladder': True},
-    '004104': {'node': [0, 0, 4], 'other_node': [1, 0, 4], 'open': False, 'blocks': [[4, 2, 15]], 'ladder': True},
-    '005105': {'node': [0, 0, 5], 'other_node': [1, 0, 5], 'open': False, 'blocks': [[4, 2, 18]], 'ladder': True},
-    '006106': {'node': [0, 0, 6], 'other_node': [1, 0, 6], 'open': False, 'blocks': [[4, 2, 21]], 'ladder': True},
-    '010110': {'node': [0, 1, 0], 'other_node': [1, 1, 0], 'open': False, 'blocks': [[4, 5, 3]], 'ladder': True},
-    '011111': {'node': [0, 1, 1], 'other_node': [1, 1, 1], 'open': False, 'blocks': [[4, 5, 6]], 'ladder': True},
-    '012112': {'node': [0, 1, 2], 'other_node': [1, 1, 2], 'open': False, 'blocks': [[4, 5, 9]], 'ladder': True},
-    '013113': {'node': [0, 1, 3], 'other_node': [1, 1, 3], 'open': False, 'blocks': [[4, 5, 12]], 'ladder': True},
-    '014114': {'node': [0, 1, 4], 'other_node': [1, 1, 4], 'open': False, 'blocks': [[4, 5, 15]], 'ladder': True},
-    '015115': {'node': [0, 1, 5], 'other_node': [1, 1, 5], 'open': False, 'blocks': [[4, 5, 18]], 'ladder': True},
-    '016116': {'node': [0, 1, 6], 'other_node': [1, 1, 6], 'open': False, 'blocks': [[4, 5, 21]], 'ladder': True},
-    '020120': {'node': [0, 2, 0], 'other_node': [1, 2, 0], 'open': False, 'blocks': [[4, 8, 3]], 'ladder': True},
-    '021121': {'node': [0, 2, 1], 'other_node': [1, 2, 1], 'open': False, 'blocks': [[4, 8, 6]], 'ladder': True},
-    '022122': {'node': [0, 2, 2], 'other_node': [1, 2, 2], 'open': False, 'blocks': [[4, 8, 9]], 'ladder': True},
-    '023123': {'node': [0, 2, 3], 'other_node': [1, 2, 3], 'open': False, 'blocks': [[4, 8, 12]], 'ladder': True},
-    '024124': {'node': [0, 2, 4], 'other_node': [1, 2, 4], 'open': False, 'blocks': [[4, 8, 15]], 'ladder': True},
-    '025125': {'node': [0, 2, 5], 'other_node': [1, 2, 5], 'open': False, 'blocks': [[4, 8, 18]], 'ladder': True},
-    '026126': {'node': [0, 2, 6], 'other_node': [1, 2, 6], 'open': False, 'blocks': [[4, 8, 21]], 'ladder': True},
-    '030130': {'node': [0, 3, 0], 'other_node': [1, 3, 0], 'open': False, 'blocks': [[4, 11, 3]], 'ladder': True},
-    '031131': {'node': [0, 3, 1], 'other_node': [1, 3, 1], 'open': False, 'blocks': [[4, 11, 6]], 'ladder': True},
-    '032132': {'node': [0, 3, 2], 'other_node': [1, 3, 2], 'open': False, 'blocks': [[4, 11, 9]], 'ladder': True},
-    '033133': {'node': [0, 3, 3], 'other_node': [1, 3, 3], 'open': False, 'blocks': [[4, 11, 12]], 'ladder': True},
-    '034134': {'node': [0, 3, 4], 'other_node': [1, 3, 4], 'open': False, 'blocks': [[4, 11, 15]], 'ladder': True},
-    '035135': {'node': [0, 3, 5], 'other_node': [1, 3, 5], 'open': False, 'blocks': [[4, 11, 18]], 'ladder': True},
-    '036136': {'node': [0, 3, 6], 'other_node': [1, 3, 6], 'open': False, 'blocks': [[4, 11, 21]], 'ladder': True},
-    '040140': {'node': [0, 4, 0], 'other_node': [1, 4, 0], 'open': False, 'blocks': [[4, 14, 3]], 'ladder': True},
-    '041141': {'node': [0, 4, 1], 'other_node': [1, 4, 1], 'open': False, 'blocks': [[4, 14, 6]], 'ladder': True},
-    '042142': {'node': [0, 4, 2], 'other_node': [1, 4, 2], 'open': False, 'blocks': [[4, 14, 9]], 'ladder': True},
-    '043143': {'node': [0, 4, 3], 'other_node': [1, 4, 3], 'open': False, 'blocks': [[4, 14, 12]], 'ladder': True},
-    '044144': {'node': [0, 4, 4], 'other_node': [1, 4, 4], 'open': False, 'blocks': [[4, 14, 15]], 'ladder': True},
-    '045145': {'node': [0, 4, 5], 'other_node': [1, 4, 5], 'open': False, 'blocks': [[4, 14, 18]], 'ladder': True},
-    '046146': {'node': [0, 4, 6], 'other_node': [1, 4, 6], 'open': False, 'blocks': [[4, 14, 21]], 'ladder': True},
-    '050150': {'node': [0, 5, 0], 'other_node': [1, 5, 0], 'open': False, 'blocks': [[4, 17, 3]], 'ladder': True},
-    '051151': {'node': [0, 5, 1], 'other_node': [1, 5, 1], 'open': False, 'blocks': [[4, 17, 6]], 'ladder': True},
-    '052152': {'node': [0, 5, 2], 'other_node': [1, 5, 2], 'open': False, 'blocks': [[4, 17, 9]], 'ladder': True},
-    '053153': {'node': [0, 5, 3], 'other_node': [1, 5, 3], 'open': False, 'blocks': [[4, 17, 12]], 'ladder': True},
-    '054154': {'node': [0, 5, 4], 'other_node': [1, 5, 4], 'open': False, 'blocks': [[4, 17, 15]], 'ladder': True},
-    '055155': {'node': [0, 5, 5], 'other_node': [1, 5, 5], 'open': False, 'blocks': [[4, 17, 18]], 'ladder': True},
-    '056156': {'node': [0, 5, 6], 'other_node': [1, 5, 6], 'open': False, 'blocks': [[4, 17, 21]], 'ladder': True},
-    '060160': {'node': [0, 6, 0], 'other_node': [1, 6, 0], 'open': False, 'blocks': [[4, 20, 3]], 'ladder': True},
-    '061161': {'node': [0, 6, 1], 'other_node': [1, 6, 1], 'open': False, 'blocks': [[4, 20, 6]], 'ladder': True},
-    '062162': {'node': [0, 6, 2], 'other_node': [1, 6, 2], 'open': False, 'blocks': [[4, 20, 9]], 'ladder': True},
-    '063163': {'node': [0, 6, 3], 'other_node': [1, 6, 3], 'open': False, 'blocks': [[4, 20, 12]], 'ladder': True},
-    '064164': {'node': [0, 6, 4], 'other_node': [1, 6, 4], 'open': False, 'blocks': [[4, 20, 15]], 'ladder': True},
-    '065165': {'node': [0, 6, 5], 'other_node': [1, 6, 5], 'open': False, 'blocks': [[4, 20, 18]], 'ladder': True},
-    '066166': {'node': [0, 6, 6], 'other_node': [1, 6, 6], 'open': False, 'blocks': [[4, 20, 21]], 'ladder': True},
-    
-    # Floor 1 west-to-east edges
-    '100101': {'node': [1, 0, 0], 'other_node': [1, 0, 1], 'open': False, 'blocks': [[5, 3, 4], [6, 3, 4]], 'ladder': False},
-    '101102': {'node': [1, 0, 1], 'other_node': [1, 0, 2], 'open': False, 'blocks': [[5, 3, 7], [6, 3, 7]], 'ladder': False},
-    '102103': {'node': [1, 0, 2], 'other_node': [1, 0, 3], 'open': False, 'blocks': [[5, 3, 10], [6, 3, 10]], 'ladder': False},
-    '103104': {'node': [1, 0, 3], 'other_node': [1, 0, 4], 'open': False, 'blocks': [[5, 3, 13], [6, 3, 13]], 'ladder': False},
-    '104105': {'node': [1, 0, 4], 'other_node': [1, 0, 5], 'open': False, 'blocks': [[5, 3, 16], [6, 3, 16]], 'ladder': False},
-    '105106': {'node': [1, 0, 5], 'other_node': [1, 0, 6], 'open': False, 'blocks': [[5, 3, 19], [6, 3, 19]], 'ladder': False},
-    '110111': {'node': [1, 1, 0], 'other_node': [1, 1, 1], 'open': False, 'blocks': [[5, 6, 4], [6, 6, 4]], 'ladder': False},
-    '111112': {'node': [1, 1, 1], 'other_node': [1, 1, 2], 'open': False, 'blocks': [[5, 6, 7], [6, 6, 7]], 'ladder': False},
-    '112113': {'node': [1, 1, 2], 'other_node': [1, 1, 3], 'open': False, 'blocks': [[5, 6, 10], [6, 6, 10]], 'ladder': False},
-    '113114': {'node': [1, 1, 3], 'other_node': [1, 1, 4], 'open': False, 'blocks': [[5, 6, 13], [6, 6, 13]], 'ladder': False},
-    '114115': {'node': [1, 1, 4], 'other_node': [1, 1, 5], 'open': False, 'blocks': [[5, 6, 16], [6, 6, 16]], 'ladder': False},
-    '115116': {'node': [1, 1, 5], 'other_node': [1, 1, 6], 'open': False, 'blocks': [[5, 6, 19], [6, 6, 19]], 'ladder': False},
-    '120121': {'node': [1, 2, 0], 'other_node': [1, 2, 1], 'open': False, 'blocks': [[5, 9, 4], [6, 9, 4]], 'ladder': False},
-    '121122': {'node': [1, 2, 1], 'other_node': [1, 2, 2], 'open': False, 'blocks': [[5, 9, 7], [6, 9, 7]], 'ladder': False},
-    '122123': {'node': [1, 2, 2], 'other_node': [1, 2, 3], 'open': False, 'blocks': [[5, 9, 10], [6, 9, 10]], 'ladder': False},
-    '123124': {'node': [1, 2, 3], 'other_node': [1, 2, 4], 'open': False, 'blocks': [[5, 9, 13], [6, 9, 13]], 'ladder': False},
-    '124125': {'node': [1, 2, 4], 'other_node': [1, 2, 5], 'open': False, 'blocks': [[5, 9, 16], [6, 9, 16]], 'ladder': False},
-    '125126': {'node': [1, 2, 5], 'other_node': [1, 2, 6], 'open': False, 'blocks': [[5, 9, 19], [6, 9, 19]], 'ladder': False},
-    '130131': {'node': [1, 3, 0], 'other_node': [1, 3, 1], 'open': False, 'blocks': [[5, 12, 4], [6, 12, 4]], 'ladder': False},
-    '131132': {'node': [1, 3, 1], 'other_node': [1, 3, 2], 'open': False, 'blocks': [[5, 12, 7], [6, 12, 7]], 'ladder': False},
-    '132133': {'node': [1, 3, 2], 'other_node': [1, 3, 3], 'open': False, 'blocks': [[5, 12, 10], [6, 12, 10]], 'ladder': False},
-    '133134': {'node': [1, 3, 3], 'other_node': [1, 3, 4], 'open': False, 'blocks': [[5, 12, 13], [6, 12, 13]], 'ladder': False},
-    '134135': {'node': [1, 3, 4], 'other_node': [1, 3, 5], 'open': False, 'blocks': [[5, 12, 16], [6, 12, 16]], 'ladder': False},
-    '135136': {'node': [1, 3, 5], 'other_node': [1, 3, 6], 'open': False, 'blocks': [[5, 12, 19], [6, 12, 19]], 'ladder': False},
-    '140141': {'node': [1, 4, 0], 'other_node': [1, 4, 1], 'open': False, 'blocks': [[5, 15, 4], [6, 15, 4]], 'ladder': False},
-    '141142': {'node': [1, 4, 1], 'other_node': [1, 4, 2], 'open': False, 'blocks': [[5, 15, 7], [6, 15, 7]], 'ladder': False},
-    '142143': {'node': [1, 4, 2], 'other_node': [1, 4, 3], 'open': False, 'blocks': [[5, 15, 10], [6, 15, 10]], 'ladder': False},
-    '143144': {'node': [1, 4, 3], 'other_node': [1, 4, 4], 'open': False, 'blocks': [[5, 15, 13], [6, 15, 13]], 'ladder': False},
-    '144145': {'node': [1, 4, 4], 'other_node': [1, 4, 5], 'open': False, 'blocks': [[5, 15, 16], [6, 15, 16]], 'ladder': False},
-    '145146': {'node': [1, 4, 5], 'other_node': [1, 4, 6], 'open': False, 'blocks': [[5, 15, 19], [6, 15, 19]], 'ladder': False},
-    '150151': {'node': [1, 5, 0], 'other_node': [1, 5, 1], 'open': False, 'blocks': [[5, 18, 4], [6, 18, 4]], 'ladder': False},
-    '151152': {'node': [1, 5, 1], 'other_node': [1, 5, 2], 'open': False, 'blocks': [[5, 18, 7], [6, 18, 7]], 'ladder': False},
-    '152153': {'node': [1, 5, 2], 'other_node': [1, 5, 3], 'open': False, 'blocks': [[5, 18, 10], [6, 18, 10]], 'ladder': False},
-    '153154': {'node': [1, 5, 3], 'other_node': [1, 5, 4], 'open': False, 'blocks': [[5, 18, 13], [6, 18, 13]], 'ladder': False},
-    '154155': {'node': [1, 5, 4], 'other_node': [1, 5, 5], 'open': False, 'blocks': [[5, 18, 16], [6, 18, 16]], 'ladder': False},
-    '155156': {'node': [1, 5, 5], 'other_node': [1, 5, 6], 'open': False, 'blocks': [[5, 18, 19], [6, 18, 19]], 'ladder': False},
-    '160161': {'node': [1, 6, 0], 'other_node': [1, 6, 1], 'open': False, 'blocks': [[5, 21, 4], [6, 21, 4]], 'ladder': False},
-    '161162': {'node': [1, 6, 1], 'other_node': [1, 6, 2], 'open': False, 'blocks': [[5, 21, 7], [6, 21, 7]], 'ladder': False},
-    '162163': {'node': [1, 6, 2], 'other_node': [1, 6, 3], 'open': False, 'blocks': [[5, 21, 10], [6, 21, 10]], 'ladder': False},
-    '163164': {'node': [1, 6, 3], 'other_node': [1, 6, 4], 'open': False, 'blocks': [[5, 21, 13], [6, 21, 13]], 'ladder': False},
-    '164165': {'node': [1, 6, 4], 'other_node': [1, 6, 5], 'open': False, 'blocks': [[5, 21, 16], [6, 21, 16]], 'ladder': False},
-    '165166': {'node': [1, 6, 5], 'other_node': [1, 6, 6], 'open': False, 'blocks': [[5, 21, 19], [6, 21, 19]], 'ladder': False},
-
-    # Floor 1 north-to-south edges
-    '100110': {'node': [1, 0, 0], 'other_node': [1, 1, 0], 'open': False, 'blocks': [[5, 4, 2], [6, 4, 2]], 'ladder': False},
-    '110120': {'node': [1, 1, 0], 'other_node': [1, 2, 0], 'open': False, 'blocks': [[5, 7, 2], [6, 7, 2]], 'ladder': False},
-    '120130': {'node': [1, 2, 0], 'other_node': [1, 3, 0], 'open': False, 'blocks': [[5, 10, 2], [6, 10, 2]], 'ladder': False},
-    '130140': {'node': [1, 3, 0], 'other_node': [1, 4, 0], 'open': False, 'blocks': [[5, 13, 2], [6, 13, 2]], 'ladder': False},
-    '140150': {'node': [1, 4, 0], 'other_node': [1, 5, 0], 'open': False, 'blocks': [[5, 16, 2], [6, 16, 2]], 'ladder': False},
-    '150160': {'node': [1, 5, 0], 'other_node': [1, 6, 0], 'open': False, 'blocks': [[5, 19, 2], [6, 19, 2]], 'ladder': False},
-    '101111': {'node': [1, 0, 1], 'other_node': [1, 1, 1], 'open': False, 'blocks': [[5, 4, 5], [6, 4, 5]], 'ladder': False},
-    '111121': {'node': [1, 1, 1], 'other_node': [1, 2, 1], 'open': False, 'blocks': [[5, 7, 5], [6, 7, 5]], 'ladder': False},
-    '121131': {'node': [1, 2, 1], 'other_node': [1, 3, 1], 'open': False, 'blocks': [[5, 10, 5], [6, 10, 5]], 'ladder': False},
-    '131141': {'node': [1, 3, 1], 'other_node': [1, 4, 1], 'open': False, 'blocks': [[5, 13, 5], [6, 13, 5]], 'ladder': False},
-    '141151': {'node': [1, 4, 1], 'other_node': [1, 5, 1], 'open': False, 'blocks': [[5, 16, 5], [6, 16, 5]], 'ladder': False},
-    '151161': {'node': [1, 5, 1], 'other_node': [1, 6, 1], 'open': False, 'blocks': [[5, 19, 5], [6, 19, 5]], 'ladder': False},
-    '102112': {'node': [1, 0, 2], 'other_node': [1, 1, 2], 'open': False, 'blocks': [[5, 4, 8], [6, 4, 8]], 'ladder': False},
-    '112122': {'node': [1, 1, 2], 'other_node': [1, 2, 2], 'open': False, 'blocks': [[5, 7, 8], [6, 7, 8]], 'ladder': False},
-    '122132': {'node': [1, 2, 2], 'other_node': [1, 3, 2], 'open': False, 'blocks': [[5, 10, 8], [6, 10, 8]], 'ladder': False},
-    '132142': {'node': [1, 3, 2], 'other_node': [1, 4, 2], 'open': False, 'blocks': [[5, 13, 8], [6, 13, 8]], 'ladder': False},
-    '142152': {'node': [1, 4, 2], 'other_node': [1, 5, 2], 'open': False, 'blocks': [[5, 16, 8], [6, 16, 8]], 'ladder': False},
-    '152162': {'node': [1, 5, 2], 'other_node': [1, 6, 2], 'open': False, 'blocks': [[5, 19, 8], [6, 19, 8]], 'ladder': False},
-    '103113': {'node': [1, 0, 3], 'other_node': [1, 1, 3], 'open': False, 'blocks': [[5, 4, 11], [6, 4, 11]], 'ladder': False},
-    '113123': {'node': [1, 1, 3], 'other_node': [1, 2, 3], 'open': False, 'blocks': [[5, 7, 11], [6, 7, 11]], 'ladder': False},
-    '123133': {'node': [1, 2, 3], 'other_node': [1, 3, 3], 'open': False, 'blocks': [[5, 10, 11], [6, 10, 11]], 'ladder': False},
-    '133143': {'node': [1, 3, 3], 'other_node': [1, 4, 3], 'open': False, 'blocks': [[5, 13, 11], [6, 13, 11]], 'ladder': False},
-    '143153': {'node': [1, 4, 3], 'other_node': [1, 5, 3], 'open': False, 'blocks': [[5, 16, 11], [6, 16, 11]], 'ladder': False},
-    '153163': {'node': [1, 5, 3], 'other_node': [1, 6, 3], 'open': False, 'blocks': [[5, 19, 11], [6, 19, 11]], 'ladder': False},
-    '104114': {'node': [1, 0, 4], 'other_node': [1, 1, 4], 'open': False, 'blocks': [[5, 4, 14], [6, 4, 14]], 'ladder': False},
-    '114124': {'node': [1, 1, 4], 'other_node': [1, 2, 4], 'open': False, 'blocks': [[5, 7, 14], [6, 7, 14]], 'ladder': False},
-    '124134': {'node': [1, 2, 4], 'other_node': [1, 3, 4], 'open': False, 'blocks': [[5, 10, 14], [6, 10, 14]], 'ladder': False},
-    '134144': {'node': [1, 3, 4], 'other_node': [1, 4, 4], 'open': False, 'blocks': [[5, 13, 14], [6, 13, 14]], 'ladder': False},
-    '144154': {'node': [1, 4, 4], 'other_node': [1, 5, 4], 'open': False, 'blocks': [[5, 16, 14], [6, 16, 14]], 'ladder': False},
-    '154164': {'node': [1, 5, 4], 'other_node': [1, 6, 4], 'open': False, 'blocks': [[5, 19, 14], [6, 19, 14]], 'ladder': False},
-    '105115': {'node': [1, 0, 5], 'other_node': [1, 1, 5], 'open': False, 'blocks': [[5, 4, 17], [6, 4, 17]], 'ladder': False},
-    '115125': {'node': [1, 1, 5], 'other_node': [1, 2, 5], 'open': False, 'blocks': [[5, 7, 17], [6, 7, 17]], 'ladder': False},
-    '125135': {'node': [1, 2, 5], 'other_node': [1, 3, 5], 'open': False, 'blocks': [[5, 10, 17], [6, 10, 17]], 'ladder': False},
-    '135145': {'node': [1, 3, 5], 'other_node': [1, 4, 5], 'open': False, 'blocks': [[5, 13, 17], [6, 13, 17]], 'ladder': False},
-    '145155': {'node': [1, 4, 5], 'other_node': [1, 5, 5], 'open': False, 'blocks': [[5, 16, 17], [6, 16, 17]], 'ladder': False},
-    '155165': {'node': [1, 5, 5], 'other_node': [1, 6, 5], 'open': False, 'blocks': [[5, 19, 17], [6, 19, 17]], 'ladder': False},
-    '106116': {'node': [1, 0, 6], 'other_node': [1, 1, 6], 'open': False, 'blocks': [[5, 4, 20], [6, 4, 20]], 'ladder': False},
-    '116126': {'node': [1, 1, 6], 'other_node': [1, 2, 6], 'open': False, 'blocks': [[5, 7, 20], [6, 7, 20]], 'ladder': False},
-    '126136': {'node': [1, 2, 6], 'other_node': [1, 3, 6], 'open': False, 'blocks': [[5, 10, 20], [6, 10, 20]], 'ladder': False},
-    '136146': {'node': [1, 3, 6], 'other_node': [1, 4, 6], 'open': False, 'blocks': [[5, 13, 20], [6, 13, 20]], 'ladder': False},
-    '146156': {'node': [1, 4, 6], 'other_node': [1, 5, 6], 'open': False, 'blocks': [[5, 16, 20], [6, 16, 20]], 'ladder': False},
-    '156166': {'node': [1, 5, 6], 'other_node': [1, 6, 6], 'open': False, 'blocks': [[5, 19, 20], [6, 19, 20]], 'ladder': False},
-
-    # Floor 2 bottom-to-top edges
-    '100200': {'node': [1, 0, 0], 'other_node': [2, 0, 0], 'open': False, 'blocks': [[7, 2, 3]], 'ladder': True},
-    '101201': {'node': [1, 0, 1], 'other_node': [2, 0, 1], 'open': False, 'blocks': [[7, 2, 6]], 'ladder': True},
-    '102202': {'node': [1, 0, 2], 'other_node': [2, 0, 2], 'open': False, 'blocks': [[7, 2, 9]], 'ladder': True},
-    '103203': {'node': [1, 0, 3], 'other_node': [2, 0, 3], 'open': False, 'blocks': [[7, 2, 12]], 'ladder': True},
-    '104204': {'node': [1, 0, 4], 'other_node': [2, 0, 4], 'open': False, 'blocks': [[7, 2, 15]], 'ladder': True},
-    '105205': {'node': [1, 0, 5], 'other_node': [2, 0, 5], 'open': False, 'blocks': [[7, 2, 18]], 'ladder': True},
-    '106206': {'node': [1, 0, 6], 'other_node': [2, 0, 6], 'open': False, 'blocks': [[7, 2, 21]], 'ladder': True},
-    '110210': {'node': [1, 1, 0], 'other_node': [2, 1, 0], 'open': False, 'blocks': [[7, 5, 3]], 'ladder': True},
-    '111211': {'node': [1, 1, 1], 'other_node': [2, 1, 1], 'open': False, 'blocks': [[7, 5, 6]], 'ladder': True},
-    '112212': {'node': [1, 1, 2], 'other_node': [2, 1, 2], 'open': False, 'blocks': [[7, 5, 9]], 'ladder': True},
-    '113213': {'node': [1, 1, 3], 'other_node': [2, 1, 3], 'open': False, 'blocks': [[7, 5, 12]], 'ladder': True},
-    '114214': {'node': [1, 1, 4], 'other_node': [2, 1, 4], 'open': False, 'blocks': [[7, 5, 15]], 'ladder': True},
-    '115215': {'node': [1, 1, 5], 'other_node': [2, 1, 5], 'open': False, 'blocks': [[7, 5, 18]], 'ladder': True},
-    '116216': {'node': [1, 1, 6], 'other_node': [2, 1, 6], 'open': False, 'blocks': [[7, 5, 21]], 'ladder': True},
-    '120220': {'node': [1, 2, 0], 'other_node': [2, 2, 0], 'open': False, 'blocks': [[7, 8, 3]], 'ladder': True},
-    '121221': {'node': [1, 2, 1], 'other_node': [2, 2, 1], 'open': False, 'blocks': [[7, 8, 6]], 'ladder': True},
-    '122222': {'node': [1, 2, 2], 'other_node': [2, 2, 2], 'open': False, 'blocks': [[7, 8, 9]], 'ladder': True},
-    '123223': {'node': [1, 2, 3], 'other_node': [2, 2, 3], 'open': False, 'blocks': [[7, 8, 12]], 'ladder': True},
-    '124224': {'node': [1, 2, 4], 'other_node': [2, 2, 4], 'open': False, 'blocks': [[7, 8, 15]], 'ladder': True},
-    '125225': {'node': [1, 2, 5], 'other_node': [2, 2, 5], 'open': False, 'blocks': [[7, 8, 18]], 'ladder': True},
-    '126226': {'node': [1, 2, 6], 'other_node': [2, 2, 6], 'open': False, 'blocks': [[7, 8, 21]], 'ladder': True},
-    '130230': {'node': [1, 3, 0], 'other_node': [2, 3, 0], 'open': False, 'blocks': [[7, 11, 3]], 'ladder': True},
-    '131231': {'node': [1, 3, 1], 'other_node': [2, 3, 1], 'open': False, 'blocks': [[7, 11, 6]], 'ladder': True},
-    '132232': {'node': [1, 3, 2], 'other_node': [2, 3, 2], 'open': False, 'blocks': [[7, 11, 9]], 'ladder': True},
-    '133233': {'node': [1, 3, 3], 'other_node': [2, 3, 3], 'open': False, 'blocks': [[7, 11, 12]], 'ladder': True},
-    '134234': {'node': [1, 3, 4], 'other_node': [2, 3, 4], 'open': False, 'blocks': [[7, 11, 15]], 'ladder': True},
-    '135235': {'node': [1, 3, 5], 'other_node': [2, 3, 5], 'open': False, 'blocks': [[7, 11, 18]], 'ladder': True},
-    '136236': {'node': [1, 3, 6], 'other_node': [2, 3, 6], 'open': False, 'blocks': [[7, 11, 21]], 'ladder': True},
-    '140240': {'node': [1, 4, 0], 'other_node': [2, 4, 0], 'open': False, 'blocks': [[7, 14, 3]], 'ladder': True},
-    '141241': {'node': [1, 4, 1], 'other_node': [2, 4, 1], 'open': False, 'blocks': [[7, 14, 6]], 'ladder': True},
-    '142242': {'node': [1, 4, 2], 'other_node': [2, 4, 2], 'open': False, 'blocks': [[7, 14, 9]], 'ladder': True},
-    '143243': {'node': [1, 4, 3], 'other_node': [2, 4, 3], 'open': False, 'blocks': [[7, 14, 12]], 'ladder': True},
-    '144244': {'node': [1, 4, 4], 'other_node': [2, 4, 4], 'open': False, 'blocks': [[7, 14, 15]], 'ladder': True},
-    '145245': {'node': [1, 4, 5], 'other_node': [2, 4, 5], 'open': False, 'blocks': [[7, 14, 18]], 'ladder': True},
-    '146246': {'node': [1, 4, 6], 'other_node': [2, 4, 6], 'open': False, 'blocks': [[7, 14, 21]], 'ladder': True},
-    '150250': {'node': [1, 5, 0], 'other_node': [2, 5, 0], 'open': False, 'blocks': [[7, 17, 3]], 'ladder': True},
-    '151251': {'node': [1, 5, 1], 'other_node': [2, 5, 1], 'open': False, 'blocks': [[7, 17, 6]], 'ladder': True},
-    '152252': {'node': [1, 5, 2], 'other_node': [2, 5, 2], 'open': False, 'blocks': [[7, 17, 9]], 'ladder': True},
-    '153253': {'node': [1, 5, 3], 'other_node': [2, 5, 3], 'open': False, 'blocks': [[7, 17, 12]], 'ladder': True},
-    '154254': {'node': [1, 5, 4], 'other_node': [2, 5, 4], 'open': False, 'blocks': [[7, 17, 15]], 'ladder': True},
-    '155255': {'node': [1, 5, 5], 'other_node': [2, 5, 5], 'open': False, 'blocks': [[7, 17, 18]], 'ladder': True},
-    '156256': {'node': [1, 5, 6], 'other_node': [2, 5, 6], 'open': False, 'blocks': [[7, 17, 21]], 'ladder': True},
-    '160260': {'node': [1, 6, 0], 'other_node': [2, 6, 0], 'open': False, 'blocks': [[7, 20, 3]], 'ladder': True},
-    '161261': {'node': [1, 6, 1], 'other_node': [2, 6, 1], 'open': False, 'blocks': [[7, 20, 6]], 'ladder': True},
-    '162262': {'node': [1, 6, 2], 'other_node': [2, 6, 2], 'open': False, 'blocks': [[7, 20, 9]], 'ladder': True},
-    '163263': {'node': [1, 6, 3], 'other_node': [2, 6, 3], 'open': False, 'blocks': [[7, 20, 12]], 'ladder': True},
-    '164264': {'node': [1, 6, 4], 'other_node': [2, 6, 4], 'open': False, 'blocks': [[7, 20, 15]], 'ladder': True},
-    '165265': {'node': [1, 6, 5], 'other_node': [2, 6, 5], 'open': False, 'blocks': [[7, 20, 18]], 'ladder': True},
-    '166266': {'node': [1, 6, 6], 'other_node': [2, 6, 6], 'open': False, 'blocks': [[7, 20, 21]], 'ladder': True},
-    
-    # Floor 2 west-to-east edges
-    '200201': {'node': [2, 0, 0], 'other_node': [2, 0, 1], 'open': False, 'blocks': [[8, 3, 4], [9, 3, 4]], 'ladder': False},
-    '201202': {'node': [2, 0, 1], 'other_node': [2, 0, 2], 'open': False, 'blocks': [[8, 3, 7], [9, 3, 7]], 'ladder': False},
-    '202203': {'node': [2, 0, 2], 'other_node': [2, 0, 3], 'open': False, 'blocks': [[8, 3, 10], [9, 3, 10]], 'ladder': False},
-    '203204': {'node': [2, 0, 3], 'other_node': [2, 0, 4], 'open': False, 'blocks': [[8, 3, 13], [9, 3, 13]], 'ladder': False},
-    '204205': {'node': [2, 0, 4], 'other_node': [2, 0, 5], 'open': False, 'blocks': [[8, 3, 16], [9, 3, 16]], 'ladder': False},
-    '205206': {'node': [2, 0, 5], 'other_node': [2, 0, 6], 'open': False, 'blocks': [[8, 3, 19], [9, 3, 19]], 'ladder': False},
-    '210211': {'node': [2, 1, 0], 'other_node': [2, 1, 1], 'open': False, 'blocks': [[8, 6, 4], [9, 6, 4]], 'ladder': False},
-    '211212': {'node': [2, 1, 1], 'other_node': [2, 1, 2], 'open': False, 'blocks': [[8, 6, 7], [9, 6, 7]], 'ladder': False},
-    '212213': {'node': [2, 1, 2], 'other_node': [2, 1, 3], 'open': False, 'blocks': [[8, 6, 10], [9, 6, 10]], 'ladder': False},
-    '213214': {'node': [2, 1, 3], 'other_node': [2, 1, 4], 'open': False, 'blocks': [[8, 6, 13], [9, 6, 13]], 'ladder': False},
-    '214215': {'node': [2, 1, 4], 'other_node': [2, 1, 5], 'open': False, 'blocks': [[8, 6, 16], [9, 6, 16]], 'ladder': False},
-    '215216': {'node': [2, 1, 5], 'other_node': [2, 1, 6], 'open': False, 'blocks': [[8, 6, 19], [9, 6, 19]], 'ladder': False},
-    '220221': {'node': [2, 2, 0], 'other_node': [2, 2, 1], 'open': False, 'blocks': [[8, 9, 4], [9, 9, 4]], 'ladder': False},
-    '221222': {'node': [2, 2, 1], 'other_node': [2, 2, 2], 'open': False, 'blocks': [[8, 9, 7], [9, 9, 7]], 'ladder': False},
-    '222223': {'node': [2, 2, 2], 'other_node': [2, 2, 3], 'open': False, 'blocks': [[8, 9, 10], [9, 9, 10]], 'ladder': False},
-    '223224': {'node': [2, 2, 3], 'other_node': [2, 2, 4], 'open': False, 'blocks': [[8, 9, 13], [9, 9, 13]], 'ladder': False},
-    '224225': {'node': [2, 2, 4], 'other_node': [2, 2, 5], 'open': False, 'blocks': [[8, 9, 16], [9, 9, 16]], 'ladder': False},
-    '225226': {'node': [2, 2, 5], 'other_node': [2, 2, 6], 'open': False, 'blocks': [[8, 9, 19], [9, 9, 19]], 'ladder': False},
-    '230231': {'node': [2, 3, 0], 'other_node': [2, 3, 1], 'open': False, 'blocks': [[8, 12, 4], [9, 12, 4]], 'ladder': False},
-    '231232': {'node': [2, 3, 1], 'other_node': [2, 3, 2], 'open': False, 'blocks': [[8, 12, 7], [9, 12, 7]], 'ladder': False},
-    '232233': {'node': [2, 3, 2], 'other_node': [2, 3, 3], 'open': False, 'blocks': [[8, 12, 10], [9, 12, 10]], 'ladder': False},
-    '233234': {'node': [2, 3, 3], 'other_node': [2, 3, 4], 'open': False, 'blocks': [[8, 12, 13], [9, 12, 13]], 'ladder': False},
-    '234235': {'node': [2, 3, 4], 'other_node': [2, 3, 5], 'open': False, 'blocks': [[8, 12, 16], [9, 12, 16]], 'ladder': False},
-    '235236': {'node': [2, 3, 5], 'other_node': [2, 3, 6], 'open': False, 'blocks': [[8, 12, 19], [9, 12, 19]], 'ladder': False},
-    '240241': {'node': [2, 4, 0], 'other_node': [2, 4, 1], 'open': False, 'blocks': [[8, 15, 4], [9, 15, 4]], 'ladder': False},
-    '241242': {'node': [2, 4, 1], 'other_node': [2, 4, 2], 'open': False, 'blocks': [[8, 15, 7], [9, 15, 7]], 'ladder': False},
-    '242243': {'node': [2, 4, 2], 'other_node': [2, 4, 3], 'open': False, 'blocks': [[8, 15, 10], [9, 15, 10]], 'ladder': False},
-    '243244': {'node': [2, 4, 3], 'other_node': [2, 4, 4], 'open': False, 'blocks': [[8, 15, 13], [9, 15, 13]], 'ladder': False},
-    '244245': {'node': [2, 4, 4], 'other_node': [2, 4, 5], 'open': False, 'blocks': [[8, 15, 16], [9, 15, 16]], 'ladder': False},
-    '245246': {'node': [2, 4, 5], 'other_node': [2, 4, 6], 'open': False, 'blocks': [[8, 15, 19], [9, 15, 19]], 'ladder': False},
-    '250251': {'node': [2, 5, 0], 'other_node': [2, 5, 1], 'open': False, 'blocks': [[8, 18, 4], [9, 18, 4]], 'ladder': False},
-    '251252': {'node': [2, 5, 1], 'other_node': [2, 5, 2], 'open': False, 'blocks': [[8, 18, 7], [9, 18, 7]], 'ladder': False},
-    '252253': {'node': [2, 5, 2], 'other_node': [2, 5, 3], 'open': False, 'blocks': [[8, 18, 10], [9, 18, 10]], 'ladder': False},
-    '253254': {'node': [2, 5, 3], 'other_node': [2, 5, 4], 'open': False, 'blocks': [[8, 18, 13], [9, 18, 13]], 'ladder': False},
-    '254255': {'node': [2, 5, 4], 'other_node': [2, 5, 5], 'open': False, 'blocks': [[8, 18, 16], [9, 18, 16]], 'ladder': False},
-    '255256': {'node': [2, 5, 5], 'other_node': [2, 5, 6], 'open': False, 'blocks': [[8, 18, 19], [9, 18, 19]], 'ladder': False},
-    '260261': {'node': [2, 6, 0], 'other_node': [2, 6, 1], 'open': False, 'blocks': [[8, 21, 4], [9, 21, 4]], 'ladder': False},
-    '261262': {'node': [2, 6, 1], 'other_node': [2, 6, 2], 'open': False, 'blocks': [[8, 21, 7], [9, 21, 7]], 'ladder': False},
-    '262263': {'node': [2, 6, 2], 'other_node': [2, 6, 3], 'open': False, 'blocks': [[8, 21, 10], [9, 21, 10]], 'ladder': False},
-    '263264': {'node': [2, 6, 3], 'other_node': [2, 6, 4], 'open': False, 'blocks': [[8, 21, 13], [9, 21, 13]], 'ladder': False},
-    '264265': {'node': [2, 6, 4], 'other_node': [2, 6, 5], 'open': False, 'blocks': [[8, 21, 16], [9, 21, 16]], 'ladder': False},
-    '265266': {'node': [2, 6, 5], 'other_node': [2, 6, 6], 'open': False, 'blocks': [[8, 21, 19], [9, 21, 19]], 'ladder': False},
-
-    # Floor 2 north-to-south edges
-    '200210': {'node': [2, 0, 0], 'other_node': [2, 1, 0], 'open': False, 'blocks': [[8, 4, 2], [9, 4, 2]], 'ladder': False},
-    '210220': {'node': [2, 1, 0], 'other_node': [2, 2, 0], 'open': False, 'blocks': [[8, 7, 2], [9, 7, 2]], 'ladder': False},
-    '220230': {'node': [2, 2, 0], 'other_node': [2, 3, 0], 'open': False, 'blocks': [[8, 10, 2], [9, 10, 2]], 'ladder': False},
-    '230240': {'node': [2, 3, 0], 'other_node': [2, 4, 0], 'open': False, 'blocks': [[8, 13, 2], [9, 13, 2]], 'ladder': False},
-    '240250': {'node': [2, 4, 0], 'other_node': [2, 5, 0], 'open': False, 'blocks': [[8, 16, 2], [9, 16, 2]], 'ladder': False},
-    '250260': {'node': [2, 5, 0], 'other_node': [2, 6, 0], 'open': False, 'blocks': [[8, 19, 2], [9, 19, 2]], 'ladder': False},
-    '201211': {'node': [2, 0, 1], 'other_node': [2, 1, 1], 'open': False, 'blocks': [[8, 4, 5], [9, 4, 5]], 'ladder': False},
-    '211221': {'node': [2, 1, 1], 'other_node': [2, 2, 1], 'open': False, 'blocks': [[8, 7, 5], [9, 7, 5]], 'ladder': False},
-    '221231': {'node': [2, 2, 1], 'other_node': [2, 3, 1], 'open': False, 'blocks': [[8, 10, 5], [9, 10, 5]], 'ladder': False},
-    '231241': {'node': [2, 3, 1], 'other_node': [2, 4, 1], 'open': False, 'blocks': [[8, 13, 5], [9, 13, 5]], 'ladder': False},
-    '241251': {'node': [2, 4, 1], 'other_node': [2, 5, 1], 'open': False, 'blocks': [[8, 16, 5], [9, 16, 5]], 'ladder': False},
-    '251261': {'node': [2, 5, 1], 'other_node': [2, 6, 1], 'open': False, 'blocks': [[8, 19, 5], [9, 19, 5]], 'ladder': False},
-    '202212': {'node': [2, 0, 2], 'other_node': [2, 1, 2], 'open': False, 'blocks': [[8, 4, 8], [9, 4, 8]], 'ladder': False},
-    '212222': {'node': [2, 1, 2], 'other_node': [2, 2, 2], 'open': False, 'blocks': [[8, 7, 8], [9, 7, 8]], 'ladder': False},
-    '222232': {'node': [2, 2, 2], 'other_node': [2, 3, 2], 'open': False, 'blocks': [[8, 10, 8], [9, 10, 8]], 'ladder': False},
-    '232242': {'node': [2, 3, 2], 'other_node': [2, 4, 2], 'open': False, 'blocks': [[8, 13, 8], [9, 13, 8]], 'ladder': False},
-    '242252': {'node': [2, 4, 2], 'other_node': [2, 5, 2], 'open': False, 'blocks': [[8, 16, 8], [9, 16, 8]], 'ladder': False},
-    '252262': {'node': [2, 5, 2], 'other_node': [2, 6, 2], 'open': False, 'blocks': [[8, 19, 8], [9, 19, 8]], 'ladder': False},
-    '203213': {'node': [2, 0, 3], 'other_node': [2, 1, 3], 'open': False, 'blocks': [[8, 4, 11], [9, 4, 11]], 'ladder': False},
-    '213223': {'node': [2, 1, 3], 'other_node': [2, 2, 3], 'open': False, 'blocks': [[8, 7, 11], [9, 7, 11]], 'ladder': False},
-    '223233': {'node': [2, 2, 3], 'other_node': [2, 3, 3], 'open': False, 'blocks': [[8, 10, 11], [9, 10, 11]], 'ladder': False},
-    '233243': {'node': [2, 3, 3], 'other_node': [2, 4, 3], 'open': False, 'blocks': [[8, 13, 11], [9, 13, 11]], 'ladder': False},
-    '243253': {'node': [2, 4, 3], 'other_node': [2, 5, 3], 'open': False, 'blocks': [[8, 16, 11], [9, 16, 11]], 'ladder': False},
-    '253263': {'node': [2, 5, 3], 'other_node': [2, 6, 3], 'open': False, 'blocks': [[8, 19, 11], [9, 19, 11]], 'ladder': False},
-    '204214': {'node': [2, 0, 4], 'other_node': [2, 1, 4], 'open': False, 'blocks': [[8, 4, 14], [9, 4, 14]], 'ladder': False},
-    '214224': {'node': [2, 1, 4], 'other_node': [2, 2, 4], 'open': False, 'blocks': [[8, 7, 14], [9, 7, 14]], 'ladder': False},
-    '224234': {'node': [2, 2, 4], 'other_node': [2, 3, 4], 'open': False, 'blocks': [[8, 10, 14], [9, 10, 14]], 'ladder': False},
-    '234244': {'node': [2, 3, 4], 'other_node': [2, 4, 4], 'open': False, 'blocks': [[8, 13, 14], [9, 13, 14]], 'ladder': False},
-    '244254': {'node': [2, 4, 4], 'other_node': [2, 5, 4], 'open': False, 'blocks': [[8, 16, 14], [9, 16, 14]], 'ladder': False},
-    '254264': {'node': [2, 5, 4], 'other_node': [2, 6, 4], 'open': False, 'blocks': [[8, 19, 14], [9, 19, 14]], 'ladder': False},
-    '205215': {'node': [2, 0, 5], 'other_node': [2, 1, 5], 'open': False, 'blocks': [[8, 4, 17], [9, 4, 17]], 'ladder': False},
-    '215225': {'node': [2, 1, 5], 'other_node': [2, 2, 5], 'open': False, 'blocks': [[8, 7, 17], [9, 7, 17]], 'ladder': False},
-    '225235': {'node': [2, 2, 5], 'other_node': [2, 3, 5], 'open': False, 'blocks': [[8, 10, 17], [9, 10, 17]], 'ladder': False},
-    '235245': {'node': [2, 3, 5], 'other_node': [2, 4, 5], 'open': False, 'blocks': [[8, 13, 17], [9, 13, 17]], 'ladder': False},
-    '245255': {'node': [2, 4, 5], 'other_node': [2, 5, 5], 'open': False, 'blocks': [[8, 16, 17], [9, 16, 17]], 'ladder': False},
-    '255265': {'node': [2, 5, 5], 'other_node': [2, 6, 5], 'open': False, 'blocks': [[8, 19, 17], [9, 19, 17]], 'ladder': False},
-    '206216': {'node': [2, 0, 6], 'other_node': [2, 1, 6], 'open': False, 'blocks': [[8, 4, 20], [9, 4, 20]], 'ladder': False},
-    '216226': {'node': [2, 1, 6], 'other_node': [2, 2, 6], 'open': False, 'blocks': [[8, 7, 20], [9, 7, 20]], 'ladder': False},
-    '226236': {'node': [2, 2, 6], 'other_node': [2, 3, 6], 'open': False, 'blocks': [[8, 10, 20], [9, 10, 20]], 'ladder': False},
-    '236246': {'node': [2, 3, 6], 'other_node': [2, 4, 6], 'open': False, 'blocks': [[8, 13, 20], [9, 13, 20]], 'ladder': False},
-    '246256': {'node': [2, 4, 6], 'other_node': [2, 5, 6], 'open': False, 'blocks': [[8, 16, 20], [9, 16, 20]], 'ladder': False},
-    '256266': {'node': [2, 5, 6], 'other_node': [2, 6, 6], 'open': False, 'blocks': [[8, 19, 20], [9, 19, 20]], 'ladder': False},
-
-    # Floor 3 bottom-to-top edges
-    '200300': {'node': [2, 0, 0], 'other_node': [3, 0, 0], 'open': False, 'blocks': [[10, 2, 3]], 'ladder': True},
-    '201301': {'node': [2, 0, 1], 'other_node': [3, 0, 1], 'open': False, 'blocks': [[10, 2, 6]], 'ladder': True},
-    '202302': {'node': [2, 0, 2], 'other_node': [3, 0, 2], 'open': False, 'blocks': [[10, 2, 9]], 'ladder': True},
-    '203303': {'node': [2, 0, 3], 'other_node': [3, 0, 3], 'open': False, 'blocks': [[10, 2, 12]], 'ladder': True},
-    '204304': {'node': [2, 0, 4], 'other_node': [3, 0, 4], 'open': False, 'blocks': [[10, 2, 15]], 'ladder': True},
-    '205305': {'node': [2, 0, 5], 'other_node': [3, 0, 5], 'open': False, 'blocks': [[10, 2, 18]], 'ladder': True},
-    '206306': {'node': [2, 0, 6], 'other_node': [3, 0, 6], 'open': False, 'blocks': [[10, 2, 21]], 'ladder': True},
-    '210310': {'node': [2, 1, 0], 'other_node': [3, 1, 0], 'open': False, 'blocks': [[10, 5, 3]], 'ladder': True},
-    '211311': {'node': [2, 1, 1], 'other_node': [3, 1, 1], 'open': False, 'blocks': [[10, 5, 6]], 'ladder': True},
-    '212312': {'node': [2, 1, 2], 'other_node': [3, 1, 2], 'open': False, 'blocks': [[10, 5, 9]], 'ladder': True},
-    '213313': {'node': [2, 1, 3], 'other_node': [3, 1, 3], 'open': False, 'blocks': [[10, 5, 12]], 'ladder': True},
-    '214314': {'node': [2, 1, 4], 'other_node': [3, 1, 4], 'open': False, 'blocks': [[10, 5, 15]], 'ladder': True},
-    '215315': {'node': [2, 1, 5], 'other_node': [3, 1, 5], 'open': False, 'blocks': [[10, 5, 18]], 'ladder': True},
-    '216316': {'node': [2, 1, 6], 'other_node': [3, 1, 6], 'open': False, 'blocks': [[10, 5, 21]], 'ladder': True},
-    '220320': {'node': [2, 2, 0], 'other_node': [3, 2, 0], 'open': False, 'blocks': [[10, 8, 3]], 'ladder': True},
-    '221321': {'node': [2, 2, 1], 'other_node': [3, 2, 1], 'open': False, 'blocks': [[10, 8, 6]], 'ladder': True},
-    '222322': {'node': [2, 2, 2], 'other_node': [3, 2, 2], 'open': False, 'blocks': [[10, 8, 9]], 'ladder': True},
-    '223323': {'node': [2, 2, 3], 'other_node': [3, 2, 3], 'open': False, 'blocks': [[10, 8, 12]], 'ladder': True},
-    '224324': {'node': [2, 2, 4], 'other_node': [3, 2, 4], 'open': False, 'blocks': [[10, 8, 15]], 'ladder': True},
-    '225325': {'node': [2, 2, 5], 'other_node': [3, 2, 5], 'open': False, 'blocks': [[10, 8, 18]], 'ladder': True},
-    '226326': {'node': [2, 2, 6], 'other_node': [3, 2, 6], 'open': False, 'blocks': [[10, 8, 21]], 'ladder': True},
-    '230330': {'node': [2, 3, 0], 'other_node': [3, 3, 0], 'open': False, 'blocks': [[10, 11, 3]], 'ladder': True},
-    '231331': {'node': [2, 3, 1], 'other_node': [3, 3, 1], 'open': False, 'blocks': [[10, 11, 6]], 'ladder': True},
-    '232332': {'node': [2, 3, 2], 'other_node': [3, 3, 2], 'open': False, 'blocks': [[10, 11, 9]], 'ladder': True},
-    '233333': {'node': [2, 3, 3], 'other_node': [3, 3, 3], 'open': False, 'blocks': [[10, 11, 12]], 'ladder': True},
-    '234334': {'node': [2, 3, 4], 'other_node': [3, 3, 4], 'open': False, 'blocks': [[10, 11, 15]], 'ladder': True},
-    '235335': {'node': [2, 3, 5], 'other_node': [3, 3, 5], 'open': False, 'blocks': [[10, 11, 18]], 'ladder': True},
-    '236336': {'node': [2, 3, 6], 'other_node': [3, 3, 6], 'open': False, 'blocks': [[10, 11, 21]], 'ladder': True},
-    '240340': {'node': [2, 4, 0], 'other_node': [3, 4, 0], 'open': False, 'blocks': [[10, 14, 3]], 'ladder': True},
-    '241341': {'node': [2, 4, 1], 'other_node': [3, 4, 1], 'open': False, 'blocks': [[10, 14, 6]], 'ladder': True},
-    '242342': {'node': [2, 4, 2], 'other_node': [3, 4, 2], 'open': False, 'blocks': [[10, 14, 9]], 'ladder': True},
-    '243343': {'node': [2, 4, 3], 'other_node': [3, 4, 3], 'open': False, 'blocks': [[10, 14, 12]], 'ladder': True},
-    '244344': {'node': [2, 4, 4], 'other_node': [3, 4, 4], 'open': False, 'blocks': [[10, 14, 15]], 'ladder': True},
-    '245345': {'node': [2, 4, 5], 'other_node': [3, 4, 5], 'open': False, 'blocks': [[10, 14, 18]], 'ladder': True},
-    '246346': {'node': [2, 4, 6], 'other_node': [3, 4, 6], 'open': False, 'blocks': [[10, 14, 21]], 'ladder': True},
-    '250350': {'node': [2, 5, 0], 'other_node': [3, 5, 0], 'open': False, 'blocks': [[10, 17, 3]], 'ladder': True},
-    '251351': {'node': [2, 5, 1], 'other_node': [3, 5, 1], 'open': False, 'blocks': [[10, 17, 6]], 'ladder': True},
-    '252352': {'node': [2, 5, 2], 'other_node': [3, 5, 2], 'open': False, 'blocks': [[10, 17, 9]], 'ladder': True},
-    '253353': {'node': [2, 5, 3], 'other_node': [3, 5, 3], 'open': False, 'blocks': [[10, 17, 12]], 'ladder': True},
-    '254354': {'node': [2, 5, 4], 'other_node': [3, 5, 4], 'open': False, 'blocks': [[10, 17, 15]], 'ladder': True},
-    '255355': {'node': [2, 5, 5], 'other_node': [3, 5, 5], 'open': False, 'blocks': [[10, 17, 18]], 'ladder': True},
-    '256356': {'node': [2, 5, 6], 'other_node': [3, 5, 6], 'open': False, 'blocks': [[10, 17, 21]], 'ladder': True},
-    '260360': {'node': [2, 6, 0], 'other_node': [3, 6, 0], 'open': False, 'blocks': [[10, 20, 3]], 'ladder': True},
-    '261361': {'node': [2, 6, 1], 'other_node': [3, 6, 1], 'open': False, 'blocks': [[10, 20, 6]], 'ladder': True},
-    '262362': {'node': [2, 6, 2], 'other_node': [3, 6, 2], 'open': False, 'blocks': [[10, 20, 9]], 'ladder': True},
-    '263363': {'node': [2, 6, 3], 'other_node': [3, 6, 3], 'open': False, 'blocks': [[10, 20, 12]], 'ladder': True},
-    '264364': {'node': [2, 6, 4], 'other_node': [3, 6, 4], 'open': False, 'blocks': [[10, 20, 15]], 'ladder': True},
-    '265365': {'node': [2, 6, 5], 'other_node': [3, 6, 5], 'open': False, 'blocks': [[10, 20, 18]], 'ladder': True},
-    '266366': {'node': [2, 6, 6], 'other_node': [3, 6, 6], 'open': False, 'blocks': [[10, 20, 21]], 'ladder': True},
-    
-    # Floor 3 west-to-east edges
-    '300301': {'node': [3, 0, 0], 'other_node': [3, 0, 1], 'open': False, 'blocks': [[11, 3, 4], [12, 3, 4]], 'ladder': False},
-    '301302': {'node': [3, 0, 1], 'other_node': [3, 0, 2], 'open': False, 'blocks': [[11, 3, 7], [12, 3, 7]], 'ladder': False},
-    '302303': {'node': [3, 0, 2], 'other_node': [3, 0, 3], 'open': False, 'blocks': [[11, 3, 10], [12, 3, 10]], 'ladder': False},
-    '303304': {'node': [3, 0, 3], 'other_node': [3, 0, 4], 'open': False, 'blocks': [[11, 3, 13], [12, 3, 13]], 'ladder': False},
-    '304305': {'node': [3, 0, 4], 'other_node': [3, 0, 5], 'open': False, 'blocks': [[11, 3, 16], [12, 3, 16]], 'ladder': False},
-    '305306': {'node': [3, 0, 5], 'other_node': [3, 0, 6], 'open': False, 'blocks': [[11, 3, 19], [12, 3, 19]], 'ladder': False},
-    '310311': {'node': [3, 1, 0], 'other_node': [3, 1, 1], 'open': False, 'blocks': [[11, 6, 4], [12, 6, 4]], 'ladder': False},
-    '311312': {'node': [3, 1, 1], 'other_node': [3, 1, 2], 'open': False, 'blocks': [[11, 6, 7], [12, 6, 7]], 'ladder': False},
-    '312313': {'node': [3, 1, 2], 'other_node': [3, 1, 3], 'open': False, 'blocks': [[11, 6, 10], [12, 6, 10]], 'ladder': False},
-    '313314': {'node': [3, 1, 3], 'other_node': [3, 1, 4], 'open': False, 'blocks': [[11, 6, 13], [12, 6, 13]], 'ladder': False},
-    '314315': {'node': [3, 1, 4], 'other_node': [3, 1, 5], 'open': False, 'blocks': [[11, 6, 16], [12, 6, 16]], 'ladder': False},
-    '315316': {'node': [3, 1, 5], 'other_node': [3, 1, 6], 'open': False, 'blocks': [[11, 6, 19], [12, 6, 19]], 'ladder': False},
-    '320321': {'node': [3, 2, 0], 'other_node': [3, 2, 1], 'open': False, 'blocks': [[11, 9, 4], [12, 9, 4]], 'ladder': False},
-    '321322': {'node': [3, 2, 1], 'other_node': [3, 2, 2], 'open': False, 'blocks': [[11, 9, 7], [12, 9, 7]], 'ladder': False},
-    '322323': {'node': [3, 2, 2], 'other_node': [3, 2, 3], 'open': False, 'blocks': [[11, 9, 10], [12, 9, 10]], 'ladder': False},
-    '323324': {'node': [3, 2, 3], 'other_node': [3, 2, 4], 'open': False, 'blocks': [[11, 9, 13], [12, 9, 13]], 'ladder': False},
-    '324325': {'node': [3, 2, 4], 'other_node': [3, 2, 5], 'open': False, 'blocks': [[11, 9, 16], [12, 9, 16]], 'ladder': False},
-    '325326': {'node': [3, 2, 5], 'other_node': [3, 2, 6], 'open': False, 'blocks': [[11, 9, 19], [12, 9, 19]], 'ladder': False},
-    '330331': {'node': [3, 3, 0], 'other_node': [3, 3, 1], 'open': False, 'blocks': [[11, 12, 4], [12, 12, 4]], 'ladder': False},
-    '331332': {'node': [3, 3, 1], 'other_node': [3, 3, 2], 'open': False, 'blocks': [[11, 12, 7], [12, 12, 7]], 'ladder': False},
-    '332333': {'node': [3, 3, 2], 'other_node': [3, 3, 3], 'open': False, 'blocks': [[11, 12, 10], [12, 12, 10]], 'ladder': False},
-    '333334': {'node': [3, 3, 3], 'other_node': [3, 3, 4], 'open': False, 'blocks': [[11, 12, 13], [12, 12, 13]], 'ladder': False},
-    '334335': {'node': [3, 3, 4], 'other_node': [3, 3, 5], 'open': False, 'blocks': [[11, 12, 16], [12, 12, 16]], 'ladder': False},
-    '335336': {'node': [3, 3, 5], 'other_node': [3, 3, 6], 'open': False, 'blocks': [[11, 12, 19], [12, 12, 19]], 'ladder': False},
-    '340341': {'node': [3, 4, 0], 'other_node': [3, 4, 1], 'open': False, 'blocks': [[11, 15, 4], [12, 15, 4]], 'ladder': False},
-    '341342': {'node': [3, 4, 1], 'other_node': [3, 4, 2], 'open': False, 'blocks': [[11, 15, 7], [12, 15, 7]], 'ladder': False},
-    '342343': {'node': [3, 4, 2], 'other_node': [3, 4, 3], 'open': False, 'blocks': [[11, 15, 10], [12, 15, 10]], 'ladder': False},
-    '343344': {'node': [3, 4, 3], 'other_node': [3, 4, 4], 'open': False, 'blocks': [[11, 15, 13], [12, 15, 13]], 'ladder': False},
-    '344345': {'node': [3, 4, 4], 'other_node': [3, 4, 5], 'open': False, 'blocks': [[11, 15, 16], [12, 15, 16]], 'ladder': False},
-    '345346': {'node': [3, 4, 5], 'other_node': [3, 4, 6], 'open': False, 'blocks': [[11, 15, 19], [12, 15, 19]], 'ladder': False},
-    '350351': {'node': [3, 5, 0], 'other_node': [3, 5, 1], 'open': False, 'blocks': [[11, 18, 4], [12, 18, 4]], 'ladder': False},
-    '351352': {'node': [3, 5, 1], 'other_node': [3, 5, 2], 'open': False, 'blocks': [[11, 18, 7], [12, 18, 7]], 'ladder': False},
-    '352353': {'node': [3, 5, 2], 'other_node': [3, 5, 3], 'open': False, 'blocks': [[11, 18, 10], [12, 18, 10]], 'ladder': False},
-    '353354': {'node': [3, 5, 3], 'other_node': [3, 5, 4], 'open': False, 'blocks': [[11, 18, 13], [12, 18, 13]], 'ladder': False},
-    '354355': {'node': [3, 5, 4], 'other_node': [3, 5, 5], 'open': False, 'blocks': [[11, 18, 16], [12, 18, 16]], 'ladder': False},
-    '355356': {'node': [3, 5, 5], 'other_node': [3, 5, 6], 'open': False, 'blocks': [[11, 18, 19], [12, 18, 19]], 'ladder': False},
-    '360361': {'node': [3, 6, 0], 'other_node': [3, 6, 1], 'open': False, 'blocks': [[11, 21, 4], [12, 21, 4]], 'ladder': False},
-    '361362': {'node': [3, 6, 1], 'other_node': [3, 6, 2], 'open': False, 'blocks': [[11, 21, 7], [12, 21, 7]], 'ladder': False},
-    '362363': {'node': [3, 6, 2], 'other_node': [3, 6, 3], 'open': False, 'blocks': [[11, 21, 10], [12, 21, 10]], 'ladder': False},
-    '363364': {'node': [3, 6, 3], 'other_node': [3, 6, 4], 'open': False, 'blocks': [[11, 21, 13], [12, 21, 13]], 'ladder': False},
-    '364365': {'node': [3, 6, 4], 'other_node': [3, 6, 5], 'open': False, 'blocks': [[11, 21, 16], [12, 21, 16]], 'ladder': False},
-    '365366': {'node': [3, 6, 5], 'other_node': [3, 6, 6], 'open': False, 'blocks': [[11, 21, 19], [12, 21, 19]], 'ladder': False},
-
-    # Floor 3 north-to-south edges
-    '300310': {'node': [3, 0, 0], 'other_node': [3, 1, 0], 'open': False, 'blocks': [[11, 4, 2], [12, 4, 2]], 'ladder': False},
-    '310320': {'node': [3, 1, 0], 'other_node': [3, 2, 0], 'open': False, 'blocks': [[11, 7, 2], [12, 7, 2]], 'ladder': False},
-    '320330': {'node': [3, 2, 0], 'other_node': [3, 3, 0], 'open': False, 'blocks': [[11, 10, 2], [12, 10, 2]], 'ladder': False},
-    '330340': {'node': [3, 3, 0], 'other_node': [3, 4, 0], 'open': False, 'blocks': [[11, 13, 2], [12, 13, 2]], 'ladder': False},
-    '340350': {'node': [3, 4, 0], 'other_node': [3, 5, 0], 'open': False, 'blocks': [[11, 16, 2], [12, 16, 2]], 'ladder': False},
-    '350360': {'node': [3, 5, 0], 'other_node': [3, 6, 0], 'open': False, 'blocks': [[11, 19, 2], [12, 19, 2]], 'ladder': False},
-    '301311': {'node': [3, 0, 1], 'other_node': [3, 1, 1], 'open': False, 'blocks': [[11, 4, 5], [12, 4, 5]], 'ladder': False},
-    '311321': {'node': [3, 1, 1], 'other_node': [3, 2, 1], 'open': False, 'blocks': [[11, 7, 5], [12, 7, 5]], 'ladder': False},
-    '321331': {'node': [3, 2, 1], 'other_node': [3, 3, 1], 'open': False, 'blocks': [[11, 10, 5], [12, 10, 5]], 'ladder': False},
-    '331341': {'node': [3, 3, 1], 'other_node': [3, 4, 1], 'open': False, 'blocks': [[11, 13, 5], [12, 13, 5]], 'ladder': False},
-    '341351': {'node': [3, 4, 1], 'other_node': [3, 5, 1], 'open': False, 'blocks': [[11, 16, 5], [12, 16, 5]], 'ladder': False},
-    '351361': {'node': [3, 5, 1], 'other_node': [3, 6, 1], 'open': False, 'blocks': [[11, 19, 5], [12, 19, 5]], 'ladder': False},
-    '302312': {'node': [3, 0, 2], 'other_node': [3, 1, 2], 'open': False, 'blocks': [[11, 4, 8], [12, 4, 8]], 'ladder': False},
-    '312322': {'node': [3, 1, 2], 'other_node': [3, 2, 2], 'open': False, 'blocks': [[11, 7, 8], [12, 7, 8]], 'ladder': False},
-    '322332': {'node': [3, 2, 2], 'other_node': [3, 3, 2], 'open': False, 'blocks': [[11, 10, 8], [12, 10, 8]], 'ladder': False},
-    '332342': {'node': [3, 3, 2], 'other_node': [3, 4, 2], 'open': False, 'blocks': [[11, 13, 8], [12, 13, 8]], 'ladder': False},
-    '342352': {'node': [3, 4, 2], 'other_node': [3, 5, 2], 'open': False, 'blocks': [[11, 16, 8], [12, 16, 8]], 'ladder': False},
-    '352362': {'node': [3, 5, 2], 'other_node': [3, 6, 2], 'open': False, 'blocks': [[11, 19, 8], [12, 19, 8]], 'ladder': False},
-    '303313': {'node': [3, 0, 3], 'other_node': [3, 1, 3], 'open': False, 'blocks': [[11, 4, 11], [12, 4, 11]], 'ladder': False},
-    '313323': {'node': [3, 1, 3], 'other_node': [3, 2, 3], 'open': False, 'blocks': [[11, 7, 11], [12, 7, 11]], 'ladder': False},
-    '323333': {'node': [3, 2, 3], 'other_node': [3, 3, 3], 'open': False, 'blocks': [[11, 10, 11], [12, 10, 11]], 'ladder': False},
-    '333343': {'node': [3, 3, 3], 'other_node': [3, 4, 3], 'open': False, 'blocks': [[11, 13, 11], [12, 13, 11]], 'ladder': False},
-    '343353': {'node': [3, 4, 3], 'other_node': [3, 5, 3], 'open': False, 'blocks': [[11, 16, 11], [12, 16, 11]], 'ladder': False},
-    '353363': {'node': [3, 5, 3], 'other_node': [3, 6, 3], 'open': False, 'blocks': [[11, 19, 11], [12, 19, 11]], 'ladder': False},
-    '304314': {'node': [3, 0, 4], 'other_node': [3, 1, 4], 'open': False, 'blocks': [[11, 4, 14], [12, 4, 14]], 'ladder': False},
-    '314324': {'node': [3, 1, 4], 'other_node': [3, 2, 4], 'open': False, 'blocks': [[11, 7, 14], [12, 7, 14]], 'ladder': False},
-    '324334': {'node': [3, 2, 4], 'other_node': [3, 3, 4], 'open': False, 'blocks': [[11, 10, 14], [12, 10, 14]], 'ladder': False},
-    '334344': {'node': [3, 3, 4], 'other_node': [3, 4, 4], 'open': False, 'blocks': [[11, 13, 14], [12, 13, 14]], 'ladder': False},
-    '344354': {'node': [3, 4, 4], 'other_node': [3, 5, 4], 'open': False, 'blocks': [[11, 16, 14], [12, 16, 14]], 'ladder': False},
-    '354364': {'node': [3, 5, 4], 'other_node': [3, 6, 4], 'open': False, 'blocks': [[11, 19, 14], [12, 19, 14]], 'ladder': False},
-    '305315': {'node': [3, 0, 5], 'other_node': [3, 1, 5], 'open': False, 'blocks': [[11, 4, 17], [12, 4, 17]], 'ladder': False},
-    '315325': {'node': [3, 1, 5], 'other_node': [3, 2, 5], 'open': False, 'blocks': [[11, 7, 17], [12, 7, 17]], 'ladder': False},
-    '325335': {'node': [3, 2, 5], 'other_node': [3, 3, 5], 'open': False, 'blocks': [[11, 10, 17], [12, 10, 17]], 'ladder': False},
-    '335345': {'node': [3, 3, 5], 'other_node': [3, 4, 5], 'open': False, 'blocks': [[11, 13, 17], [12, 13, 17]], 'ladder': False},
-    '345355': {'node': [3, 4, 5], 'other_node': [3, 5, 5], 'open': False, 'blocks': [[11, 16, 17], [12, 16, 17]], 'ladder': False},
-    '355365': {'node': [3, 5, 5], 'other_node': [3, 6, 5], 'open': False, 'blocks': [[11, 19, 17], [12, 19, 17]], 'ladder': False},
-    '306316': {'node': [3, 0, 6], 'other_node': [3, 1, 6], 'open': False, 'blocks': [[11, 4, 20], [12, 4, 20]], 'ladder': False},
-    '316326': {'node': [3, 1, 6], 'other_node': [3, 2, 6], 'open': False, 'blocks': [[11, 7, 20], [12, 7, 20]], 'ladder': False},
-    '326336': {'node': [3, 2, 6], 'other_node': [3, 3, 6], 'open': False, 'blocks': [[11, 10, 20], [12, 10, 20]], 'ladder': False},
-    '336346': {'node': [3, 3, 6], 'other_node': [3, 4, 6], 'open': False, 'blocks': [[11, 13, 20], [12, 13, 20]], 'ladder': False},
-    '346356': {'node': [3, 4, 6], 'other_node': [3, 5, 6], 'open': False, 'blocks': [[11, 16, 20], [12, 16, 20]], 'ladder': False},
-    '356366': {'node': [3, 5, 6], 'other_node': [3, 6, 6], 'open': False, 'blocks': [[11, 19, 20], [12, 19, 20]], 'ladder': False},
-}
+# These are the stock dimensions, which fit the
+# space allowed by a sharing stone.
+num_node_rows = 7
+num_node_columns = 7
+num_node_layers = 4
 
-included = set({})
-excluded = set({})
-directions = {}
+# Every kind of block also has a small integer code, so
+# the structure can be stored as one byte per block.
+class Block(IntEnum):
+    EMPTY = 0
+    BLOCK = 1
+    SCONCE = 2
+    LADDER = 3
+    START = 4
+    FINISH = 5
+    DOOR = 6
 
-def tostr(coords):
-    [layer, row, column] = coords
-    return '{}{}{}'.format(layer, row, column)
+BLOCK_LETTERS = 'OBSL12D'
+LETTERS_TO_CODES = bytes.maketrans(BLOCK_LETTERS.encode('ascii'), bytes(range(len(BLOCK_LETTERS))))
 
-def tolist(coords_str):
-    coords = [
-        int(coords_str[0]),
-        int(coords_str[1]),
-        int(coords_str[2]),
-    ]
-    return coords
+# The order block counts are listed in.
+COUNT_LETTERS = 'BS12LDO'
 
+def get_block_code(letter):
+    return BLOCK_LETTERS.index(letter)
 
-# Referencing a node (aka chamber) looks like this:
-# nodes[height][row][column]
-# where row starts at 0 and goes from west to
-# east, column starts at 0 and goes from north
-# to south, and height starts at 0 and goes
-# from bottom to top. Each node is a dictionary
-# of its attributes, including the indices of the
-# neighboring nodes and whether it has been visited
-num_node_rows = 7
-num_node_columns = 7
-num_node_layers = 4
-nodes = []
-for layer in range(num_node_layers):
-    nodes.append([])
-    for row in range(num_node_rows):
-        nodes[layer].append([])
-        for column in range(num_node_columns):
-            index = [layer, row, column]
-            nodes[layer][row].append({
-                'index': index,
-                'neighbors': [],
-                'included': False,
-            })
-            excluded.add(tostr(index))
-for key in edges:
-    edge = edges[key]
-    [layer, row, column] = edge['node']
-    [other_layer, other_row, other_column] = edge['other_node']
-    nodes[layer][row][column]['neighbors'].append([other_layer, other_row, other_column])
-    nodes[other_layer][other_row][other_column]['neighbors'].append([layer, row, column])
+def get_counts_dict(code_counts):
+    # Block counts by letter, from counts indexed by Block code.
+    return {letter: code_counts[get_block_code(letter)] for letter in COUNT_LETTERS}
 
-### STEPS ###
-'''
-1. add start node to maze (mark on node itself, add to included set, remove from excluded set)
-2. repeat while excluded set is non-empty:
-   1. do a random walk to discover potentials
-      1. choose a new random node not in the maze, called potential_start
-      2. set a new set called potentials to be an empty set
-      3. add potential_start to potentials (add as string)
-      4. set current to potential_start
-      5. repeat while current is not in maze:
-         1. randomly walk (update current to a random neighbor)
-         2. add current to potentials
-         3. record the neighbor walked to in directions dict only if not recorded for that node yet
-   2. do a real walk following recorded directions
-      1. set current to potential_start
-      2. repeat while current is not in maze:
-         1. remove current node from potentials
-         2. add current node to maze
-         3. walk to the neighbor denoted by directions dict (update current to be neighbor)
-         4. mark the traversed edge as open
-         5. mark the traversed edge's blocks with the new letter for being open
-'''
+# numpy is optional, and only imported once the numpy backend
+# is used: importing it takes longer than everything else at
+# startup, and most runs never need it.
+def import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('the numpy backend needs numpy to be installed') from None
+    return numpy
+
+def is_numpy_array(value):
+    # Never imports numpy: if it hasn't been imported yet,
+    # nothing can be a numpy array.
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+def get_layer_codes(layer):
+    if is_numpy_array(layer):
+        return layer.astype('uint8').tobytes()
+    return ''.join(''.join(row) for row in layer).encode('ascii').translate(LETTERS_TO_CODES)
+
+### SEEDS ###
+# Every maze is made from a 64-bit seed with a random.Random
+# of its own, never the shared one in the random module, and
+# the seed is kept with the maze so it can be made again.
+# Bigger jobs (a batch, the tiles of a tiled maze) take one
+# root seed, and each part of them gets its own seed derived
+# from it.
 
-def add_to_maze(node):
+SEED_LIMIT = 1 << 64
+
+def get_seed(seed=None):
+    # The seed to make something from, or a new one if none is
+    # given. Seeds have to be in range(SEED_LIMIT): random.Random
+    # seeds from the absolute value of a negative int, so -5
+    # would make the same maze as 5 but record another seed,
+    # and anything bigger wouldn't fit in a maze file.
+    if seed is None:
+        return new_seed()
+    if isinstance(seed, bool) or not isinstance(seed, int) or not 0 <= seed < SEED_LIMIT:
+        raise ValueError('seed must be an int from 0 to 2**64 - 1, not {!r}'.format(seed))
+    return seed
+
+def new_seed():
+    # Straight from the OS, so processes forked from the same
+    # parent don't all come up with the same seed.
+    return random.SystemRandom().getrandbits(64)
+
+def derive_seed(seed, *path):
+    # The seed for one part of a job, such as derive_seed(seed, 3)
+    # for the fourth maze of a batch. It is a hash of the root
+    # seed and the part, so every part gets a stream of its own,
+    # and it doesn't matter how many parts there are, or which
+    # ones are made where or in what order.
+    key = repr((seed,) + path).encode('ascii')
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+### GEOMETRY ###
+# Each of these maps a node to the blocks it owns.
+# The block layer (layer + 1) * 3 - 2 is the floor under
+# a chamber, (layer + 1) * 3 - 1 and (layer + 1) * 3 are
+# the two layers of air inside it. The same goes for rows
+# and columns, where the wall sits at (row + 1) * 3 + 1.
+
+def get_floor_layer(layer):
+    return (layer + 1) * 3 - 2
+
+def get_chamber_blocks(node):
     [layer, row, column] = node
-    nodes[layer][row][column]['included'] = True
-    node_string = tostr(node)
-    included.add(node_string)
-    excluded.discard(node_string)
+    chamber_blocks = []
+    for block_layer in [(layer + 1) * 3 - 1, (layer + 1) * 3]:
+        for block_row in [(row + 1) * 3 - 1, (row + 1) * 3]:
+            for block_column in [(column + 1) * 3 - 1, (column + 1) * 3]:
+                chamber_blocks.append([block_layer, block_row, block_column])
+    return chamber_blocks
 
-def walk(node):
+def get_chamber_ladder_blocks(node):
     [layer, row, column] = node
-    neighbors = [tostr(n) for n in nodes[layer][row][column]['neighbors']]
-    new_node_string = random.choice(neighbors)
-    # Record the direction we went if not recorded yet
-    directions[tostr(node)] = directions.get(tostr(node), new_node_string)
-    return tolist(new_node_string)
-
-def walk_direction(node):
-    new_node_string = directions[tostr(node)]
-    return tolist(new_node_string)
-
-def mark_edge_as_open(node1, node2):
-    key1 = ''.join([tostr(node1), tostr(node2)])
-    key2 = ''.join([tostr(node2), tostr(node1)])
-    edge = edges[key1] if key1 in edges else edges[key2]
-    edge['open'] = True
-    for block in edge['blocks']:
-        [l, r, c] = block
-        blocks[l][r][c] = 'L' if edge['ladder'] else 'O'
+    block1_layer = (layer + 1) * 3 - 1
+    block1_row = (row + 1) * 3 - 1
+    block1_column = (column + 1) * 3
+    block2_layer = (layer + 1) * 3
+    block2_row = (row + 1) * 3 - 1
+    block2_column = (column + 1) * 3
+    block1 = [block1_layer, block1_row, block1_column]
+    block2 = [block2_layer, block2_row, block2_column]
+    return [block1, block2]
+
+def get_chamber_sconce_block(node):
+    [layer, row, column] = node
+    block_layer = (layer + 1) * 3
+    block_row = (row + 1) * 3
+    block_column = (column + 1) * 3
+    block = [block_layer, block_row, block_column]
+    return block
+
+def get_east_edge_blocks(node):
+    [layer, row, column] = node
+    block1_layer = (layer + 1) * 3 - 1
+    block1_row = (row + 1) * 3
+    block1_column = (column + 1) * 3 + 1
+    block2_layer = (layer + 1) * 3
+    block2_row = (row + 1) * 3
+    block2_column = (column + 1) * 3 + 1
+    block1 = [block1_layer, block1_row, block1_column]
+    block2 = [block2_layer, block2_row, block2_column]
+    return [block1, block2]
 
 def get_south_edge_blocks(node):
     [layer, row, column] = node
@@ -1232,6 +329,14 @@ def get_south_edge_blocks(node):
     block2 = [block2_layer, block2_row, block2_column]
     return [block1, block2]
 
+def get_up_edge_blocks(node):
+    [layer, row, column] = node
+    block_layer = (layer + 1) * 3 + 1
+    block_row = (row + 1) * 3 - 1
+    block_column = (column + 1) * 3
+    block = [block_layer, block_row, block_column]
+    return [block]
+
 def get_start_platform_blocks(node):
     [layer, row, column] = node
     block1_layer = (layer + 1) * 3 - 2
@@ -1288,7 +393,1451 @@ def get_finish_signpost_block(node):
     block = [block_layer, block_row, block_column]
     return block
 
-def print_results():
+def build_layer(geometry, l):
+    # Start with nothing but air, then fill in the shell
+    # inside the ring of empty blocks: a solid floor under
+    # every floor of chambers plus the roof, and solid walls
+    # around the chambers. Then hollow out each chamber and
+    # put its ladder and sconce in.
+    layer_blocks = [['O'] * geometry.num_block_columns for row in range(geometry.num_block_rows)]
+    if l < 1 or l > get_floor_layer(geometry.num_node_layers):
+        return layer_blocks
+    for r in range(1, geometry.num_block_rows - 1):
+        for c in range(1, geometry.num_block_columns - 1):
+            layer_blocks[r][c] = 'B'
+    if (l - 1) % 3 == 0:
+        return layer_blocks
+    layer = (l - 2) // 3
+    for row in range(geometry.num_node_rows):
+        for column in range(geometry.num_node_columns):
+            node = [layer, row, column]
+            for block in get_chamber_blocks(node):
+                [block_layer, r, c] = block
+                if block_layer == l:
+                    layer_blocks[r][c] = 'O'
+            for block in get_chamber_ladder_blocks(node):
+                [block_layer, r, c] = block
+                if block_layer == l:
+                    layer_blocks[r][c] = 'L'
+            [block_layer, r, c] = get_chamber_sconce_block(node)
+            if block_layer == l:
+                layer_blocks[r][c] = 'S'
+    return layer_blocks
+
+def build_blocks(geometry):
+    return [build_layer(geometry, l) for l in range(geometry.num_block_layers)]
+
+# Every edge leads east, south or up out of the first of
+# the two nodes it connects.
+EAST = 0
+SOUTH = 1
+UP = 2
+
+EDGE_BLOCK_FUNCTIONS = [get_east_edge_blocks, get_south_edge_blocks, get_up_edge_blocks]
+
+# An edge id is the position of the edge in the order
+# build_edges makes them in: for every floor, the ladders up
+# into it from the floor below, then its west-to-east edges,
+# then its north-to-south edges. Nothing is kept for an edge
+# but its two node ids and its direction, in flat arrays.
+# The blocks it affects are worked out from those whenever
+# they are needed. Whether an edge is open is up to each
+# maze, which keeps one byte per edge id for it.
+def build_edges(geometry):
+    # Returns the edge_nodes, edge_other_nodes and
+    # edge_directions arrays, indexed by edge id.
+    rows = geometry.num_node_rows
+    columns = geometry.num_node_columns
+    floor_size = rows * columns
+    edge_nodes = array('i')
+    edge_other_nodes = array('i')
+    edge_directions = bytearray()
+
+    def add_edges(nodes, step, direction):
+        edge_nodes.extend(nodes)
+        edge_other_nodes.extend(range(nodes.start + step, nodes.stop + step, nodes.step))
+        edge_directions.extend(bytes([direction]) * len(nodes))
+
+    for layer in range(geometry.num_node_layers):
+        first = layer * floor_size
+        # Bottom-to-top edges from the floor below
+        if layer > 0:
+            add_edges(range(first - floor_size, first), floor_size, UP)
+
+        # West-to-east edges
+        for row in range(rows):
+            add_edges(range(first + row * columns, first + (row + 1) * columns - 1), 1, EAST)
+
+        # North-to-south edges
+        for column in range(columns):
+            add_edges(range(first + column, first + (rows - 1) * columns + column, columns), columns, SOUTH)
+    return edge_nodes, edge_other_nodes, edge_directions
+
+# The neighbors of every node are kept in one flat table,
+# CSR style: the neighbors of node n are neighbor_nodes[i]
+# for i in range(neighbor_offsets[n], neighbor_offsets[n + 1]),
+# and neighbor_edges[i] is the edge that leads there. An
+# index i into these arrays is called a slot.
+def build_neighbor_table(geometry):
+    num_nodes = geometry.num_nodes
+    degrees = [0] * num_nodes
+    for node in geometry.edge_nodes:
+        degrees[node] += 1
+    for other_node in geometry.edge_other_nodes:
+        degrees[other_node] += 1
+    neighbor_offsets = array('i', [0]) * (num_nodes + 1)
+    for node in range(num_nodes):
+        neighbor_offsets[node + 1] = neighbor_offsets[node] + degrees[node]
+    neighbor_nodes = array('i', [0]) * neighbor_offsets[num_nodes]
+    neighbor_edges = array('i', [0]) * neighbor_offsets[num_nodes]
+    cursors = array('i', neighbor_offsets[:num_nodes])
+    for edge_id, [node, other_node] in enumerate(zip(geometry.edge_nodes, geometry.edge_other_nodes)):
+        neighbor_nodes[cursors[node]] = other_node
+        neighbor_edges[cursors[node]] = edge_id
+        cursors[node] += 1
+        neighbor_nodes[cursors[other_node]] = node
+        neighbor_edges[cursors[other_node]] = edge_id
+        cursors[other_node] += 1
+    return neighbor_offsets, neighbor_nodes, neighbor_edges
+
+class Geometry:
+    # Everything about a maze that depends only on its
+    # dimensions in chambers: the edges, the neighbor table
+    # and where all the blocks go. It never changes once
+    # built, so one is shared by every maze of that size.
+    #
+    # Referencing a block looks like this:
+    # blocks[height][row][column]
+    # where row starts at 0 and goes from west to
+    # east, column starts at 0 and goes from north
+    # to south, and height starts at 0 and goes
+    # from bottom to top.
+    # Every chamber takes up 3 blocks in each direction
+    # (2 of air plus 1 of wall or ceiling), and the
+    # structure is padded with a ring of empty blocks
+    # on every side, an empty layer below it, and two
+    # empty layers above the roof for the exit ladder.
+    #
+    # Nodes are referred to by a dense integer id rather
+    # than by their [layer, row, column] coordinates, so
+    # the walk can keep all its state in flat arrays.
+    def __init__(self, num_node_layers, num_node_rows, num_node_columns):
+        self.num_node_layers = num_node_layers
+        self.num_node_rows = num_node_rows
+        self.num_node_columns = num_node_columns
+        self.num_nodes = num_node_layers * num_node_rows * num_node_columns
+        self.num_block_layers = (num_node_layers + 1) * 3 + 1
+        self.num_block_rows = (num_node_rows + 1) * 3
+        self.num_block_columns = (num_node_columns + 1) * 3
+        self.floor_size = num_node_rows * num_node_columns
+        self.num_floor_edges = num_node_rows * (num_node_columns - 1) + num_node_columns * (num_node_rows - 1)
+        [self.edge_nodes, self.edge_other_nodes, self.edge_directions] = build_edges(self)
+        self.num_edges = len(self.edge_nodes)
+        [self.neighbor_offsets, self.neighbor_nodes, self.neighbor_edges] = build_neighbor_table(self)
+        self.edge_block_index = None
+        self.block_template = None
+        self.template_layer_counts = None
+        # Templates a Maze copies over its state to reset it
+        self.node_ids = array('i', range(self.num_nodes))
+        self.no_nodes = bytes(self.num_nodes)
+        self.no_edges = bytes(self.num_edges)
+
+    def get_dimensions(self):
+        return (self.num_node_layers, self.num_node_rows, self.num_node_columns)
+
+    def get_node_id(self, node):
+        [layer, row, column] = node
+        return (layer * self.num_node_rows + row) * self.num_node_columns + column
+
+    def get_node(self, node_id):
+        rest, column = divmod(node_id, self.num_node_columns)
+        layer, row = divmod(rest, self.num_node_rows)
+        return [layer, row, column]
+
+    def is_ladder(self, edge_id):
+        return self.edge_directions[edge_id] == UP
+
+    def get_edge_blocks(self, edge_id):
+        # The blocks an edge opens up, as [layer, row, column].
+        get_blocks = EDGE_BLOCK_FUNCTIONS[self.edge_directions[edge_id]]
+        return get_blocks(self.get_node(self.edge_nodes[edge_id]))
+
+    def get_first_edge(self, layer):
+        # The id of the first edge of a floor of chambers.
+        if layer == 0:
+            return 0
+        return self.num_floor_edges + (layer - 1) * (self.floor_size + self.num_floor_edges)
+
+    def get_layer_edge_blocks(self, l):
+        # The blocks of the edges that cross block layer l, as
+        # (edge_id, row, column, letter when open). These are the
+        # blocks of get_edge_blocks, only worked out a whole
+        # layer at a time: the ladders up through a floor, or
+        # the walls between the chambers of a floor.
+        rows = self.num_node_rows
+        columns = self.num_node_columns
+        edge_blocks = []
+        if l % 3 == 1:
+            layer = (l - 1) // 3
+            if not 0 < layer < self.num_node_layers:
+                return edge_blocks
+            first = self.get_first_edge(layer)
+            return [
+                (first + row * columns + column, (row + 1) * 3 - 1, (column + 1) * 3, 'L')
+                for row in range(rows)
+                for column in range(columns)
+            ]
+        layer = (l - 2) // 3
+        if not 0 <= layer < self.num_node_layers:
+            return edge_blocks
+        first = self.get_first_edge(layer) + (self.floor_size if layer > 0 else 0)
+        edge_blocks = [
+            (first + row * (columns - 1) + column, (row + 1) * 3, (column + 1) * 3 + 1, 'O')
+            for row in range(rows)
+            for column in range(columns - 1)
+        ]
+        first += rows * (columns - 1)
+        edge_blocks.extend(
+            (first + column * (rows - 1) + row, (row + 1) * 3 + 1, (column + 1) * 3 - 1, 'O')
+            for column in range(columns)
+            for row in range(rows - 1)
+        )
+        return edge_blocks
+
+    def get_block_offset(self, block):
+        # Where a block sits in a flat, layer by layer, row by
+        # row, array of the whole structure.
+        [l, r, c] = block
+        return (l * self.num_block_rows + r) * self.num_block_columns + c
+
+    def get_block_template(self):
+        # The Block codes of the structure before any edges are
+        # opened, as a flat bytes object.
+        if self.block_template is None:
+            self.block_template = b''.join(
+                get_layer_codes(build_layer(self, l)) for l in range(self.num_block_layers)
+            )
+        return self.block_template
+
+    def get_template_layer_counts(self):
+        # How many blocks of each code every layer of the block
+        # template has, as arrays indexed by Block code.
+        if self.template_layer_counts is None:
+            template = self.get_block_template()
+            layer_size = self.num_block_rows * self.num_block_columns
+            self.template_layer_counts = [
+                array('i', [template.count(code, l * layer_size, (l + 1) * layer_size) for code in Block])
+                for l in range(self.num_block_layers)
+            ]
+        return self.template_layer_counts
+
+    def get_edge_block_index(self):
+        if self.edge_block_index is None:
+            self.edge_block_index = build_edge_block_index(self)
+        return self.edge_block_index
+
+def get_num_edges(dimensions):
+    # How many edges a maze of these dimensions has, without
+    # building its Geometry.
+    [layers, rows, columns] = dimensions
+    num_floor_edges = rows * (columns - 1) + columns * (rows - 1)
+    return layers * num_floor_edges + (layers - 1) * rows * columns
+
+# Geometries are only built when first asked for, and then
+# kept for the next maze of the same dimensions.
+geometries = {}
+
+def check_dimensions(dimensions):
+    # A maze needs at least one floor and one column of
+    # chambers, and two rows, since the finish goes in the
+    # north half of the top floor.
+    if not (
+        len(dimensions) == 3
+        and all(isinstance(n, int) and not isinstance(n, bool) for n in dimensions)
+        and dimensions[0] >= 1 and dimensions[1] >= 2 and dimensions[2] >= 1
+    ):
+        raise ValueError('a maze needs at least 1 layer, 2 rows and 1 column of chambers, not {!r}'.format(dimensions))
+
+def check_tiles(tiles):
+    if not (
+        len(tiles) == 2
+        and all(isinstance(n, int) and not isinstance(n, bool) and n >= 1 for n in tiles)
+    ):
+        raise ValueError('tiles must be at least 1 row and 1 column of tiles, not {!r}'.format(tiles))
+
+def get_geometry(dimensions=None):
+    # dimensions is [layers, rows, columns] of chambers.
+    if dimensions is None:
+        dimensions = [num_node_layers, num_node_rows, num_node_columns]
+    key = tuple(dimensions)
+    if key not in geometries:
+        check_dimensions(key)
+        geometries[key] = Geometry(*key)
+    return geometries[key]
+
+### STEPS ###
+'''
+1. add start node to maze (mark it in included, remove it from excluded)
+2. repeat while excluded is non-empty:
+   1. do a random walk to discover potentials
+      1. choose a new random node not in the maze, called potential_start
+      2. set current to potential_start
+      3. repeat while current is not in maze:
+         1. randomly walk (update current to a random neighbor)
+         2. record the slot walked through in directions, overwriting
+            whatever was recorded for that node before. Only the last
+            exit from each node survives, which erases any loops the
+            walk made.
+   2. do a real walk following recorded directions
+      1. set current to potential_start
+      2. repeat while current is not in maze:
+         1. add current node to maze
+         2. walk to the neighbor denoted by directions (update current to be neighbor)
+         3. mark the traversed edge as open
+3. check that the open edges form a spanning tree
+4. mark the blocks of every open edge with the new letter for being open
+
+Wilson's algorithm is the default, but any algorithm that
+opens the edges of a spanning tree can stand in for step 2.
+See ALGORITHMS for the ones available.
+'''
+
+def find_root(parents, node):
+    # Union-find lookup with path halving: every node on the
+    # way gets pointed at its grandparent, so later lookups
+    # take fewer steps.
+    while parents[node] != node:
+        parents[node] = parents[parents[node]]
+        node = parents[node]
+    return node
+
+def choose_start_finish(rng, dimensions):
+    # The start is somewhere along the south side of the
+    # bottom floor, and the finish somewhere in the north half
+    # of the top floor.
+    check_dimensions(dimensions)
+    [layers, rows, columns] = dimensions
+    start_layer = 0
+    start_row = rows - 1
+    start_column = rng.choice(range(columns))
+    start_node = [start_layer, start_row, start_column]
+
+    finish_layer = layers - 1
+    finish_row = rng.choice(range(rows // 2)) # Somewhere in the north half
+    finish_column = rng.choice(range(columns))
+    finish_node = [finish_layer, finish_row, finish_column]
+    return [start_node, finish_node]
+
+# Eller's algorithm makes the maze one floor at a time, only
+# ever knowing which set each chamber of the current floor
+# is in (chambers in the same set are already connected,
+# through this floor or the ones below):
+# 1. chambers reached by a ladder from below join the set
+#    of the chamber the ladder came from, the others start
+#    a set of their own
+# 2. go through the floor's edges in random order, opening
+#    some of the ones between different sets and merging
+#    those sets (on the top floor, open all of them, which
+#    leaves one set)
+# 3. open at least one ladder up out of every set, plus a
+#    few more at random, and carry the sets up with them
+# The edges of a floor are numbered like the edges of a one
+# floor Geometry: west-to-east, then north-to-south, and the
+# ladders up like the chambers of the floor.
+ELLER_JOIN_CHANCE = 0.5
+ELLER_UP_CHANCE = 0.25
+
+def iter_eller_floors(rng, num_node_layers, num_node_rows, num_node_columns):
+    # Yields [floor_open, up_open] for every floor from the
+    # bottom up: one byte per edge of the floor and one per
+    # ladder up out of it (none for the top floor).
+    floor_geometry = get_geometry([1, num_node_rows, num_node_columns])
+    edge_nodes = floor_geometry.edge_nodes
+    edge_other_nodes = floor_geometry.edge_other_nodes
+    num_floor_edges = floor_geometry.num_edges
+    num_cells = floor_geometry.num_nodes
+    carried = None
+    for layer in range(num_node_layers):
+        is_top = layer == num_node_layers - 1
+
+        # 1. join the sets carried up from below
+        parents = array('i', floor_geometry.node_ids)
+        if carried is not None:
+            firsts = {}
+            for cell in range(num_cells):
+                label = carried[cell]
+                if label < 0:
+                    continue
+                if label in firsts:
+                    parents[cell] = firsts[label]
+                else:
+                    firsts[label] = cell
+
+        # 2. open edges between different sets
+        floor_open = bytearray(num_floor_edges)
+        edge_order = list(range(num_floor_edges))
+        rng.shuffle(edge_order)
+        for edge_id in edge_order:
+            root = find_root(parents, edge_nodes[edge_id])
+            other_root = find_root(parents, edge_other_nodes[edge_id])
+            if root != other_root and (is_top or rng.random() < ELLER_JOIN_CHANCE):
+                parents[root] = other_root
+                floor_open[edge_id] = 1
+        if is_top:
+            yield [floor_open, b'']
+            return
+
+        # 3. open ladders up out of every set
+        members = {}
+        for cell in range(num_cells):
+            members.setdefault(find_root(parents, cell), []).append(cell)
+        up_open = bytearray(num_cells)
+        carried = array('i', [-1]) * num_cells
+        for root, cells in members.items():
+            chosen = rng.choice(cells)
+            for cell in cells:
+                if cell == chosen or rng.random() < ELLER_UP_CHANCE:
+                    up_open[cell] = 1
+                    carried[cell] = root
+        yield [floor_open, up_open]
+
+### MAZE ###
+class Maze:
+    # All the state of one maze being made: which nodes are in
+    # it so far, where the walk went, which edges are open and
+    # the Block codes of the structure (flat, in the order of
+    # Geometry.get_block_offset). Everything is allocated once
+    # and reset in place by copying templates over it, so one
+    # Maze can make maze after maze:
+    #   maze = Maze()
+    #   for seed in seeds:
+    #       result = maze.generate(seed)
+    #
+    # included[n] is 1 once node n is part of the maze. The
+    # nodes that are not are kept packed in excluded, with
+    # excluded_positions telling where each one sits so it
+    # can be swapped out in constant time. directions[n] is
+    # the slot the walk left node n through.
+    #
+    # counts and layer_counts keep how many blocks of each code
+    # there are in blocks, overall and in each layer. Writing
+    # to blocks through set_block keeps them up to date.
+    # Generating a maze never needs the blocks, so they and
+    # their counts are only made once something asks for them
+    # (see allocate_blocks), and carved tells whether they
+    # have been changed since.
+    #
+    # With stats set, every result also gets a dict of how
+    # the making of it went (see get_stats).
+    def __init__(self, dimensions=None, stats=False):
+        geometry = get_geometry(dimensions)
+        self.geometry = geometry
+        self.collect_stats = stats
+        self.stats = None
+        self.num_walks = 0
+        self.num_walk_steps = 0
+        self.num_erased_steps = 0
+        self.rng = random.Random()
+        self.seed = None
+        self.algorithm = None
+        self.start_node = None
+        self.finish_node = None
+        self.included = bytearray(geometry.num_nodes)
+        self.excluded = array('i', geometry.node_ids)
+        self.excluded_positions = array('i', geometry.node_ids)
+        self.directions = array('i', [-1]) * geometry.num_nodes
+        self.open_edges = bytearray(geometry.num_edges)
+        self.blocks = None
+        self.layer_counts = None
+        self.counts = None
+        self.carved = False
+
+    def reset(self, seed=None):
+        # Always record a seed, so that any maze can be made again.
+        seed = get_seed(seed)
+        geometry = self.geometry
+        self.seed = seed
+        self.rng.seed(seed)
+        self.start_node = None
+        self.finish_node = None
+        self.stats = None
+        self.num_walks = 0
+        self.num_walk_steps = 0
+        self.num_erased_steps = 0
+        self.included[:] = geometry.no_nodes
+        self.excluded[:] = geometry.node_ids
+        self.excluded_positions[:] = geometry.node_ids
+        self.open_edges[:] = geometry.no_edges
+        if self.carved:
+            self.blocks[:] = geometry.get_block_template()
+            for counts, template_counts in zip(self.layer_counts, geometry.get_template_layer_counts()):
+                counts[:] = template_counts
+            self.counts[:] = array('i', map(sum, zip(*self.layer_counts)))
+            self.carved = False
+
+    def allocate_blocks(self):
+        if self.blocks is None:
+            geometry = self.geometry
+            self.blocks = bytearray(geometry.get_block_template())
+            self.layer_counts = [array('i', counts) for counts in geometry.get_template_layer_counts()]
+            self.counts = array('i', map(sum, zip(*self.layer_counts)))
+
+    def add_to_maze(self, node):
+        self.included[node] = 1
+        position = self.excluded_positions[node]
+        last = self.excluded.pop()
+        if last != node:
+            self.excluded[position] = last
+            self.excluded_positions[last] = position
+
+    def run_wilson(self, start):
+        rng = self.rng
+        included = self.included
+        excluded = self.excluded
+        directions = self.directions
+        open_edges = self.open_edges
+        neighbor_offsets = self.geometry.neighbor_offsets
+        neighbor_nodes = self.geometry.neighbor_nodes
+        neighbor_edges = self.geometry.neighbor_edges
+
+        num_walks = 0
+        num_steps = 0
+        self.add_to_maze(start)
+        while len(excluded) > 0:
+            # do a random walk to discover potentials
+            num_walks += 1
+            potential_start = rng.choice(excluded)
+            current = potential_start
+            while not included[current]:
+                num_steps += 1
+                slot = rng.randrange(neighbor_offsets[current], neighbor_offsets[current + 1])
+                # Record the direction we went, replacing any earlier one
+                directions[current] = slot
+                current = neighbor_nodes[slot]
+
+            # do a real walk based on recorded directions. Every
+            # node on the way had its direction recorded during
+            # this walk, so this follows the loop-erased path.
+            current = potential_start
+            while not included[current]:
+                self.add_to_maze(current)
+                slot = directions[current]
+                current = neighbor_nodes[slot]
+                open_edges[neighbor_edges[slot]] = 1
+
+        # Every step that didn't end up on a real walk was
+        # erased along with some loop.
+        self.num_walks = num_walks
+        self.num_walk_steps = num_steps
+        self.num_erased_steps = num_steps - (self.geometry.num_nodes - 1)
+
+    def run_kruskal(self, start):
+        # Open the edges in random order, skipping any that would
+        # join two nodes that are already connected.
+        geometry = self.geometry
+        edge_nodes = geometry.edge_nodes
+        edge_other_nodes = geometry.edge_other_nodes
+        open_edges = self.open_edges
+        parents = array('i', geometry.node_ids)
+        edge_order = list(range(geometry.num_edges))
+        self.rng.shuffle(edge_order)
+        num_joins = geometry.num_nodes - 1
+        for edge_id in edge_order:
+            if num_joins == 0:
+                break
+            root = find_root(parents, edge_nodes[edge_id])
+            other_root = find_root(parents, edge_other_nodes[edge_id])
+            if root != other_root:
+                parents[root] = other_root
+                open_edges[edge_id] = 1
+                num_joins -= 1
+
+    def run_aldous_broder(self, start):
+        # Wander at random, opening the way into every node the
+        # first time it is reached.
+        rng = self.rng
+        included = self.included
+        open_edges = self.open_edges
+        neighbor_offsets = self.geometry.neighbor_offsets
+        neighbor_nodes = self.geometry.neighbor_nodes
+        neighbor_edges = self.geometry.neighbor_edges
+
+        included[start] = 1
+        num_left = self.geometry.num_nodes - 1
+        num_steps = 0
+        current = start
+        while num_left > 0:
+            num_steps += 1
+            slot = rng.randrange(neighbor_offsets[current], neighbor_offsets[current + 1])
+            current = neighbor_nodes[slot]
+            if not included[current]:
+                included[current] = 1
+                open_edges[neighbor_edges[slot]] = 1
+                num_left -= 1
+        self.num_walks = 1
+        self.num_walk_steps = num_steps
+
+    def run_backtracker(self, start):
+        # Depth first: keep digging into a random new neighbor,
+        # backing up whenever there is none left. The path dug
+        # so far is kept on a list instead of the call stack.
+        rng = self.rng
+        included = self.included
+        open_edges = self.open_edges
+        neighbor_offsets = self.geometry.neighbor_offsets
+        neighbor_nodes = self.geometry.neighbor_nodes
+        neighbor_edges = self.geometry.neighbor_edges
+
+        included[start] = 1
+        stack = [start]
+        while stack:
+            current = stack[-1]
+            slots = [
+                slot for slot in range(neighbor_offsets[current], neighbor_offsets[current + 1])
+                if not included[neighbor_nodes[slot]]
+            ]
+            if not slots:
+                stack.pop()
+                continue
+            slot = rng.choice(slots)
+            current = neighbor_nodes[slot]
+            included[current] = 1
+            open_edges[neighbor_edges[slot]] = 1
+            stack.append(current)
+
+    def run_prim(self, start):
+        # Grow the maze from the start by opening a random edge
+        # out of it each time. The frontier holds slots leading
+        # out of the maze; ones that have since been swallowed
+        # up are skipped when they come up.
+        rng = self.rng
+        included = self.included
+        open_edges = self.open_edges
+        neighbor_offsets = self.geometry.neighbor_offsets
+        neighbor_nodes = self.geometry.neighbor_nodes
+        neighbor_edges = self.geometry.neighbor_edges
+
+        included[start] = 1
+        frontier = list(range(neighbor_offsets[start], neighbor_offsets[start + 1]))
+        while frontier:
+            i = rng.randrange(len(frontier))
+            slot = frontier[i]
+            frontier[i] = frontier[-1]
+            frontier.pop()
+            current = neighbor_nodes[slot]
+            if included[current]:
+                continue
+            included[current] = 1
+            open_edges[neighbor_edges[slot]] = 1
+            frontier.extend(range(neighbor_offsets[current], neighbor_offsets[current + 1]))
+
+    def run_eller(self, start):
+        # Every floor's edges come right after the ladders up
+        # into it, so the open edges of the whole maze are just
+        # what each floor gives, one after the other.
+        geometry = self.geometry
+        parts = []
+        for [floor_open, up_open] in iter_eller_floors(self.rng, *geometry.get_dimensions()):
+            parts.append(floor_open)
+            parts.append(up_open)
+        self.open_edges[:] = b''.join(parts)
+
+    def generate(self, seed=None, algorithm='wilson', finish='random'):
+        # finish is 'random', 'farthest' or a [low, high] range of
+        # path lengths for the finish to be at (see choose_finish).
+        if algorithm not in ALGORITHMS:
+            raise ValueError('unknown algorithm {!r}, expected one of {}'.format(algorithm, ', '.join(ALGORITHMS)))
+        check_finish(finish)
+        self.reset(seed)
+        self.algorithm = algorithm
+        rng = self.rng
+        geometry = self.geometry
+
+        [self.start_node, self.finish_node] = choose_start_finish(rng, geometry.get_dimensions())
+        started = time.perf_counter()
+        ALGORITHMS[algorithm](self, geometry.get_node_id(self.start_node))
+        walked = time.perf_counter()
+        check_spanning_tree(geometry, self.open_edges)
+        checked = time.perf_counter()
+        if finish != 'random':
+            self.finish_node = choose_finish(rng, geometry, self.open_edges, self.start_node, finish)
+        if self.collect_stats:
+            self.stats = self.get_stats([walked - started, checked - walked, time.perf_counter() - checked])
+        return self.get_result()
+
+    def get_stats(self, seconds):
+        # walks           random walks started
+        # walk_steps      steps taken by them
+        # erased_steps    steps erased along with a loop
+        # edges_opened    edges opened
+        # block_writes    blocks written by carving the open edges
+        #                 and placing the entrance and exit
+        # seconds         wall time of each phase: the walk (or
+        #                 whatever the algorithm does), the check,
+        #                 placing the finish, and once they are
+        #                 done, carving, the entrance and exit, and
+        #                 rendering. Carving and the entrance and
+        #                 exit are done while rendering, by
+        #                 iter_layers or carve_volume (or by
+        #                 Maze.carve), so render includes them.
+        [walk_seconds, check_seconds, finish_seconds] = seconds
+        return {
+            'walks': self.num_walks,
+            'walk_steps': self.num_walk_steps,
+            'erased_steps': self.num_erased_steps,
+            'edges_opened': sum(self.open_edges),
+            'block_writes': 0,
+            'seconds': {
+                'walk': walk_seconds,
+                'check': check_seconds,
+                'finish': finish_seconds,
+            },
+        }
+
+    def get_result(self):
+        return MazeResult(
+            self.geometry.get_dimensions(),
+            self.seed,
+            self.algorithm,
+            self.start_node,
+            self.finish_node,
+            bytes(self.open_edges),
+            self.stats,
+        )
+
+    def carve(self):
+        # Write the open edges and the entrance and exit into
+        # blocks. Only needed when the blocks themselves are.
+        self.allocate_blocks()
+        geometry = self.geometry
+        started = time.perf_counter()
+        num_writes = 0
+        for edge_id, is_open in enumerate(self.open_edges):
+            if is_open:
+                code = Block.LADDER if geometry.is_ladder(edge_id) else Block.EMPTY
+                edge_blocks = geometry.get_edge_blocks(edge_id)
+                for block in edge_blocks:
+                    self.set_block(block, code)
+                num_writes += len(edge_blocks)
+        carved = time.perf_counter()
+        placements = get_entrance_exit_blocks(self.start_node, self.finish_node)
+        for [block, letter] in placements:
+            self.set_block(block, get_block_code(letter))
+        self.carved = True
+        if self.stats is not None:
+            self.stats['block_writes'] += num_writes + len(placements)
+            add_seconds(self.stats, 'carve', carved - started)
+            add_seconds(self.stats, 'entrance_exit', time.perf_counter() - carved)
+
+    def set_block(self, block, code):
+        # Every write to blocks, carving or by hand, goes through
+        # here, so the counts always match what is in blocks.
+        self.allocate_blocks()
+        offset = self.geometry.get_block_offset(block)
+        old_code = self.blocks[offset]
+        if old_code == code:
+            return
+        layer_counts = self.layer_counts[block[0]]
+        layer_counts[old_code] -= 1
+        layer_counts[code] += 1
+        self.counts[old_code] -= 1
+        self.counts[code] += 1
+        self.blocks[offset] = code
+        self.carved = True
+
+    def get_counts(self, l=None):
+        # Block counts by letter, of the whole structure or of
+        # layer l, straight from the counts kept up to date.
+        self.allocate_blocks()
+        if l is None:
+            return get_counts_dict(self.counts)
+        return get_counts_dict(self.layer_counts[l])
+
+    def get_layer(self, l):
+        # Block codes of one layer as a rows x columns memoryview.
+        self.allocate_blocks()
+        geometry = self.geometry
+        layer_size = geometry.num_block_rows * geometry.num_block_columns
+        layer = memoryview(self.blocks)[l * layer_size:(l + 1) * layer_size]
+        return layer.cast('B', [geometry.num_block_rows, geometry.num_block_columns])
+
+    def get_volume(self):
+        # All block codes as a numpy array sharing memory with blocks.
+        np = import_numpy()
+        self.allocate_blocks()
+        geometry = self.geometry
+        shape = (geometry.num_block_layers, geometry.num_block_rows, geometry.num_block_columns)
+        return np.frombuffer(self.blocks, dtype=np.uint8).reshape(shape)
+
+# Every way to open up a spanning tree, by name. Each one
+# starts from the given node and only marks open_edges (and
+# whatever else of the Maze's state it needs).
+ALGORITHMS = {
+    'wilson': Maze.run_wilson,
+    'kruskal': Maze.run_kruskal,
+    'aldous-broder': Maze.run_aldous_broder,
+    'backtracker': Maze.run_backtracker,
+    'prim': Maze.run_prim,
+    'eller': Maze.run_eller,
+}
+
+def validate_open_edges(geometry, open_edges, start=0):
+    # With one true path between any two chambers, the open
+    # edges have to form a spanning tree. Union-find over the
+    # open edges tells whether they do: an edge between two
+    # chambers already joined closes a cycle, and every set
+    # left at the end is a separate component. Returns a
+    # report as a dict of plain values:
+    #   valid           whether it is a spanning tree
+    #   num_chambers    how many nodes there are
+    #   num_open_edges  how many edges are open
+    #   num_components  how many separate parts there are
+    #   cycles          [node, other_node] of every open edge
+    #                   that closes a cycle
+    #   unreachable     every node not connected to start
+    # with nodes as [layer, row, column].
+    num_nodes = geometry.num_nodes
+    edge_nodes = geometry.edge_nodes
+    edge_other_nodes = geometry.edge_other_nodes
+    parents = array('i', geometry.node_ids)
+    num_open = 0
+    cycle_edges = []
+    for edge_id, is_open in enumerate(open_edges):
+        if not is_open:
+            continue
+        num_open += 1
+        root = find_root(parents, edge_nodes[edge_id])
+        other_root = find_root(parents, edge_other_nodes[edge_id])
+        if root == other_root:
+            cycle_edges.append(edge_id)
+        else:
+            parents[root] = other_root
+    num_components = num_nodes - (num_open - len(cycle_edges))
+    unreachable = []
+    if num_components > 1:
+        start_root = find_root(parents, start)
+        unreachable = [
+            geometry.get_node(node_id) for node_id in range(num_nodes)
+            if find_root(parents, node_id) != start_root
+        ]
+    return {
+        'valid': num_components == 1 and not cycle_edges,
+        'num_chambers': num_nodes,
+        'num_open_edges': num_open,
+        'num_components': num_components,
+        'cycles': [
+            [geometry.get_node(edge_nodes[edge_id]), geometry.get_node(edge_other_nodes[edge_id])]
+            for edge_id in cycle_edges
+        ],
+        'unreachable': unreachable,
+    }
+
+def validate_maze(result):
+    # The report of validate_open_edges for a MazeResult, be it
+    # just generated or read back from a file.
+    geometry = get_geometry(result.dimensions)
+    return validate_open_edges(geometry, result.open_edges, geometry.get_node_id(result.start_node))
+
+def repair_open_edges(geometry, open_edges, break_cycles=False):
+    # Make the fewest changes that turn the open edges into a
+    # spanning tree, keeping the rest of the maze as it is.
+    # Union-find over the open edges finds the components
+    # (and the edges closing cycles), then each closed edge
+    # between two different components is opened, which takes
+    # exactly one less edge than there are components. With
+    # break_cycles set, the edges closing cycles are closed
+    # again. Returns the new open edges, and the ids of the
+    # edges opened and closed.
+    edge_nodes = geometry.edge_nodes
+    edge_other_nodes = geometry.edge_other_nodes
+    parents = array('i', geometry.node_ids)
+    repaired = bytearray(open_edges)
+    opened = []
+    closed = []
+    num_merges = 0
+    for edge_id, is_open in enumerate(open_edges):
+        if not is_open:
+            continue
+        root = find_root(parents, edge_nodes[edge_id])
+        other_root = find_root(parents, edge_other_nodes[edge_id])
+        if root != other_root:
+            parents[root] = other_root
+            num_merges += 1
+        elif break_cycles:
+            repaired[edge_id] = 0
+            closed.append(edge_id)
+    # Only the open edges that merged two components count
+    # here; the ones closing cycles join nothing.
+    num_joins = geometry.num_nodes - 1 - num_merges
+    for edge_id, is_open in enumerate(open_edges):
+        if num_joins <= 0:
+            break
+        if is_open:
+            continue
+        root = find_root(parents, edge_nodes[edge_id])
+        other_root = find_root(parents, edge_other_nodes[edge_id])
+        if root != other_root:
+            parents[root] = other_root
+            repaired[edge_id] = 1
+            opened.append(edge_id)
+            num_joins -= 1
+    return bytes(repaired), opened, closed
+
+def repair_maze(result, break_cycles=False):
+    # Returns the repaired MazeResult and the blocks that have
+    # to change to get there, as [block, letter] pairs.
+    geometry = get_geometry(result.dimensions)
+    [open_edges, opened, closed] = repair_open_edges(geometry, result.open_edges, break_cycles)
+    changes = []
+    for edge_id in opened:
+        letter = 'L' if geometry.is_ladder(edge_id) else 'O'
+        changes.extend([block, letter] for block in geometry.get_edge_blocks(edge_id))
+    for edge_id in closed:
+        changes.extend([block, 'B'] for block in geometry.get_edge_blocks(edge_id))
+    return result._replace(open_edges=open_edges), changes
+
+def add_seconds(stats, phase, seconds):
+    stats['seconds'][phase] = stats['seconds'].get(phase, 0) + seconds
+
+def check_spanning_tree(geometry, open_edges):
+    report = validate_open_edges(geometry, open_edges)
+    if not report['valid']:
+        raise RuntimeError('maze is not a spanning tree: {} components, {} cycles'.format(
+            report['num_components'], len(report['cycles'])))
+
+def get_entrance_exit_blocks(start_node, finish_node):
+    # The blocks to place for the maze entrance and exit,
+    # as [block, letter] pairs in the order to place them.
+    placements = []
+
+    # Create maze entrance
+    for block in get_south_edge_blocks(start_node):
+        placements.append([block, 'D'])
+    for block in get_start_platform_blocks(start_node):
+        placements.append([block, 'B'])
+    placements.append([get_start_signpost_block(start_node), '1'])
+
+    # Create maze exit
+    for block in get_finish_ladder_blocks(finish_node):
+        placements.append([block, 'L'])
+    for block in get_finish_solid_blocks(finish_node):
+        placements.append([block, 'B'])
+    placements.append([get_finish_signpost_block(finish_node), '2'])
+    return placements
+
+def iter_layers(result):
+    # Render the blocks of a generated maze one layer at a
+    # time, so only one layer has to be held at once.
+    geometry = get_geometry(result.dimensions)
+    placements_by_layer = {}
+    for [block, letter] in get_entrance_exit_blocks(result.start_node, result.finish_node):
+        [l, r, c] = block
+        placements_by_layer.setdefault(l, []).append([r, c, letter])
+    for l in range(geometry.num_block_layers):
+        layer_blocks = build_layer(geometry, l)
+        started = time.perf_counter()
+        num_writes = 0
+        for [edge_id, r, c, letter] in geometry.get_layer_edge_blocks(l):
+            if result.open_edges[edge_id]:
+                layer_blocks[r][c] = letter
+                num_writes += 1
+        carved = time.perf_counter()
+        placements = placements_by_layer.get(l, [])
+        for [r, c, letter] in placements:
+            layer_blocks[r][c] = letter
+        if result.stats is not None:
+            result.stats['block_writes'] += num_writes + len(placements)
+            add_seconds(result.stats, 'carve', carved - started)
+            add_seconds(result.stats, 'entrance_exit', time.perf_counter() - carved)
+        yield layer_blocks
+
+def iter_eller_layers(seed=None, dimensions=None):
+    # Make a maze with Eller's algorithm and render it one
+    # floor at a time as it goes, never holding more than a
+    # floor of it. The layers come out the same as those of
+    # generate(seed, dimensions, 'eller'), but there is no
+    # MazeResult, and no Geometry of the whole maze is built.
+    if dimensions is None:
+        dimensions = [num_node_layers, num_node_rows, num_node_columns]
+    seed = get_seed(seed)
+    rng = random.Random(seed)
+    [start_node, finish_node] = choose_start_finish(rng, dimensions)
+    floors = iter_eller_floors(rng, *dimensions)
+    return iter_floor_layers(dimensions, start_node, finish_node, floors)
+
+def iter_floor_layers(dimensions, start_node, finish_node, floors):
+    # Render the block layers of a maze given as the
+    # [floor_open, up_open] of each floor (see iter_eller_floors),
+    # a floor at a time, using only a one floor Geometry.
+    [layers, rows, columns] = dimensions
+    placements_by_layer = {}
+    for [block, letter] in get_entrance_exit_blocks(start_node, finish_node):
+        [l, r, c] = block
+        placements_by_layer.setdefault(l, []).append([r, c, letter])
+
+    # The layers of a one floor maze: empty, floor, the two
+    # layers of chambers, then roof and the two above it.
+    floor_geometry = get_geometry([1, rows, columns])
+    templates = [build_layer(floor_geometry, l) for l in range(floor_geometry.num_block_layers)]
+
+    def finish_layer(l, layer_blocks):
+        for [r, c, letter] in placements_by_layer.get(l, []):
+            layer_blocks[r][c] = letter
+        return layer_blocks
+
+    yield finish_layer(0, [list(row) for row in templates[0]])
+    up_open = None
+    for layer, [floor_open, next_up_open] in enumerate(floors):
+        l = get_floor_layer(layer)
+        layer_blocks = [list(row) for row in templates[1]]
+        if up_open is not None:
+            for cell, is_open in enumerate(up_open):
+                if is_open:
+                    [block] = get_up_edge_blocks([layer - 1, cell // columns, cell % columns])
+                    layer_blocks[block[1]][block[2]] = 'L'
+        yield finish_layer(l, layer_blocks)
+        for i in [1, 2]:
+            layer_blocks = [list(row) for row in templates[1 + i]]
+            for [edge_id, r, c, letter] in floor_geometry.get_layer_edge_blocks(1 + i):
+                if floor_open[edge_id]:
+                    layer_blocks[r][c] = letter
+            yield finish_layer(l + i, layer_blocks)
+        up_open = next_up_open
+    l = get_floor_layer(layers)
+    for i in [0, 1, 2]:
+        yield finish_layer(l + i, [list(row) for row in templates[4 + i]])
+
+def get_floor_layer_counts(dimensions, start_node, finish_node, floors):
+    # The block counts of every layer (as arrays indexed by
+    # Block code) of a maze given floor by floor, like
+    # iter_floor_layers takes it, but worked out without
+    # rendering anything: every layer starts from the counts
+    # of its template, every open edge turns one solid block
+    # of a layer into air (or ladder, going up), and then
+    # the entrance and exit are placed.
+    [layers, rows, columns] = dimensions
+    floor_geometry = get_geometry([1, rows, columns])
+    template_counts = floor_geometry.get_template_layer_counts()
+    layer_counts = [array('i', template_counts[0])]
+    num_up_open = 0
+    for [floor_open, up_open] in floors:
+        counts = array('i', template_counts[1])
+        counts[Block.BLOCK] -= num_up_open
+        counts[Block.LADDER] += num_up_open
+        layer_counts.append(counts)
+        num_floor_open = sum(floor_open)
+        for i in [2, 3]:
+            counts = array('i', template_counts[i])
+            counts[Block.BLOCK] -= num_floor_open
+            counts[Block.EMPTY] += num_floor_open
+            layer_counts.append(counts)
+        num_up_open = sum(up_open)
+    for i in [4, 5, 6]:
+        layer_counts.append(array('i', template_counts[i]))
+
+    # None of the entrance and exit blocks are edge blocks, so
+    # what they replace is whatever the template has there.
+    template = floor_geometry.get_block_template()
+    for [block, letter] in get_entrance_exit_blocks(start_node, finish_node):
+        [l, r, c] = block
+        if l == 0:
+            template_l = 0
+        elif l <= layers * 3:
+            template_l = (l - 1) % 3 + 1
+        else:
+            template_l = l - layers * 3 + 3
+        old_code = template[floor_geometry.get_block_offset([template_l, r, c])]
+        layer_counts[l][old_code] -= 1
+        layer_counts[l][get_block_code(letter)] += 1
+    return layer_counts
+
+def count_maze_blocks(result):
+    # The same as count_blocks(iter_layers(result)), the bill
+    # of materials, but without rendering a single layer.
+    layer_counts = get_floor_layer_counts(
+        result.dimensions, result.start_node, result.finish_node, iter_result_floors(result)
+    )
+    return get_counts_dict(array('i', map(sum, zip(*layer_counts))))
+
+def count_eller_blocks(seed, dimensions=None):
+    # The counts of iter_eller_layers(seed, dimensions), made
+    # one floor at a time without rendering it.
+    if dimensions is None:
+        dimensions = [num_node_layers, num_node_rows, num_node_columns]
+    rng = random.Random(get_seed(seed))
+    [start_node, finish_node] = choose_start_finish(rng, dimensions)
+    floors = iter_eller_floors(rng, *dimensions)
+    layer_counts = get_floor_layer_counts(dimensions, start_node, finish_node, floors)
+    return get_counts_dict(array('i', map(sum, zip(*layer_counts))))
+
+### SOLVING ###
+# A breadth first search over the open edges from the start
+# gives the distance of every chamber from it (in chambers
+# walked through, -1 where it can't be reached) and the
+# chamber each one is reached from (-1 for the start and
+# anything unreachable). Following those back from the
+# finish gives the shortest path.
+Solution = namedtuple('Solution', ['distances', 'parents', 'path', 'path_blocks'])
+
+def get_distance_field(geometry, open_edges, start):
+    num_nodes = geometry.num_nodes
+    neighbor_offsets = geometry.neighbor_offsets
+    neighbor_nodes = geometry.neighbor_nodes
+    neighbor_edges = geometry.neighbor_edges
+    distances = array('i', [-1]) * num_nodes
+    parents = array('i', [-1]) * num_nodes
+    queue = array('i', [0]) * num_nodes
+    distances[start] = 0
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        node = queue[head]
+        head += 1
+        distance = distances[node] + 1
+        for slot in range(neighbor_offsets[node], neighbor_offsets[node + 1]):
+            other_node = neighbor_nodes[slot]
+            if distances[other_node] < 0 and open_edges[neighbor_edges[slot]]:
+                distances[other_node] = distance
+                parents[other_node] = node
+                queue[tail] = other_node
+                tail += 1
+    return distances, parents
+
+def get_path(parents, finish):
+    # Node ids from the root of parents to finish.
+    path = [finish]
+    while parents[path[-1]] >= 0:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+def get_edge_between(geometry, node, other_node):
+    for slot in range(geometry.neighbor_offsets[node], geometry.neighbor_offsets[node + 1]):
+        if geometry.neighbor_nodes[slot] == other_node:
+            return geometry.neighbor_edges[slot]
+    return None
+
+def get_path_blocks(geometry, path):
+    # The blocks to walk through along a path of node ids: a
+    # block on the floor of each chamber (the one diagonal
+    # from the ladder, which is always air), and the blocks
+    # of every edge between two chambers.
+    path_blocks = []
+    for i, node_id in enumerate(path):
+        if i > 0:
+            path_blocks.extend(geometry.get_edge_blocks(get_edge_between(geometry, path[i - 1], node_id)))
+        [layer, row, column] = geometry.get_node(node_id)
+        path_blocks.append([(layer + 1) * 3 - 1, (row + 1) * 3, (column + 1) * 3 - 1])
+    return path_blocks
+
+def get_finish_candidates(geometry):
+    # Node ids of every chamber the finish may go in: the north
+    # half of the top floor, where the exit ladder goes up
+    # through the roof.
+    layer = geometry.num_node_layers - 1
+    return [
+        geometry.get_node_id([layer, row, column])
+        for row in range(geometry.num_node_rows // 2)
+        for column in range(geometry.num_node_columns)
+    ]
+
+def check_finish(finish):
+    # finish is 'random', 'farthest', or [low, high] path
+    # lengths with low <= high. Checked before the maze is made,
+    # rather than once it is time to place the finish.
+    if finish in ['random', 'farthest']:
+        return
+    if (
+        isinstance(finish, (list, tuple)) and len(finish) == 2
+        and all(isinstance(n, int) and not isinstance(n, bool) for n in finish)
+        and finish[0] <= finish[1]
+    ):
+        return
+    raise ValueError("finish must be 'random', 'farthest' or [low, high] with low <= high, not {!r}".format(finish))
+
+def choose_finish(rng, geometry, open_edges, start_node, finish):
+    # Pick the finish from one distance sweep out of the start.
+    # With 'farthest' it is the candidate with the longest
+    # path, and with a [low, high] range it is any candidate
+    # whose path length is in it, or failing that the one that
+    # comes closest. Ties are broken at random.
+    [distances, parents] = get_distance_field(geometry, open_edges, geometry.get_node_id(start_node))
+    candidates = get_finish_candidates(geometry)
+    if finish == 'farthest':
+        misses = [-distances[node_id] for node_id in candidates]
+    else:
+        [low, high] = finish
+        misses = [max(low - distances[node_id], distances[node_id] - high, 0) for node_id in candidates]
+    best_miss = min(misses)
+    best = [node_id for node_id, miss in zip(candidates, misses) if miss == best_miss]
+    return geometry.get_node(rng.choice(best))
+
+def solve(result):
+    geometry = get_geometry(result.dimensions)
+    start = geometry.get_node_id(result.start_node)
+    finish = geometry.get_node_id(result.finish_node)
+    [distances, parents] = get_distance_field(geometry, result.open_edges, start)
+    if distances[finish] < 0:
+        raise RuntimeError('finish {} is not reachable from start {}'.format(result.finish_node, result.start_node))
+    path = get_path(parents, finish)
+    return Solution(
+        distances,
+        parents,
+        [geometry.get_node(node_id) for node_id in path],
+        get_path_blocks(geometry, path),
+    )
+
+### PACKED WALLS ###
+# For mazes too big for a Geometry, the open edges can be
+# kept as bits instead: three per chamber, for the edges
+# east, south and up out of it, at bit node_id * 3 + EAST,
+# SOUTH or UP. Everything else is worked out from the node
+# id, so 100M chambers take under 40MB. Bits for edges that
+# would lead out of the maze are never set.
+
+class PackedMaze:
+    def __init__(self, dimensions=None, start_node=None, finish_node=None):
+        if dimensions is None:
+            dimensions = [num_node_layers, num_node_rows, num_node_columns]
+        [self.num_node_layers, self.num_node_rows, self.num_node_columns] = dimensions
+        self.floor_size = self.num_node_rows * self.num_node_columns
+        self.num_nodes = self.num_node_layers * self.floor_size
+        self.start_node = start_node
+        self.finish_node = finish_node
+        self.bits = bytearray((self.num_nodes * 3 + 7) // 8)
+
+    @classmethod
+    def from_floors(cls, dimensions, start_node, finish_node, floors):
+        # Pack the [floor_open, up_open] of each floor, numbered
+        # as in iter_eller_floors.
+        maze = cls(dimensions, start_node, finish_node)
+        rows = maze.num_node_rows
+        columns = maze.num_node_columns
+        num_east = rows * (columns - 1)
+        for layer, [floor_open, up_open] in enumerate(floors):
+            first = layer * maze.floor_size
+            for i, is_open in enumerate(floor_open):
+                if not is_open:
+                    continue
+                if i < num_east:
+                    row, column = divmod(i, columns - 1)
+                    maze.set_open(first + row * columns + column, EAST)
+                else:
+                    column, row = divmod(i - num_east, rows - 1)
+                    maze.set_open(first + row * columns + column, SOUTH)
+            for cell, is_open in enumerate(up_open):
+                if is_open:
+                    maze.set_open(first + cell, UP)
+        return maze
+
+    @classmethod
+    def from_result(cls, result):
+        return cls.from_floors(result.dimensions, result.start_node, result.finish_node, iter_result_floors(result))
+
+    @classmethod
+    def from_eller(cls, seed=None, dimensions=None):
+        # Make a maze straight into bits, with no Geometry of it.
+        if dimensions is None:
+            dimensions = [num_node_layers, num_node_rows, num_node_columns]
+        seed = get_seed(seed)
+        rng = random.Random(seed)
+        [start_node, finish_node] = choose_start_finish(rng, dimensions)
+        return cls.from_floors(dimensions, start_node, finish_node, iter_eller_floors(rng, *dimensions))
+
+    def get_dimensions(self):
+        return (self.num_node_layers, self.num_node_rows, self.num_node_columns)
+
+    def is_open(self, node_id, direction):
+        bit = node_id * 3 + direction
+        return self.bits[bit >> 3] >> (bit & 7) & 1
+
+    def set_open(self, node_id, direction, is_open=True):
+        bit = node_id * 3 + direction
+        if is_open:
+            self.bits[bit >> 3] |= 1 << (bit & 7)
+        else:
+            self.bits[bit >> 3] &= ~(1 << (bit & 7))
+
+    def get_open_neighbors(self, node_id):
+        # Node ids of the chambers an open edge leads to.
+        neighbors = []
+        if self.is_open(node_id, EAST):
+            neighbors.append(node_id + 1)
+        if node_id % self.num_node_columns > 0 and self.is_open(node_id - 1, EAST):
+            neighbors.append(node_id - 1)
+        if self.is_open(node_id, SOUTH):
+            neighbors.append(node_id + self.num_node_columns)
+        if node_id % self.floor_size >= self.num_node_columns and self.is_open(node_id - self.num_node_columns, SOUTH):
+            neighbors.append(node_id - self.num_node_columns)
+        if self.is_open(node_id, UP):
+            neighbors.append(node_id + self.floor_size)
+        if node_id >= self.floor_size and self.is_open(node_id - self.floor_size, UP):
+            neighbors.append(node_id - self.floor_size)
+        return neighbors
+
+    def iter_floors(self):
+        # The [floor_open, up_open] of each floor, as in
+        # iter_eller_floors.
+        rows = self.num_node_rows
+        columns = self.num_node_columns
+        for layer in range(self.num_node_layers):
+            first = layer * self.floor_size
+            floor_open = bytearray()
+            for row in range(rows):
+                for column in range(columns - 1):
+                    floor_open.append(self.is_open(first + row * columns + column, EAST))
+            for column in range(columns):
+                for row in range(rows - 1):
+                    floor_open.append(self.is_open(first + row * columns + column, SOUTH))
+            if layer == self.num_node_layers - 1:
+                up_open = b''
+            else:
+                up_open = bytes(self.is_open(first + cell, UP) for cell in range(self.floor_size))
+            yield [bytes(floor_open), up_open]
+
+    def get_result(self):
+        # Unpacked into a MazeResult, a byte per edge.
+        return MazeResult(
+            self.get_dimensions(),
+            None,
+            None,
+            self.start_node,
+            self.finish_node,
+            b''.join(b''.join(floor) for floor in self.iter_floors()),
+        )
+
+    def iter_layers(self):
+        # The block layers, made one floor at a time.
+        return iter_floor_layers(self.get_dimensions(), self.start_node, self.finish_node, self.iter_floors())
+
+    def get_counts(self):
+        # The block counts, without making any blocks.
+        layer_counts = get_floor_layer_counts(self.get_dimensions(), self.start_node, self.finish_node, self.iter_floors())
+        return get_counts_dict(array('i', map(sum, zip(*layer_counts))))
+
+    def get_node_id(self, node):
+        [layer, row, column] = node
+        return (layer * self.num_node_rows + row) * self.num_node_columns + column
+
+    def get_distance_field(self, start):
+        # Like get_distance_field, but over the bits. The
+        # distances, parents and queue take 12 bytes a chamber.
+        distances = array('i', [-1]) * self.num_nodes
+        parents = array('i', [-1]) * self.num_nodes
+        queue = array('i', [0]) * self.num_nodes
+        distances[start] = 0
+        queue[0] = start
+        head = 0
+        tail = 1
+        while head < tail:
+            node = queue[head]
+            head += 1
+            distance = distances[node] + 1
+            for other_node in self.get_open_neighbors(node):
+                if distances[other_node] < 0:
+                    distances[other_node] = distance
+                    parents[other_node] = node
+                    queue[tail] = other_node
+                    tail += 1
+        return distances, parents
+
+def iter_result_floors(result):
+    # The [floor_open, up_open] of each floor of a MazeResult,
+    # whose edges run a floor's edges then the ladders up out
+    # of it, floor by floor.
+    [layers, rows, columns] = result.dimensions
+    num_floor_edges = rows * (columns - 1) + columns * (rows - 1)
+    floor_size = rows * columns
+    i = 0
+    for layer in range(layers):
+        floor_open = result.open_edges[i:i + num_floor_edges]
+        i += num_floor_edges
+        if layer == layers - 1:
+            up_open = b''
+        else:
+            up_open = result.open_edges[i:i + floor_size]
+            i += floor_size
+        yield [floor_open, up_open]
+
+### NUMPY BACKEND ###
+# The same structure as blocks, but stored as a 3d numpy
+# array of Block codes indexed by volume[height, row, column].
+# It takes a byte per block, and carving and counting are
+# done for all blocks at once instead of one at a time.
+
+def build_volume(geometry):
+    # Same layout as build_blocks, filled in with slices.
+    np = import_numpy()
+    shape = (geometry.num_block_layers, geometry.num_block_rows, geometry.num_block_columns)
+    volume = np.zeros(shape, dtype=np.uint8)
+    top_layer = get_floor_layer(geometry.num_node_layers)
+    last_row = geometry.num_node_rows * 3
+    last_column = geometry.num_node_columns * 3
+    volume[1:top_layer + 1, 1:shape[1] - 1, 1:shape[2] - 1] = Block.BLOCK
+    for l in [2, 3]:
+        for r in [2, 3]:
+            for c in [2, 3]:
+                volume[l:top_layer:3, r:last_row + 1:3, c:last_column + 1:3] = Block.EMPTY
+        volume[l:top_layer:3, 2:last_row + 1:3, 3:last_column + 1:3] = Block.LADDER
+    volume[3:top_layer:3, 3:last_row + 1:3, 3:last_column + 1:3] = Block.SCONCE
+    return volume
+
+def build_edge_block_index(geometry):
+    # Flattened list of every block that belongs to an edge:
+    # which edge it belongs to, its coordinates, and the code
+    # it gets when the edge is opened.
+    # Each coordinate of an edge block is three times that of
+    # its node, plus that of the same block for node [0, 0, 0],
+    # so all the edges going one way are done at once.
+    np = import_numpy()
+    edge_nodes = np.array(geometry.edge_nodes, dtype=np.intp)
+    directions = np.frombuffer(bytes(geometry.edge_directions), dtype=np.uint8)
+    [rest, node_columns] = np.divmod(edge_nodes, geometry.num_node_columns)
+    [node_layers, node_rows] = np.divmod(rest, geometry.num_node_rows)
+    node_coordinates = [node_layers * 3, node_rows * 3, node_columns * 3]
+    edge_ids = []
+    coordinates = [[], [], []]
+    codes = []
+    for direction, get_edge_blocks in enumerate(EDGE_BLOCK_FUNCTIONS):
+        ids = np.flatnonzero(directions == direction)
+        code = Block.LADDER if direction == UP else Block.EMPTY
+        for block in get_edge_blocks([0, 0, 0]):
+            edge_ids.append(ids)
+            for axis in range(3):
+                coordinates[axis].append(node_coordinates[axis][ids] + block[axis])
+            codes.append(np.full(len(ids), code, dtype=np.uint8))
+    return (
+        np.concatenate(edge_ids),
+        tuple(np.concatenate(axis) for axis in coordinates),
+        np.concatenate(codes),
+    )
+
+def carve_volume(geometry, volume, open_edges, start_node, finish_node, stats=None):
+    # With stats (see Maze.get_stats), the block writes and the
+    # time taken are added to it like iter_layers does.
+    np = import_numpy()
+    started = time.perf_counter()
+    [edge_ids, [ls, rs, cs], codes] = geometry.get_edge_block_index()
+    open_flags = np.frombuffer(bytes(open_edges), dtype=np.uint8).astype(bool)
+    opened = open_flags[edge_ids]
+    volume[ls[opened], rs[opened], cs[opened]] = codes[opened]
+    carved = time.perf_counter()
+    placements = get_entrance_exit_blocks(start_node, finish_node)
+    for [block, letter] in placements:
+        [l, r, c] = block
+        volume[l, r, c] = get_block_code(letter)
+    if stats is not None:
+        stats['block_writes'] += int(opened.sum()) + len(placements)
+        add_seconds(stats, 'carve', carved - started)
+        add_seconds(stats, 'entrance_exit', time.perf_counter() - carved)
+
+def count_volume(volume):
+    np = import_numpy()
+    totals = np.bincount(volume.ravel(), minlength=len(Block))
+    return {letter: int(totals[get_block_code(letter)]) for letter in BLOCK_LETTERS}
+
+def count_blocks(blocks):
     counts = {
         'B': 0,
         'S': 0,
@@ -1298,74 +1847,824 @@ def print_results():
         'D': 0,
         'O': 0,
     }
+    if is_numpy_array(blocks):
+        counts.update(count_volume(blocks))
+        return counts
     for layer in blocks:
         for row in layer:
             for block in row:
                 counts[block] += 1
-    print({'counts': counts})
-    print()
-    for layer in blocks:
-        for row in layer:
-            print(' '.join(row))
-        print()
+    return counts
 
-def main():
-    # Randomly pick a start node.
-    start_layer = 0
-    start_row = num_node_rows - 1
-    start_column = random.choice(range(num_node_columns))
-    start_node = [start_layer, start_row, start_column]
+### WRITING ###
+# The text output is a header with the block counts (and
+# the seed and algorithm of the maze, when known),
+# followed by every layer from the bottom up, each one
+# followed by a blank line. In the grid format a layer is
+# one row of space-separated letters per line. The runs
+# and rectangles formats instead list only what has to be
+# placed in each layer, under a 'layer N:' line, and
+# anything not listed is empty:
+#   runs:       row 2: B 1-2, L 3, B 4
+#   rectangles: B 1-22 1-22
+#               L 2-20/3 3-21/3
+# A rectangles line places its letter at every block in
+# any of its rows and any of its columns, later lines going
+# over earlier ones. Rows and columns are listed as n, a-b
+# for every one from a to b, or a-b/s for every s-th one
+# from a to b.
+# The deltas format is written like runs, but only lists
+# the blocks that differ from the layer below (for layer 0,
+# from a layer of nothing but air), with O where a block
+# of the layer below gives way to air:
+#   deltas:     row 2: O 1-2, L 3
+# Coordinates are (row, column) like blocks[height][row][column].
+# Each format is a function of the layer number, the layer
+# and the layer below it (None for layer 0).
+# Layers are turned into text one at a time and written out
+# in chunks of at least WRITE_CHUNK_SIZE characters.
+WRITE_CHUNK_SIZE = 1 << 16
 
-    # Randomly pick a finish node.
-    finish_layer = num_node_layers - 1
-    finish_row = random.choice(range(num_node_rows // 2)) # Somewhere in the north half
-    finish_column = random.choice(range(num_node_columns))
-    finish_node = [finish_layer, finish_row, finish_column]
+def get_layer_letters(layer):
+    if is_numpy_array(layer):
+        np = import_numpy()
+        return np.array(list(BLOCK_LETTERS))[layer].tolist()
+    return layer
 
-    add_to_maze([start_layer, start_row, start_column])
-
-    # Wilson's algorithm
-    while len(excluded) > 0:
-        # do a random walk to discover potentials
-        potential_start_string = random.choice(list(excluded))
-        potential_start = tolist(potential_start_string)
-        potentials = set({})
-        potentials.add(potential_start_string)
-        current = potential_start
-        while tostr(current) in excluded:
-            current = walk(current)
-            potentials.add(tostr(current))
-
-        # do a real walk based on recorded directions
-        current = potential_start
-        while tostr(current) in excluded:
-            potentials.discard(tostr(current))
-            add_to_maze(current)
-            prev = current
-            current = walk_direction(current)
-            mark_edge_as_open(prev, current)
-        directions.clear()
+def get_layer_text(l, layer, below=None):
+    if is_numpy_array(layer):
+        np = import_numpy()
+        [rows, columns] = layer.shape
+        text = np.full((rows, columns * 2), ord(' '), dtype=np.uint8)
+        text[:, 0::2] = np.frombuffer(BLOCK_LETTERS.encode('ascii'), dtype=np.uint8)[layer]
+        text[:, -1] = ord('\n')
+        return text.tobytes().decode('ascii') + '\n'
+    return ''.join(' '.join(row) + '\n' for row in layer) + '\n'
 
-    # Create maze entrance
-    for block in get_south_edge_blocks(start_node):
-        [l, r, c] = block
-        blocks[l][r][c] = 'D'
-    for block in get_start_platform_blocks(start_node):
-        [l, r, c] = block
-        blocks[l][r][c] = 'B'
-    [l, r, c] = get_start_signpost_block(start_node)
-    blocks[l][r][c] = '1'
+def get_row_runs(row):
+    # Runs of the same letter in a row, as [letter, first, last].
+    runs = []
+    start = 0
+    for c in range(1, len(row) + 1):
+        if c == len(row) or row[c] != row[start]:
+            runs.append([row[start], start, c - 1])
+            start = c
+    return runs
 
-    # Create maze exit
-    for block in get_finish_ladder_blocks(finish_node):
-        [l, r, c] = block
-        blocks[l][r][c] = 'L'
-    for block in get_finish_solid_blocks(finish_node):
-        [l, r, c] = block
-        blocks[l][r][c] = 'B'
-    [l, r, c] = get_finish_signpost_block(finish_node)
-    blocks[l][r][c] = '2'
-    
-    print_results()
+def get_run_text(letter, first, last):
+    if first == last:
+        return '{} {}'.format(letter, first)
+    return '{} {}-{}'.format(letter, first, last)
+
+def get_layer_runs_text(l, layer, below=None):
+    lines = ['layer {}:\n'.format(l)]
+    for r, row in enumerate(get_layer_letters(layer)):
+        runs = []
+        for [letter, first, last] in get_row_runs(row):
+            if letter == 'O':
+                continue
+            runs.append(get_run_text(letter, first, last))
+        if runs:
+            lines.append('row {}: {}\n'.format(r, ', '.join(runs)))
+    return ''.join(lines) + '\n'
+
+def get_layer_delta_runs(layer, below):
+    # Runs of the same letter in a row that all differ from
+    # the layer below, as [row, letter, first, last]. With numpy
+    # the whole layer is compared at once, and a run starts
+    # wherever the row changes, a column is skipped, or the
+    # letter changes.
+    if is_numpy_array(layer):
+        np = import_numpy()
+        if below is None:
+            below = np.zeros_like(layer)
+        [rows, columns] = np.nonzero(layer != below)
+        codes = layer[rows, columns]
+        starts = np.ones(len(rows), dtype=bool)
+        starts[1:] = (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1] + 1) | (codes[1:] != codes[:-1])
+        firsts = np.flatnonzero(starts)
+        lasts = np.append(firsts[1:], len(rows)) - 1
+        return [
+            [int(rows[i]), BLOCK_LETTERS[codes[i]], int(columns[i]), int(columns[j])]
+            for i, j in zip(firsts, lasts)
+        ]
+    if below is None:
+        below = [['O'] * len(row) for row in layer]
+    runs = []
+    for r, [row, below_row] in enumerate(zip(layer, below)):
+        c = 0
+        while c < len(row):
+            if row[c] == below_row[c]:
+                c += 1
+                continue
+            first = c
+            while c + 1 < len(row) and row[c + 1] == row[first] and row[c + 1] != below_row[c + 1]:
+                c += 1
+            runs.append([r, row[first], first, c])
+            c += 1
+    return runs
+
+def get_layer_deltas_text(l, layer, below=None):
+    lines = ['layer {}:\n'.format(l)]
+    row_runs = []
+    for i, [r, letter, first, last] in enumerate(get_layer_delta_runs(layer, below)):
+        if row_runs and r != row_runs[0]:
+            lines.append('row {}: {}\n'.format(row_runs[0], ', '.join(row_runs[1:])))
+            row_runs = []
+        if not row_runs:
+            row_runs.append(r)
+        row_runs.append(get_run_text(letter, first, last))
+    if row_runs:
+        lines.append('row {}: {}\n'.format(row_runs[0], ', '.join(row_runs[1:])))
+    return ''.join(lines) + '\n'
+
+def get_index_text(indices):
+    # Sorted rows or columns, shortened to ranges: a-b for
+    # consecutive ones, and a-b/s for three or more evenly
+    # spaced ones.
+    parts = []
+    i = 0
+    while i < len(indices):
+        j = i
+        if i + 1 < len(indices):
+            step = indices[i + 1] - indices[i]
+            while j + 1 < len(indices) and indices[j + 1] - indices[j] == step:
+                j += 1
+            if step > 1 and j - i < 2:
+                j = i
+        if j == i:
+            parts.append(str(indices[i]))
+        elif step == 1:
+            parts.append('{}-{}'.format(indices[i], indices[j]))
+        else:
+            parts.append('{}-{}/{}'.format(indices[i], indices[j], step))
+        i = j + 1
+    return ','.join(parts)
+
+def get_layer_rectangles(layer):
+    # What to place in a layer, as [letter, rows, columns] to
+    # place in order. The first fills the box around all but
+    # the empty blocks with the most common letter in it. The
+    # rest put right every block that differs from that, one
+    # for each letter and set of columns, with all the rows
+    # that have that letter in exactly those columns. That
+    # way the chambers of a floor, which repeat every three
+    # blocks, take a line or two instead of one per chamber.
+    layer = get_layer_letters(layer)
+    rows = [r for r, row in enumerate(layer) if any(letter != 'O' for letter in row)]
+    if not rows:
+        return []
+    rows = range(rows[0], rows[-1] + 1)
+    columns = [c for c in range(len(layer[0])) if any(layer[r][c] != 'O' for r in rows)]
+    columns = range(columns[0], columns[-1] + 1)
+    counts = {}
+    for r in rows:
+        for c in columns:
+            counts[layer[r][c]] = counts.get(layer[r][c], 0) + 1
+    base = max(counts, key=counts.get)
+    rectangles = []
+    if base != 'O':
+        rectangles.append([base, list(rows), list(columns)])
+    columns_by_row = {}
+    for r in rows:
+        for c in columns:
+            if layer[r][c] != base:
+                columns_by_row.setdefault((layer[r][c], r), set()).add(c)
+    # Rows three apart cross the chambers in the same place,
+    # so they tend to have most of their columns in common.
+    # Those go first, then whatever is left of each row.
+    rows_by_columns = {}
+    for offset in range(3):
+        rows_by_letter = {}
+        for [letter, r] in columns_by_row:
+            if r % 3 == offset:
+                rows_by_letter.setdefault(letter, []).append(r)
+        for letter, letter_rows in rows_by_letter.items():
+            if len(letter_rows) < 2:
+                continue
+            common = set.intersection(*[columns_by_row[(letter, r)] for r in letter_rows])
+            if len(common) < 2:
+                continue
+            rows_by_columns.setdefault((letter, tuple(sorted(common))), []).extend(letter_rows)
+            for r in letter_rows:
+                columns_by_row[(letter, r)] -= common
+    for [letter, r], letter_columns in sorted(columns_by_row.items(), key=lambda item: item[0][1]):
+        if letter_columns:
+            rows_by_columns.setdefault((letter, tuple(sorted(letter_columns))), []).append(r)
+    for [letter, letter_columns], letter_rows in rows_by_columns.items():
+        rectangles.append([letter, sorted(letter_rows), list(letter_columns)])
+    return rectangles
+
+def get_layer_rectangles_text(l, layer, below=None):
+    lines = ['layer {}:\n'.format(l)]
+    for [letter, rows, columns] in get_layer_rectangles(layer):
+        lines.append('{} {} {}\n'.format(letter, get_index_text(rows), get_index_text(columns)))
+    return ''.join(lines) + '\n'
+
+LAYER_FORMATS = {
+    'grid': get_layer_text,
+    'runs': get_layer_runs_text,
+    'rectangles': get_layer_rectangles_text,
+    'deltas': get_layer_deltas_text,
+}
+
+def write_results(layers, file, counts, layer_format='grid', chunk_size=WRITE_CHUNK_SIZE, seed=None, algorithm=None):
+    # The seed and algorithm go in the header too when known.
+    get_text = LAYER_FORMATS[layer_format]
+    header = {'counts': counts}
+    if seed is not None:
+        header['seed'] = seed
+    if algorithm is not None:
+        header['algorithm'] = algorithm
+    chunk = [str(header) + '\n\n']
+    size = len(chunk[0])
+    below = None
+    for l, layer in enumerate(layers):
+        text = get_text(l, layer, below)
+        below = layer
+        chunk.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            file.write(''.join(chunk))
+            chunk = []
+            size = 0
+    if chunk:
+        file.write(''.join(chunk))
+
+def write_maze(result, file, layer_format='grid'):
+    # The counts come first in the output, so they are worked
+    # out from the open edges instead of the rendered layers.
+    started = time.perf_counter()
+    counts = count_maze_blocks(result)
+    write_results(iter_layers(result), file, counts, layer_format, seed=result.seed, algorithm=result.algorithm)
+    if result.stats is not None:
+        add_seconds(result.stats, 'render', time.perf_counter() - started)
+
+def write_eller_maze(file, seed=None, dimensions=None, layer_format='grid'):
+    # Like write_maze, but the maze is made as it is written,
+    # so memory stays at about one floor however tall it is.
+    # The counts still take a pass of their own, which makes
+    # the maze twice from the same seed (but only renders it
+    # once).
+    seed = get_seed(seed)
+    counts = count_eller_blocks(seed, dimensions)
+    write_results(iter_eller_layers(seed, dimensions), file, counts, layer_format, seed=seed, algorithm='eller')
+
+def open_output(path, compress=False):
+    if compress or path.endswith('.gz'):
+        return gzip.open(path, 'wt')
+    return open(path, 'w')
+
+### READING ###
+# Text in the grid format can be read back, hand edits and
+# all. The counts header is taken as it is, and the layers
+# are read one at a time. The maze itself is worked out
+# from the blocks: an edge is open if none of its blocks
+# are in the way (all of them are O, L or D), and the start
+# and finish are found from their signposts. The seed and
+# algorithm come from the header, if it has them.
+PASSABLE_LETTERS = 'OLD'
+
+def open_input(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt')
+    return open(path)
+
+def read_text_header(file):
+    try:
+        header = ast.literal_eval(file.readline())
+    except (SyntaxError, ValueError):
+        header = None
+    if not isinstance(header, dict) or 'counts' not in header:
+        raise ValueError('maze text does not start with a counts header')
+    return header
+
+def iter_text_layers(file):
+    # The layers after the header, as lists of rows of letters.
+    layer = []
+    for line in file:
+        row = line.split()
+        if row:
+            if row[0] == 'layer':
+                raise ValueError('only the grid format can be read back')
+            layer.append(row)
+        elif layer:
+            yield layer
+            layer = []
+    if layer:
+        yield layer
+
+def read_text(file):
+    # Returns the MazeResult for a maze in the grid format, and
+    # the counts from its header. Raises ValueError if there
+    # is no maze in it, or no start or finish signpost.
+    header = read_text_header(file)
+    parts = []
+    start_node = None
+    finish_node = None
+    floor_geometry = None
+    num_block_layers = 0
+    for l, layer in enumerate(iter_text_layers(file)):
+        num_block_layers += 1
+        if floor_geometry is None:
+            num_rows = len(layer) // 3 - 1
+            num_columns = len(layer[0]) // 3 - 1
+            if num_rows < 2 or num_columns < 1:
+                raise ValueError('maze text has too few rows or columns for a maze')
+            floor_geometry = get_geometry([1, num_rows, num_columns])
+            shape = [len(row) for row in layer]
+        if [len(row) for row in layer] != shape:
+            raise ValueError('layer {} is not the same size as layer 0'.format(l))
+        for r, row in enumerate(layer):
+            for c, letter in enumerate(row):
+                if letter == '1':
+                    start_node = [(l + 1) // 3 - 1, (r - 2) // 3 - 1, c // 3 - 1]
+                elif letter == '2':
+                    finish_node = [(l - 2) // 3 - 1, (r + 2) // 3 - 1, (c - 1) // 3 - 1]
+        # Each floor's edges come right after the ladders up
+        # into it, the same as in iter_eller_floors.
+        if l == 0:
+            continue
+        if l % 3 == 1:
+            if l > 1:
+                parts.append(bytes(
+                    layer[(row + 1) * 3 - 1][(column + 1) * 3] in PASSABLE_LETTERS
+                    for row in range(num_rows)
+                    for column in range(num_columns)
+                ))
+            continue
+        if l % 3 == 2:
+            floor_open = bytearray(b'\1') * floor_geometry.num_edges
+            floor_l = 2
+        else:
+            floor_l = 3
+        for [edge_id, r, c, letter] in floor_geometry.get_layer_edge_blocks(floor_l):
+            if layer[r][c] not in PASSABLE_LETTERS:
+                floor_open[edge_id] = 0
+        if l % 3 == 0:
+            parts.append(bytes(floor_open))
+    num_node_layers = (num_block_layers - 1) // 3 - 1
+    if num_node_layers < 1:
+        raise ValueError('maze text has too few layers for a maze')
+    if start_node is None:
+        raise ValueError('maze text has no start signpost (1)')
+    if finish_node is None:
+        raise ValueError('maze text has no finish signpost (2)')
+    # The roof and the layers above it were read like another
+    # floor, but there are no edges up there.
+    open_edges = b''.join(parts[:2 * num_node_layers - 1])
+    dimensions = (num_node_layers, floor_geometry.num_node_rows, floor_geometry.num_node_columns)
+    result = MazeResult(dimensions, header.get('seed'), header.get('algorithm'), start_node, finish_node, open_edges)
+    return result, header['counts']
+
+### BINARY FORMAT ###
+# A maze file starts with a fixed header:
+#   magic             8 bytes, MAZE_MAGIC
+#   version           uint16
+#   flags             uint16, FLAG_VOXELS if blocks are included,
+#                     FLAG_NO_SEED if the seed is not known
+#   node layers       uint32
+#   node rows         uint32
+#   node columns      uint32
+#   edges             uint32
+#   seed              uint64, 0 when not known
+#   algorithm         16 bytes, ascii, padded with zeros (all
+#                     zeros when not known)
+#   start node id     uint64
+#   finish node id    uint64
+# all little-endian. It is followed by the open edges, one
+# bit per edge id (bit i & 7 of byte i >> 3), and then if
+# FLAG_VOXELS is set, one Block code per block, layer by
+# layer, row by row.
+MAZE_MAGIC = b'DQBMAZE\0'
+MAZE_VERSION = 1
+FLAG_VOXELS = 1
+FLAG_NO_SEED = 2
+MAZE_ALGORITHM_SIZE = 16
+MAZE_HEADER = struct.Struct('<8sHHIIIIQ16sQQ')
+
+def pack_bits(flags):
+    packed = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            packed[i >> 3] |= 1 << (i & 7)
+    return bytes(packed)
+
+def unpack_bits(packed, count):
+    flags = bytearray(count)
+    for i in range(count):
+        if packed[i >> 3] >> (i & 7) & 1:
+            flags[i] = 1
+    return bytes(flags)
+
+def write_binary(result, file, voxels=False):
+    # Write a generated maze to a file opened in binary mode.
+    # With voxels set, the rendered blocks are written too so
+    # they can be read back without rendering them again.
+    # Mazes read from text without a seed in the header, or
+    # unpacked from a PackedMaze, have no seed or algorithm,
+    # and are written without them.
+    flags = FLAG_VOXELS if voxels else 0
+    seed = result.seed
+    if seed is None:
+        flags |= FLAG_NO_SEED
+        seed = 0
+    elif not 0 <= seed < SEED_LIMIT:
+        raise ValueError('seed {} does not fit in a maze file'.format(seed))
+    algorithm = (result.algorithm or '').encode('ascii')
+    if len(algorithm) > MAZE_ALGORITHM_SIZE:
+        raise ValueError('algorithm name {!r} is longer than {} bytes'.format(result.algorithm, MAZE_ALGORITHM_SIZE))
+    geometry = get_geometry(result.dimensions)
+    file.write(MAZE_HEADER.pack(
+        MAZE_MAGIC,
+        MAZE_VERSION,
+        flags,
+        geometry.num_node_layers,
+        geometry.num_node_rows,
+        geometry.num_node_columns,
+        len(result.open_edges),
+        seed,
+        algorithm,
+        geometry.get_node_id(result.start_node),
+        geometry.get_node_id(result.finish_node),
+    ))
+    file.write(pack_bits(result.open_edges))
+    if voxels:
+        for layer in iter_layers(result):
+            file.write(get_layer_codes(layer))
+
+class MazeFile:
+    # Reads a maze file through mmap, so nothing is parsed or
+    # copied until it is asked for. Layers come back as views
+    # into the file itself; they have to be released before
+    # the file is closed.
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.map)
+        if len(self.buffer) < MAZE_HEADER.size:
+            self.close()
+            raise ValueError('{} is not a maze file'.format(path))
+        [
+            magic,
+            version,
+            self.flags,
+            self.num_node_layers,
+            self.num_node_rows,
+            self.num_node_columns,
+            self.num_edges,
+            self.seed,
+            algorithm,
+            self.start_node_id,
+            self.finish_node_id,
+        ] = MAZE_HEADER.unpack_from(self.buffer)
+        if magic != MAZE_MAGIC or version != MAZE_VERSION:
+            self.close()
+            raise ValueError('{} is not a version {} maze file'.format(path, MAZE_VERSION))
+        if self.flags & FLAG_NO_SEED:
+            self.seed = None
+        self.algorithm = algorithm.rstrip(b'\0').decode('ascii') or None
+        self.num_block_layers = (self.num_node_layers + 1) * 3 + 1
+        self.num_block_rows = (self.num_node_rows + 1) * 3
+        self.num_block_columns = (self.num_node_columns + 1) * 3
+        self.edges_offset = MAZE_HEADER.size
+        self.voxels_offset = self.edges_offset + (self.num_edges + 7) // 8
+        # Nothing after the header is trusted until it is known
+        # to agree with the header and to all be there.
+        dimensions = [self.num_node_layers, self.num_node_rows, self.num_node_columns]
+        num_nodes = self.num_node_layers * self.num_node_rows * self.num_node_columns
+        size = self.voxels_offset
+        if self.has_voxels():
+            size += self.num_block_layers * self.num_block_rows * self.num_block_columns
+        if self.num_edges != get_num_edges(dimensions):
+            problem = 'has {} edges, not the {} of a {} maze'.format(self.num_edges, get_num_edges(dimensions), 'x'.join(map(str, dimensions)))
+        elif not (self.start_node_id < num_nodes and self.finish_node_id < num_nodes):
+            problem = 'has its start or finish outside the maze'
+        elif len(self.buffer) < size:
+            problem = 'is cut short at {} of {} bytes'.format(len(self.buffer), size)
+        else:
+            return
+        self.close()
+        raise ValueError('maze file {} {}'.format(path, problem))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.close()
+        except BufferError:
+            # A view into the file is still held, most likely by
+            # the traceback of the exception on its way out. That
+            # exception is the one to see; the map closes once
+            # the view is gone.
+            if exc_type is None:
+                raise
+            self.file.close()
+
+    def close(self):
+        self.buffer.release()
+        self.map.close()
+        self.file.close()
+
+    def has_voxels(self):
+        return bool(self.flags & FLAG_VOXELS)
+
+    def get_open_edges(self):
+        with self.buffer[self.edges_offset:self.voxels_offset] as packed:
+            return unpack_bits(packed, self.num_edges)
+
+    def get_result(self):
+        dimensions = (self.num_node_layers, self.num_node_rows, self.num_node_columns)
+        geometry = get_geometry(dimensions)
+        return MazeResult(
+            dimensions,
+            self.seed,
+            self.algorithm,
+            geometry.get_node(self.start_node_id),
+            geometry.get_node(self.finish_node_id),
+            self.get_open_edges(),
+        )
+
+    def get_layer(self, l):
+        # Block codes of one layer as a rows x columns memoryview.
+        if not self.has_voxels():
+            raise ValueError('maze file has no blocks in it')
+        layer_size = self.num_block_rows * self.num_block_columns
+        start = self.voxels_offset + l * layer_size
+        return self.buffer[start:start + layer_size].cast('B', [self.num_block_rows, self.num_block_columns])
+
+    def get_volume(self):
+        # All block codes as a numpy array backed by the file.
+        if not self.has_voxels():
+            raise ValueError('maze file has no blocks in it')
+        np = import_numpy()
+        shape = (self.num_block_layers, self.num_block_rows, self.num_block_columns)
+        volume = np.frombuffer(self.map, dtype=np.uint8, count=shape[0] * shape[1] * shape[2], offset=self.voxels_offset)
+        return volume.reshape(shape)
+
+def read_maze(path):
+    # The MazeResult of a maze file, either binary or text.
+    with open(path, 'rb') as file:
+        magic = file.read(len(MAZE_MAGIC))
+    if magic == MAZE_MAGIC:
+        with MazeFile(path) as maze_file:
+            return maze_file.get_result()
+    # A broken .gz file fails in gzip or zlib rather than in
+    # read_text, so that is made a ValueError too.
+    try:
+        with open_input(path) as file:
+            return read_text(file)[0]
+    except (EOFError, gzip.BadGzipFile, zlib.error) as error:
+        raise ValueError('{} is not a whole gzip file ({})'.format(path, error))
+
+### GENERATING ###
+# A generated maze is kept as just its dimensions in
+# chambers, the seed it came from, the algorithm that made
+# it, its start and finish nodes, and one byte per edge
+# telling whether the edge is open. The blocks can be
+# rendered from that whenever they are needed.
+# With stats asked for, it also holds the dict from
+# Maze.get_stats, which rendering it adds to.
+MazeResult = namedtuple(
+    'MazeResult',
+    ['dimensions', 'seed', 'algorithm', 'start_node', 'finish_node', 'open_edges', 'stats'],
+    defaults=[None],
+)
+
+def generate(seed=None, dimensions=None, algorithm='wilson', finish='random', stats=False):
+    return Maze(dimensions, stats).generate(seed, algorithm, finish)
+
+def render_blocks(result):
+    return list(iter_layers(result))
+
+def render_volume(result):
+    geometry = get_geometry(result.dimensions)
+    volume = build_volume(geometry)
+    carve_volume(geometry, volume, result.open_edges, result.start_node, result.finish_node, result.stats)
+    return volume
+
+# Each worker process keeps one Maze per size and resets it
+# for every job it gets.
+worker_mazes = {}
+
+def generate_job(job):
+    [seed, dimensions, algorithm, finish, stats, directory, compress] = job
+    key = (tuple(dimensions or []), stats)
+    if key not in worker_mazes:
+        worker_mazes[key] = Maze(dimensions, stats)
+    result = worker_mazes[key].generate(seed, algorithm, finish)
+    if directory is None:
+        return result
+    path = os.path.join(directory, 'maze-{}.txt'.format(seed))
+    if compress:
+        path += '.gz'
+    with open_output(path) as file:
+        write_maze(result, file)
+    return path
+
+def generate_many(n, seed=None, workers=None, directory=None, compress=False, dimensions=None, algorithm='wilson', finish='random', stats=False, first=0):
+    # Generate n mazes across a pool of worker processes. Job i
+    # gets derive_seed(seed, i) as its seed, so the whole batch
+    # can be made again from that one seed, and a batch can be
+    # split up by giving each piece the same seed and its own
+    # range of jobs, starting at first. Returns a MazeResult per
+    # job, or if directory is given, writes each maze there as
+    # text (gzipped if compress is set) and returns the file
+    # paths.
+    seed = get_seed(seed)
+    jobs = [
+        [derive_seed(seed, i), dimensions, algorithm, finish, stats, directory, compress]
+        for i in range(first, first + n)
+    ]
+    if workers == 1:
+        return [generate_job(job) for job in jobs]
+    # Imported here, like numpy, to keep it out of the startup
+    # of everything that never makes a batch.
+    from concurrent.futures import ProcessPoolExecutor
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, n // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate_job, jobs, chunksize=chunksize))
+
+def get_tile_node_ids(geometry, tile_geometry, tile_row, tile_column):
+    # The node id in the whole maze of every node of a tile.
+    node_ids = array('i', [0]) * tile_geometry.num_nodes
+    for node_id in range(tile_geometry.num_nodes):
+        [layer, row, column] = tile_geometry.get_node(node_id)
+        node_ids[node_id] = geometry.get_node_id([
+            layer,
+            tile_row * tile_geometry.num_node_rows + row,
+            tile_column * tile_geometry.num_node_columns + column,
+        ])
+    return node_ids
+
+def generate_tiled(tiles, seed=None, dimensions=None, algorithm='wilson', finish='random', workers=None):
+    # Make one maze out of a grid of tiles, each the size of
+    # dimensions (one sharing stone by default), with tiles
+    # being [tile rows, tile columns]. The tiles are made in
+    # parallel by generate_many, each its own spanning tree.
+    # Then they are stitched together by going through the
+    # seam edges between tiles in random order, and using
+    # union-find over the tiles to open just the ones that
+    # join two tiles not joined yet. That is one less than
+    # there are tiles, which leaves one spanning tree.
+    check_tiles(tiles)
+    check_finish(finish)
+    seed = get_seed(seed)
+    rng = random.Random(derive_seed(seed, 'seams'))
+    [tile_rows, tile_columns] = tiles
+    tile_geometry = get_geometry(dimensions)
+    [layers, rows, columns] = tile_geometry.get_dimensions()
+    geometry = get_geometry([layers, tile_rows * rows, tile_columns * columns])
+    tile_results = generate_many(
+        tile_rows * tile_columns, derive_seed(seed, 'tiles'), workers,
+        dimensions=tile_geometry.get_dimensions(), algorithm=algorithm,
+    )
+
+    open_edges = bytearray(geometry.num_edges)
+    for tile, tile_result in enumerate(tile_results):
+        node_ids = get_tile_node_ids(geometry, tile_geometry, *divmod(tile, tile_columns))
+        for edge_id, is_open in enumerate(tile_result.open_edges):
+            if is_open:
+                node = node_ids[tile_geometry.edge_nodes[edge_id]]
+                other_node = node_ids[tile_geometry.edge_other_nodes[edge_id]]
+                open_edges[get_edge_between(geometry, node, other_node)] = 1
+
+    node_tiles = array('i', [
+        row // rows * tile_columns + column // columns
+        for layer in range(geometry.num_node_layers)
+        for row in range(geometry.num_node_rows)
+        for column in range(geometry.num_node_columns)
+    ])
+    edge_tiles = [node_tiles[node_id] for node_id in geometry.edge_nodes]
+    edge_other_tiles = [node_tiles[node_id] for node_id in geometry.edge_other_nodes]
+    seam_edges = [edge_id for edge_id in range(geometry.num_edges) if edge_tiles[edge_id] != edge_other_tiles[edge_id]]
+    rng.shuffle(seam_edges)
+    parents = array('i', range(tile_rows * tile_columns))
+    num_joins = tile_rows * tile_columns - 1
+    for edge_id in seam_edges:
+        if num_joins == 0:
+            break
+        root = find_root(parents, edge_tiles[edge_id])
+        other_root = find_root(parents, edge_other_tiles[edge_id])
+        if root != other_root:
+            parents[root] = other_root
+            open_edges[edge_id] = 1
+            num_joins -= 1
+    check_spanning_tree(geometry, open_edges)
+
+    [start_node, finish_node] = choose_start_finish(rng, geometry.get_dimensions())
+    if finish != 'random':
+        finish_node = choose_finish(rng, geometry, open_edges, start_node, finish)
+    return MazeResult(geometry.get_dimensions(), seed, algorithm, start_node, finish_node, bytes(open_edges))
+
+def get_int_type(minimum, limit=None):
+    # An argparse type for whole numbers no less than minimum,
+    # and less than limit if there is one.
+    def parse_int(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError('{!r} is not a whole number'.format(text))
+        if value < minimum:
+            raise argparse.ArgumentTypeError('{} is less than {}'.format(value, minimum))
+        if limit is not None and value >= limit:
+            raise argparse.ArgumentTypeError('{} is not less than {}'.format(value, limit))
+        return value
+    return parse_int
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Make a 3d maze to build in Dragon Quest Builders.')
+    parser.add_argument('--format', choices=list(LAYER_FORMATS), default='grid',
+                        help='how to write out each layer (default: grid)')
+    parser.add_argument('--backend', choices=['list', 'numpy'], default='list',
+                        help='how to store the blocks while rendering (default: list)')
+    parser.add_argument('--algorithm', choices=list(ALGORITHMS), default='wilson',
+                        help='how to carve out the maze (default: wilson); eller writes it as it goes, '
+                             'in about one floor of memory, but carves it twice to count the blocks first')
+    parser.add_argument('--finish', choices=['random', 'farthest'], default='random',
+                        help='where on the top floor to put the finish (default: random)')
+    parser.add_argument('--finish-distance', type=int, nargs=2, metavar=('LOW', 'HIGH'),
+                        help='put the finish this many chambers from the start, or as close as it gets')
+    parser.add_argument('--validate', metavar='PATH',
+                        help='check a maze file (binary or text) instead of making one, printing a JSON report')
+    parser.add_argument('--repair', metavar='PATH',
+                        help='print the blocks to change to make a maze file a proper maze, as JSON')
+    parser.add_argument('--break-cycles', action='store_true',
+                        help='when repairing, also wall off any loops')
+    parser.add_argument('--tiles', type=int, nargs=2, metavar=('ROWS', 'COLUMNS'),
+                        help='make a grid of mazes of the given size in parallel, joined into one')
+    parser.add_argument('--stats', action='store_true',
+                        help='print counters and timings of making the maze to stderr, as JSON (not with --tiles)')
+    parser.add_argument('--seed', type=get_int_type(0, SEED_LIMIT),
+                        help='make the maze from this seed, from 0 to 2**64 - 1 (default: a new one, written in the header)')
+    parser.add_argument('--layers', type=int, default=num_node_layers,
+                        help='floors of chambers, at least 1 (default: %(default)s)')
+    parser.add_argument('--rows', type=int, default=num_node_rows,
+                        help='rows of chambers on each floor, at least 2 (default: %(default)s)')
+    parser.add_argument('--columns', type=int, default=num_node_columns,
+                        help='columns of chambers on each floor, at least 1 (default: %(default)s)')
+    args = parser.parse_args(argv)
+    try:
+        check_dimensions([args.layers, args.rows, args.columns])
+        if args.tiles:
+            check_tiles(args.tiles)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.finish_distance and args.finish_distance[0] > args.finish_distance[1]:
+        parser.error('--finish-distance LOW is more than HIGH')
+    # Tiles are made in other processes, whose stats aren't
+    # brought back.
+    if args.stats and args.tiles:
+        parser.error('--stats does not work with --tiles')
+    return args
+
+def read_maze_arg(path):
+    # read_maze for a path given on the command line, exiting
+    # with why if there is no maze to be read from it, or no
+    # file to read at all.
+    try:
+        return read_maze(path)
+    except OSError as error:
+        sys.exit(str(error))
+    except ValueError as error:
+        sys.exit('{}: {}'.format(path, error))
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.validate:
+        report = validate_maze(read_maze_arg(args.validate))
+        print(json.dumps(report))
+        sys.exit(0 if report['valid'] else 1)
+    if args.repair:
+        [result, changes] = repair_maze(read_maze_arg(args.repair), args.break_cycles)
+        print(json.dumps({'changes': [block + [letter] for [block, letter] in changes]}))
+        return
+    if args.backend == 'numpy':
+        import_numpy()
+
+    dimensions = [args.layers, args.rows, args.columns]
+    finish = args.finish_distance or args.finish
+    if args.tiles:
+        result = generate_tiled(args.tiles, args.seed, dimensions, args.algorithm, finish)
+    # Streaming can't look back at the whole maze to place the
+    # finish, and doesn't keep stats.
+    elif args.algorithm == 'eller' and args.backend == 'list' and finish == 'random' and not args.stats:
+        write_eller_maze(sys.stdout, args.seed, dimensions, args.format)
+        return
+    else:
+        result = generate(args.seed, dimensions, args.algorithm, finish, args.stats)
+    if args.backend == 'numpy':
+        started = time.perf_counter()
+        volume = render_volume(result)
+        write_results(volume, sys.stdout, count_maze_blocks(result), args.format, seed=result.seed, algorithm=result.algorithm)
+        if result.stats is not None:
+            add_seconds(result.stats, 'render', time.perf_counter() - started)
+    else:
+        write_maze(result, sys.stdout, args.format)
+    if result.stats is not None:
+        print(json.dumps(result.stats), file=sys.stderr)
 
-main()
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+import gzip
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import makemaze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def read_example():
+    with open(os.path.join(HERE, 'maze1.txt')) as file:
+        return makemaze.read_text(file)[0]
+
+def write_binary_and_read(result):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'maze.bin')
+        with open(path, 'wb') as file:
+            makemaze.write_binary(result, file)
+        return makemaze.read_maze(path)
+
+def read_indices(text):
+    indices = []
+    for part in text.split(','):
+        [first, _, rest] = part.partition('-')
+        [last, _, step] = rest.partition('/')
+        indices.extend(range(int(first), int(last or first) + 1, int(step or 1)))
+    return indices
+
+def read_rectangles(text, rows, columns):
+    # Rebuild the grid layers from the rectangles format.
+    layers = []
+    for line in text.split('\n')[2:]:
+        if line.startswith('layer'):
+            layers.append([['O'] * columns for r in range(rows)])
+        elif line:
+            [letter, line_rows, line_columns] = line.split()
+            for r in read_indices(line_rows):
+                for c in read_indices(line_columns):
+                    layers[-1][r][c] = letter
+    return layers
+
+def read_deltas(text, rows, columns):
+    # Rebuild the grid layers from the deltas format, each
+    # layer starting as a copy of the one below.
+    layers = []
+    below = [['O'] * columns for r in range(rows)]
+    for line in text.split('\n')[2:]:
+        if line.startswith('layer'):
+            layers.append([list(row) for row in below])
+            below = layers[-1]
+        elif line:
+            [row, runs] = line.split(': ')
+            r = int(row.split()[1])
+            for run in runs.split(', '):
+                [letter, indices] = run.split()
+                for c in read_indices(indices):
+                    layers[-1][r][c] = letter
+    return layers
+
+class SeedTest(unittest.TestCase):
+    def test_seed_range(self):
+        for seed in [-5, 1 << 64, 1.5, True]:
+            with self.assertRaises(ValueError):
+                makemaze.generate(seed)
+        self.assertEqual(makemaze.generate((1 << 64) - 1).seed, (1 << 64) - 1)
+        for argv in [['--seed', '-5'], ['--seed', str(1 << 64)]]:
+            with self.assertRaises(SystemExit):
+                makemaze.parse_args(argv)
+
+    def test_same_seed_same_maze(self):
+        self.assertEqual(makemaze.generate(5), makemaze.generate(5))
+
+class GeometryTest(unittest.TestCase):
+    def test_layer_edge_blocks(self):
+        # Both ways of finding the blocks of an edge agree.
+        for dimensions in [[3, 4, 5], [2, 2, 3], [2, 3, 1], [1, 2, 1]]:
+            geometry = makemaze.get_geometry(dimensions)
+            by_edge = sorted(
+                (edge_id, *block) for edge_id in range(geometry.num_edges)
+                for block in geometry.get_edge_blocks(edge_id)
+            )
+            by_layer = sorted(
+                (edge_id, l, r, c) for l in range(geometry.num_block_layers)
+                for [edge_id, r, c, letter] in geometry.get_layer_edge_blocks(l)
+            )
+            self.assertEqual(by_edge, by_layer)
+
+    def test_edges_join_neighbors(self):
+        geometry = makemaze.get_geometry([3, 4, 5])
+        self.assertEqual(geometry.num_edges, 2 * 4 * 5 + 3 * (4 * 4 + 5 * 3))
+        for edge_id in range(geometry.num_edges):
+            node = geometry.get_node(geometry.edge_nodes[edge_id])
+            other_node = geometry.get_node(geometry.edge_other_nodes[edge_id])
+            self.assertEqual(sum(b - a for a, b in zip(node, other_node)), 1)
+
+class MazeTest(unittest.TestCase):
+    def test_blocks_made_on_demand(self):
+        maze = makemaze.Maze([3, 4, 5])
+        result = maze.generate(1)
+        self.assertIsNone(maze.blocks)
+        maze.carve()
+        blocks = makemaze.render_blocks(result)
+        self.assertEqual(bytes(maze.blocks), b''.join(makemaze.get_layer_codes(layer) for layer in blocks))
+        self.assertEqual(maze.get_counts(), makemaze.count_blocks(blocks))
+
+    def test_reset_after_carving(self):
+        maze = makemaze.Maze([3, 4, 5])
+        maze.generate(1)
+        maze.carve()
+        maze.generate(2)
+        self.assertEqual(maze.get_counts(), makemaze.count_blocks(makemaze.build_blocks(maze.geometry)))
+
+class StatsTest(unittest.TestCase):
+    def test_backends_agree(self):
+        phases = {'walk', 'check', 'finish', 'carve', 'entrance_exit'}
+        result = makemaze.generate(1, [3, 4, 5], stats=True)
+        makemaze.render_blocks(result)
+        self.assertEqual(set(result.stats['seconds']), phases)
+
+        volume_result = makemaze.generate(1, [3, 4, 5], stats=True)
+        makemaze.render_volume(volume_result)
+        self.assertEqual(set(volume_result.stats['seconds']), phases)
+        self.assertEqual(volume_result.stats['block_writes'], result.stats['block_writes'])
+        self.assertGreater(result.stats['block_writes'], result.stats['edges_opened'])
+
+    def test_no_stats_with_tiles(self):
+        with self.assertRaises(SystemExit):
+            makemaze.parse_args(['--tiles', '2', '2', '--stats'])
+
+class FinishTest(unittest.TestCase):
+    def test_bad_finish(self):
+        for finish in ['far', [10, 2], [1, 2, 3], [1.5, 2], None]:
+            with self.assertRaises(ValueError):
+                makemaze.generate(1, finish=finish)
+        with self.assertRaises(SystemExit):
+            makemaze.parse_args(['--finish-distance', '10', '2'])
+
+    def test_finish_distance(self):
+        result = makemaze.generate(1, finish=[5, 8])
+        # The path counts the start too.
+        self.assertIn(len(makemaze.solve(result).path) - 1, range(5, 9))
+
+def break_maze(result, num_cuts, num_cycles):
+    # Close num_cuts open edges, then open closed edges that
+    # close a cycle until there are num_cycles of them.
+    open_edges = bytearray(result.open_edges)
+    cuts = [edge_id for edge_id, is_open in enumerate(open_edges) if is_open][:num_cuts]
+    for edge_id in cuts:
+        open_edges[edge_id] = 0
+    for edge_id in range(len(open_edges)):
+        if open_edges[edge_id] or edge_id in cuts:
+            continue
+        open_edges[edge_id] = 1
+        report = makemaze.validate_maze(result._replace(open_edges=bytes(open_edges)))
+        if report['num_components'] != num_cuts + 1:
+            open_edges[edge_id] = 0
+        elif len(report['cycles']) == num_cycles:
+            break
+    return result._replace(open_edges=bytes(open_edges))
+
+class RepairTest(unittest.TestCase):
+    def test_components_and_cycles(self):
+        # More cycles than there are extra components.
+        broken = break_maze(makemaze.generate(1), 2, 3)
+        report = makemaze.validate_maze(broken)
+        self.assertEqual([report['num_components'], len(report['cycles'])], [3, 3])
+
+        [repaired, changes] = makemaze.repair_maze(broken)
+        report = makemaze.validate_maze(repaired)
+        self.assertEqual([report['num_components'], len(report['cycles'])], [1, 3])
+        self.assertEqual(len(changes), 4)
+
+        [repaired, changes] = makemaze.repair_maze(broken, break_cycles=True)
+        self.assertTrue(makemaze.validate_maze(repaired)['valid'])
+
+    def test_valid_maze_unchanged(self):
+        result = makemaze.generate(1)
+        self.assertEqual(makemaze.repair_maze(result), (result, []))
+
+class LayerFormatTest(unittest.TestCase):
+    def test_rectangles(self):
+        for algorithm in ['wilson', 'eller']:
+            result = makemaze.generate(3, [3, 5, 4], algorithm)
+            file = io.StringIO()
+            makemaze.write_maze(result, file, 'rectangles')
+            self.assertEqual(read_rectangles(file.getvalue(), 18, 15), makemaze.render_blocks(result))
+
+    def test_deltas(self):
+        for algorithm in ['wilson', 'eller']:
+            result = makemaze.generate(3, [3, 5, 4], algorithm)
+            blocks = makemaze.render_blocks(result)
+            file = io.StringIO()
+            makemaze.write_maze(result, file, 'deltas')
+            self.assertEqual(read_deltas(file.getvalue(), 18, 15), blocks)
+
+            volume_file = io.StringIO()
+            makemaze.write_results(makemaze.render_volume(result), volume_file, makemaze.count_maze_blocks(result), 'deltas')
+            self.assertEqual(read_deltas(volume_file.getvalue(), 18, 15), blocks)
+
+class PackedMazeTest(unittest.TestCase):
+    def test_same_as_result(self):
+        for algorithm in ['wilson', 'eller']:
+            result = makemaze.generate(3, [3, 5, 4], algorithm)
+            packed = makemaze.PackedMaze.from_result(result)
+            self.assertEqual(list(packed.iter_layers()), makemaze.render_blocks(result))
+            self.assertEqual(packed.get_counts(), makemaze.count_maze_blocks(result))
+            self.assertEqual(packed.get_result(), result._replace(seed=None, algorithm=None))
+
+            geometry = makemaze.get_geometry(result.dimensions)
+            start = packed.get_node_id(result.start_node)
+            [distances, parents] = makemaze.get_distance_field(geometry, result.open_edges, start)
+            self.assertEqual(packed.get_distance_field(start)[0], distances)
+
+    def test_from_eller(self):
+        packed = makemaze.PackedMaze.from_eller(3, [3, 5, 4])
+        self.assertEqual(list(packed.iter_layers()), list(makemaze.iter_eller_layers(3, [3, 5, 4])))
+
+class TilesTest(unittest.TestCase):
+    def test_one_maze(self):
+        result = makemaze.generate_tiled([2, 3], 1, [2, 3, 4], workers=1)
+        self.assertEqual(result.dimensions, (2, 6, 12))
+        self.assertTrue(makemaze.validate_maze(result)['valid'])
+        self.assertEqual(makemaze.generate_tiled([2, 3], 1, [2, 3, 4], workers=2), result)
+
+class StartupTest(unittest.TestCase):
+    def test_numpy_not_imported(self):
+        code = 'import sys, makemaze; makemaze.generate(1); sys.exit("numpy" in sys.modules)'
+        subprocess.run([sys.executable, '-c', code], cwd=HERE, check=True)
+
+    def test_dimension_minimums(self):
+        for argv in [['--rows', '1'], ['--columns', '0'], ['--layers', '0']]:
+            with self.assertRaises(SystemExit):
+                makemaze.parse_args(argv)
+        self.assertEqual(makemaze.parse_args(['--rows', '2', '--columns', '1']).rows, 2)
+
+    def test_api_dimension_minimums(self):
+        for dimensions in [[2, 1, 3], [2, 7, 0], [0, 7, 7]]:
+            with self.assertRaises(ValueError):
+                makemaze.generate(1, dimensions)
+            with self.assertRaises(ValueError):
+                list(makemaze.iter_eller_layers(1, dimensions))
+        with self.assertRaises(ValueError):
+            makemaze.generate_tiled([0, 2], 1, [2, 3, 3], workers=1)
+
+class ReadTextTest(unittest.TestCase):
+    def test_round_trip(self):
+        result = makemaze.generate(1, [3, 4, 5], 'prim')
+        file = io.StringIO()
+        makemaze.write_maze(result, file)
+        file.seek(0)
+        self.assertEqual(makemaze.read_text(file)[0], result)
+
+    def test_missing_signposts(self):
+        with open(os.path.join(HERE, 'maze1.txt')) as file:
+            text = file.read()
+        for signpost in ['1', '2']:
+            with self.assertRaises(ValueError):
+                makemaze.read_text(io.StringIO(text.replace(' {} '.format(signpost), ' O ')))
+
+    def test_no_layers(self):
+        with self.assertRaises(ValueError):
+            makemaze.read_text(io.StringIO("{'counts': {}}\n\n"))
+
+    def test_broken_gzip(self):
+        file = io.StringIO()
+        makemaze.write_maze(makemaze.generate(1), file)
+        data = gzip.compress(file.getvalue().encode())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'maze.txt.gz')
+            with open(path, 'wb') as file:
+                file.write(data[:len(data) // 2])
+            with self.assertRaises(ValueError):
+                makemaze.read_maze(path)
+
+    def test_no_such_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'maze.bin')
+            for argv in [['--validate', path], ['--repair', path]]:
+                with self.assertRaises(SystemExit) as caught:
+                    makemaze.main(argv)
+                self.assertIn(path, caught.exception.code)
+
+class BinaryFormatTest(unittest.TestCase):
+    def test_round_trip(self):
+        result = makemaze.generate(1, [3, 4, 5], 'kruskal')
+        self.assertEqual(write_binary_and_read(result), result)
+
+    def test_no_seed_or_algorithm(self):
+        result = read_example()
+        self.assertIsNone(result.seed)
+        self.assertIsNone(result.algorithm)
+        self.assertEqual(write_binary_and_read(result), result)
+
+    def test_truncated(self):
+        result = makemaze.generate(1)
+        file = io.BytesIO()
+        makemaze.write_binary(result, file, voxels=True)
+        data = file.getvalue()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'maze.bin')
+            for size in [80, len(data) - 1]:
+                with open(path, 'wb') as file:
+                    file.write(data[:size])
+                with self.assertRaises(ValueError):
+                    makemaze.read_maze(path)
+                with self.assertRaises(ValueError):
+                    makemaze.MazeFile(path)
+
+    def test_exception_not_hidden(self):
+        # A layer view still held while an exception unwinds.
+        result = makemaze.generate(1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'maze.bin')
+            with open(path, 'wb') as file:
+                makemaze.write_binary(result, file, voxels=True)
+            with self.assertRaises(KeyError):
+                with makemaze.MazeFile(path) as maze_file:
+                    layer = maze_file.get_layer(3)
+                    raise KeyError(layer[0, 0])
+
+    def test_long_algorithm_name(self):
+        result = makemaze.generate(1)._replace(algorithm='x' * 17)
+        with self.assertRaises(ValueError):
+            makemaze.write_binary(result, io.BytesIO())
+
+if __name__ == '__main__':
+    unittest.main()